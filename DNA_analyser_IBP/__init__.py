@@ -1,4 +1,5 @@
 from DNA_analyser_IBP.api import Api
+from DNA_analyser_IBP.async_api import AsyncApi
 
-__all__ = ["Api"]
+__all__ = ["Api", "AsyncApi"]
 __version__ = "v3.0.0"
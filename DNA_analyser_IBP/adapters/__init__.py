@@ -1,6 +1,6 @@
 # __init__.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from DNA_analyser_IBP.adapters.batch_adapter import BatchAdapter
 from DNA_analyser_IBP.adapters.g4hunter_adapter import G4HunterAdapter
@@ -11,11 +11,12 @@ from DNA_analyser_IBP.adapters.sequence_adapter import SequenceAdapter
 from DNA_analyser_IBP.adapters.zdna_adapter import ZDnaAdapter
 from DNA_analyser_IBP.adapters.cpg_adapter import CpGAdapter
 from DNA_analyser_IBP.adapters.user_adapter import UserAdapter
+from DNA_analyser_IBP.adapters.transport import Transport
 
 if TYPE_CHECKING:
     from DNA_analyser_IBP.models import User
 
-__all__ = ["Adapters", "UserAdapter"]
+__all__ = ["Adapters", "UserAdapter", "Transport"]
 
 
 class Adapters:
@@ -23,15 +24,17 @@ class Adapters:
     Adapter class
     """
 
-    def __init__(self, user: "User"):
+    def __init__(self, user: "User", transport: Optional[Transport] = None):
         """
-        Create all adapters
+        Create all adapters sharing one pooled transport
         """
-        self.p53: P53Adapter = P53Adapter(user=user)
-        self.batch: BatchAdapter = BatchAdapter(user=user)
-        self.g4killer: G4KillerAdapter = G4KillerAdapter(user=user)
-        self.sequence: SequenceAdapter = SequenceAdapter(user=user)
-        self.g4hunter: G4HunterAdapter = G4HunterAdapter(user=user)
-        self.rloopr: RLooprAdapter = RLooprAdapter(user=user)
-        self.zdna: ZDnaAdapter = ZDnaAdapter(user=user)
-        self.cpg: CpGAdapter = CpGAdapter(user=user)
+        if transport is None:
+            transport = Transport(jwt=user.jwt)
+        self.p53: P53Adapter = P53Adapter(user=user, transport=transport)
+        self.batch: BatchAdapter = BatchAdapter(user=user, transport=transport)
+        self.g4killer: G4KillerAdapter = G4KillerAdapter(user=user, transport=transport)
+        self.sequence: SequenceAdapter = SequenceAdapter(user=user, transport=transport)
+        self.g4hunter: G4HunterAdapter = G4HunterAdapter(user=user, transport=transport)
+        self.rloopr: RLooprAdapter = RLooprAdapter(user=user, transport=transport)
+        self.zdna: ZDnaAdapter = ZDnaAdapter(user=user, transport=transport)
+        self.cpg: CpGAdapter = CpGAdapter(user=user, transport=transport)
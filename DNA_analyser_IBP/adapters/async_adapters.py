@@ -0,0 +1,651 @@
+# async_adapters.py
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, List, Optional, Type
+
+import pandas as pd
+import tenacity
+
+from DNA_analyser_IBP.adapters.endpoints import (
+    CPG_ENDPOINT,
+    G4HUNTER_ENDPOINT,
+    JSON_HEADER,
+    RLOOPR_ENDPOINT,
+    ZDNA_ENDPOINT,
+    AnalyseEndpoint,
+    authorize_user,
+    batch_request,
+    cpg_body,
+    g4hunter_body,
+    ncbi_request,
+    rloopr_body,
+    sequence_data_request,
+    sequence_delete_request,
+    sequence_fields,
+    sequence_import_url,
+    sequence_request,
+    sequences_request,
+    sign_in_request,
+    zdna_body,
+)
+from DNA_analyser_IBP.adapters.validations import (
+    validate_key_response,
+    validate_text_response,
+)
+from DNA_analyser_IBP.batch_monitor import BatchJob
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import (
+    Analyse,
+    Batch,
+    CpG,
+    G4Hunter,
+    RLoopr,
+    Sequence,
+    User,
+    ZDna,
+)
+from DNA_analyser_IBP.result_schemas import decode_result
+from DNA_analyser_IBP.utils import Logger
+
+if TYPE_CHECKING:
+    from DNA_analyser_IBP.adapters.async_transport import AsyncTransport
+
+
+class AsyncBaseAdapter:
+    def __init__(self, user: User, transport: "AsyncTransport") -> None:
+        self.user = user
+        self.transport = transport
+
+
+class AsyncUserAdapter:
+    """
+    Async user connector providing JWT for current user
+    """
+
+    @staticmethod
+    async def sign_in(user: User, transport: "AsyncTransport") -> User:
+        """
+        Sign in to API and authorize transport
+
+        Args:
+            user (User): user with login information
+            transport (AsyncTransport): shared transport authorized by new JWT
+
+        Returns:
+            User: logged in user
+        """
+        response = await sign_in_request(user=user).send_async(transport)
+
+        return authorize_user(user=user, response=response, transport=transport)
+
+
+class AsyncBatchAdapter(AsyncBaseAdapter):
+    """
+    Async batch connector used to check progress
+    """
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def get_batch_status(self, *, id: str, type: str) -> Batch:
+        """
+        Send GET to batch endpoint of given type
+
+        Args:
+            id (str): id
+            type (str): batch type
+
+        Returns:
+            Batch: batch with current status
+        """
+        response = await batch_request(
+            server=self.user.server, id=id, type=type
+        ).send_async(self.transport)
+        response_data: dict = validate_key_response(response=response, status_code=200)
+
+        return Batch(**response_data)
+
+    async def wait(
+        self,
+        *,
+        id: str,
+        type: str,
+        min_interval: float = Config.MONITOR_CONFIG.MIN_INTERVAL,
+        max_interval: float = Config.MONITOR_CONFIG.MAX_INTERVAL,
+        backoff: float = Config.MONITOR_CONFIG.BACKOFF,
+    ) -> Batch:
+        """
+        Await batch until it finishes or fails, polling with adaptive backoff
+
+        Args:
+            id (str): id
+            type (str): batch type
+            min_interval (float): shortest polling interval [seconds]
+            max_interval (float): longest polling interval [seconds]
+            backoff (float): polling interval multiplier for batches without progress
+
+        Returns:
+            Batch: batch with final status
+        """
+        job: BatchJob = BatchJob(id=id, type=type, name=id, min_interval=min_interval)
+
+        while True:
+            batch: Batch = await self.get_batch_status(id=id, type=type)
+            job.update(
+                batch=batch,
+                now=time.monotonic(),
+                min_interval=min_interval,
+                max_interval=max_interval,
+                backoff=backoff,
+            )
+            if job.is_done():
+                return batch
+            await asyncio.sleep(job.interval)
+
+
+class AsyncSequenceAdapter(AsyncBaseAdapter):
+    """
+    Async sequence connector used for sequence manipulation
+    """
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_text_sequence(
+        self,
+        *,
+        circular: bool,
+        data: str,
+        name: str,
+        tags: List[Optional[str]],
+        nucleic_type: str,
+    ) -> Sequence:
+        """
+        Send POST to /sequence/import/text
+
+        Args:
+            circular (bool): True if sequence is circular False if not
+            data (str): string data with sequence
+            name (str): sequence name
+            tags (List[Optional[str]]): tags for sequence filtering
+            nucleic_type (str): string DNA|RNA
+
+        Returns:
+            Sequence: Sequence object
+        """
+        fields: dict = sequence_fields(
+            circular=circular,
+            tags=tags,
+            nucleic_type=nucleic_type,
+            format="PLAIN",
+            name=name,
+        )
+        response = await self.transport.post(
+            sequence_import_url(server=self.user.server, source="text"),
+            headers=JSON_HEADER,
+            content=json.dumps({**fields, "data": data}),
+        )
+        payload: dict = validate_key_response(
+            response=response, status_code=201, payload_key="payload"
+        )
+
+        return Sequence(**payload)
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_ncbi_sequence(
+        self,
+        *,
+        circular: bool,
+        name: str,
+        tags: List[Optional[str]],
+        ncbi_id: str,
+    ) -> Sequence:
+        """
+        Send POST to /sequence/import/ncbi
+
+        Args:
+            circular (bool): True if sequence is circular False if not
+            name (str): sequence name
+            tags (List[Optional[str]]): tags for sequence filtering
+            ncbi_id (str): sequence id from (https://www.ncbi.nlm.nih.gov/)
+
+        Returns:
+            Sequence: Sequence object
+        """
+        response = await ncbi_request(
+            server=self.user.server,
+            circular=circular,
+            tags=tags,
+            records=[(name, ncbi_id, tags)],
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=201, payload_key="items"
+        )
+
+        return Sequence(**data[0])
+
+    async def _load_data_window(self, *, id: str, length: int, position: int) -> str:
+        response = await sequence_data_request(
+            server=self.user.server, id=id, length=length, position=position
+        ).send_async(self.transport)
+        return validate_text_response(response=response, status_code=200)
+
+    async def load_data(
+        self, *, id: str, length: int, position: int, sequence_length: int
+    ) -> Optional[str]:
+        """
+        Send GET to /sequence/{id}/data, intervals longer than 1000 bp are fetched
+        in concurrent windows
+
+        Args:
+            id (str): sequence id
+            length (int): data string length
+            position (int): data start position
+            sequence_length (int): sequence length for check
+
+        Returns:
+            Optional[str]: String with part of sequence data
+        """
+        if position >= 0 and 0 < length and position + length <= sequence_length:
+            window_size: int = Config.DATA_CONFIG.WINDOW_SIZE
+            end: int = position + length
+            windows: List[str] = await asyncio.gather(
+                *[
+                    self._load_data_window(
+                        id=id, length=min(window_size, end - start), position=start
+                    )
+                    for start in range(position, end, window_size)
+                ]
+            )
+            return "".join(windows)
+        else:
+            Logger.error("Values out of range!")
+
+    async def load_all(self, *, tags: List[Optional[str]]) -> List[Sequence]:
+        """
+        Send GET /sequence
+
+        Args:
+            tags (List[Optional[str]]): tags for filtering all sequences
+
+        Returns:
+            List[Sequence]: Sequence objects
+        """
+        response = await sequences_request(
+            server=self.user.server, tags=tags
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key="items"
+        )
+
+        return [Sequence(**record) for record in data]
+
+    async def load_by_id(self, *, id: str) -> Sequence:
+        """
+        Send GET /sequence/id
+
+        Args:
+            id (str): sequence id
+
+        Returns:
+            Sequence: Sequence object
+        """
+        response = await sequence_request(server=self.user.server, id=id).send_async(
+            self.transport
+        )
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key="payload"
+        )
+
+        return Sequence(**data)
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def delete(self, *, id: str) -> bool:
+        """
+        Send DELETE to /sequence/id
+
+        Args:
+            id (str): sequence id
+
+        Returns:
+            bool: True if delete is successful False if not
+        """
+        response = await sequence_delete_request(
+            server=self.user.server, id=id
+        ).send_async(self.transport)
+
+        return response.status_code == 204
+
+
+class AsyncAnalyseAdapter(AsyncBaseAdapter):
+    """
+    Async analyse connector sending requests of its analyse endpoint
+    """
+
+    MODEL: Type[Analyse]
+    ENDPOINT: AnalyseEndpoint
+
+    async def _create(self, *, body: Optional[dict]) -> Optional[Analyse]:
+        """
+        Send POST with analyse parameters
+
+        Args:
+            body (Optional[dict]): analyse parameters, None if parameters are out of range
+
+        Returns:
+            Optional[Analyse]: created analyse model
+        """
+        if body is None:
+            return None
+
+        response = await self.ENDPOINT.create(
+            server=self.user.server, body=body
+        ).send_async(self.transport)
+        payload: dict = validate_key_response(
+            response=response,
+            status_code=self.ENDPOINT.create_status_code,
+            payload_key="payload",
+        )
+
+        return self.MODEL(**payload)
+
+    async def load_all(self, *, tags: List[Optional[str]]) -> List[Analyse]:
+        """
+        Send GET to analyse endpoint
+
+        Args:
+            tags (List[Optional[str]]): filter tag for loading
+
+        Returns:
+            List[Analyse]: analyse models
+        """
+        response = await self.ENDPOINT.load_all(
+            server=self.user.server, tags=tags
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key="items"
+        )
+
+        return [self.MODEL(**record) for record in data]
+
+    async def load_by_id(self, *, id: str) -> Analyse:
+        """
+        Send GET to analyse endpoint for given id
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            Analyse: analyse model
+        """
+        response = await self.ENDPOINT.load_by_id(
+            server=self.user.server, id=id
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key="payload"
+        )
+
+        return self.MODEL(**data)
+
+    async def load_result(self, *, id: str) -> pd.DataFrame:
+        """
+        Send GET to analyse result endpoint
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            pd.DataFrame: DataFrame with analyse results
+        """
+        response = await self.ENDPOINT.load_result(
+            server=self.user.server, id=id
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key=self.ENDPOINT.result_key
+        )
+
+        return decode_result(response=data, schema=self.ENDPOINT.result_schema)
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def export_csv(self, *, id: str) -> str:
+        """
+        Send GET to analyse csv endpoint
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            str: csv file in string
+        """
+        response = await self.ENDPOINT.export_csv(
+            server=self.user.server, id=id
+        ).send_async(self.transport)
+
+        return validate_text_response(response=response, status_code=200)
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def delete(self, *, id: str) -> bool:
+        """
+        Send DELETE to analyse endpoint
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            bool: True if delete is successful False if not
+        """
+        response = await self.ENDPOINT.delete(
+            server=self.user.server, id=id
+        ).send_async(self.transport)
+
+        return response.status_code == 204
+
+
+class AsyncHeatmapMixin:
+    """
+    Heatmap of analyse endpoints aggregating results into sequence segments
+    """
+
+    async def load_heatmap(self, *, id: str, segments: int) -> pd.DataFrame:
+        """
+        Send GET to analyse heatmap endpoint
+
+        Args:
+            id (str): analyse id
+            segments (int): number of heatmap segments
+
+        Returns:
+            pd.DataFrame: dataFrame with heatmap data
+        """
+        response = await self.ENDPOINT.load_heatmap(
+            server=self.user.server, id=id, segments=segments
+        ).send_async(self.transport)
+        data: dict = validate_key_response(
+            response=response, status_code=200, payload_key="data"
+        )
+
+        return self.ENDPOINT.decode_heatmap(data)
+
+
+class AsyncG4HunterAdapter(AsyncHeatmapMixin, AsyncAnalyseAdapter):
+    """
+    Async G4Hunter connector
+    """
+
+    MODEL = G4Hunter
+    ENDPOINT = G4HUNTER_ENDPOINT
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_analyse(
+        self,
+        *,
+        id: str,
+        tags: Optional[List[str]],
+        threshold: float,
+        window_size: int,
+    ) -> Optional[G4Hunter]:
+        """
+        Send POST to /analyse/g4hunter
+
+        Args:
+            id (str): sequence id
+            tags (Optional[List[str]]): analyse tags
+            threshold (float): threshold for g4hunter algorithm recommended 1.2
+            window_size (int): window size for g4hunter algorithm recommended 25
+
+        Returns:
+            Optional[G4Hunter]: G4Hunter model
+        """
+        return await self._create(
+            body=g4hunter_body(
+                id=id, tags=tags, threshold=threshold, window_size=window_size
+            )
+        )
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def export_csv(self, *, id: str, aggregate: bool = True) -> str:
+        """
+        Send GET to /analyse/g4hunter/{id}/quadruplex.csv
+
+        Args:
+            id (str): g4hunter analyse id
+            aggregate (bool): True if aggregate results else False
+
+        Returns:
+            str: csv file in string
+        """
+        response = await self.ENDPOINT.export_csv(
+            server=self.user.server,
+            id=id,
+            params={"aggregate": "true" if aggregate else "false"},
+        ).send_async(self.transport)
+
+        return validate_text_response(response=response, status_code=200)
+
+
+class AsyncZDnaAdapter(AsyncHeatmapMixin, AsyncAnalyseAdapter):
+    """
+    Async Z-DNA hunter connector
+    """
+
+    MODEL = ZDna
+    ENDPOINT = ZDNA_ENDPOINT
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_analyse(
+        self,
+        *,
+        id: str,
+        tags: Optional[List[str]],
+        min_sequence_size: int,
+        model: Optional[List[str]],
+        GC_score: float,
+        GTAC_score: float,
+        AT_score: float,
+        oth_score: float,
+        min_score_percentage: float,
+    ) -> Optional[ZDna]:
+        """
+        Send POST to /analyse/zdna
+
+        Args:
+            id (str): sequence id
+            tags (Optional[List[str]]): analyse tags
+            min_sequence_size (int): minimal length of sequences searched, minimum 6
+            model (Optional[List[str]]): choice of models influencing the score parameters
+            GC_score (float): score for the GC pair, minimum 0.1
+            GTAC_score (float): score for the GT or AC pair, minimum 0
+            AT_score (float): score for the AT pair, minimum 0
+            oth_score (float): score for other pairs
+            min_score_percentage (float): minimum score of Z-DNA window in percents, minimum 12
+
+        Returns:
+            Optional[ZDna]: ZDna model
+        """
+        return await self._create(
+            body=zdna_body(
+                id=id,
+                tags=tags,
+                min_sequence_size=min_sequence_size,
+                model=model,
+                GC_score=GC_score,
+                GTAC_score=GTAC_score,
+                AT_score=AT_score,
+                oth_score=oth_score,
+                min_score_percentage=min_score_percentage,
+            )
+        )
+
+
+class AsyncCpGAdapter(AsyncAnalyseAdapter):
+    """
+    Async CpG hunter connector
+    """
+
+    MODEL = CpG
+    ENDPOINT = CPG_ENDPOINT
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_analyse(
+        self,
+        *,
+        id: str,
+        tags: Optional[List[str]],
+        min_window_size: int,
+        min_gc_percentage: float,
+        min_obs_exp_cpg: float,
+        min_island_merge_gap: int,
+        second_nucleotide: str,
+    ) -> Optional[CpG]:
+        """
+        Send POST to /analyse/cpg
+
+        Args:
+            id (str): sequence id
+            tags (Optional[List[str]]): analyse tags
+            min_window_size (int): smallest window size, min: 10, max: 10 000
+            min_gc_percentage (float): minimum content fraction of C and second nucleotide
+            min_obs_exp_cpg (float): minimum fraction of observed to expected CpG
+            min_island_merge_gap (int): smallest gap merging two islands, min: 10, max: 10 000
+            second_nucleotide (str): "G", "A", "T", or "C"
+
+        Returns:
+            Optional[CpG]: CpG model
+        """
+        return await self._create(
+            body=cpg_body(
+                id=id,
+                tags=tags,
+                min_window_size=min_window_size,
+                min_gc_percentage=min_gc_percentage,
+                min_obs_exp_cpg=min_obs_exp_cpg,
+                min_island_merge_gap=min_island_merge_gap,
+                second_nucleotide=second_nucleotide,
+            )
+        )
+
+
+class AsyncRLooprAdapter(AsyncAnalyseAdapter):
+    """
+    Async R-loop tracker connector
+    """
+
+    MODEL = RLoopr
+    ENDPOINT = RLOOPR_ENDPOINT
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    async def create_analyse(
+        self, *, id: str, tags: Optional[List[str]], riz_model: Optional[List[int]]
+    ) -> RLoopr:
+        """
+        Send POST to /analyse/rloopr
+
+        Args:
+            id (str): sequence id
+            tags (Optional[List[str]]): analyse tags
+            riz_model (Optional[List[int]]): RIZ cluster models
+
+        Returns:
+            RLoopr: RLoopr model
+        """
+        return await self._create(
+            body=rloopr_body(id=id, tags=tags, riz_model=riz_model)
+        )
@@ -0,0 +1,91 @@
+# async_transport.py
+
+from typing import TYPE_CHECKING, Optional
+
+from DNA_analyser_IBP.config import Config
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncTransport:
+    """
+    Asyncio HTTP transport shared by all async adapters (requires httpx)
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        jwt: Optional[str] = None,
+    ) -> None:
+        """
+        Create pooled async HTTP client
+
+        Args:
+            pool_size (int): max number of concurrent connections to server
+            jwt (Optional[str]): JSON web token used as default Authorization header
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "AsyncApi requires httpx: pip install dna-analyser-ibp[async]"
+            )
+
+        self.pool_size: int = pool_size
+        self.client: "httpx.AsyncClient" = httpx.AsyncClient(
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+            timeout=httpx.Timeout(Config.TRANSPORT_CONFIG.TIMEOUT),
+        )
+        self.authorize(jwt=jwt)
+
+    def __repr__(self):
+        return f"<AsyncTransport pool_size: {self.pool_size}>"
+
+    def authorize(self, *, jwt: Optional[str]) -> None:
+        """
+        Set JWT as default Authorization header
+
+        Args:
+            jwt (Optional[str]): JSON web token, None removes header
+        """
+        if jwt is not None:
+            self.client.headers["Authorization"] = jwt
+        else:
+            self.client.headers.pop("Authorization", None)
+
+    async def request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """
+        Send request through pooled client
+
+        Args:
+            method (str): HTTP method
+            url (str): endpoint url
+            **kwargs: httpx keyword arguments e.g. headers, params, content
+
+        Returns:
+            httpx.Response: HTTP response
+        """
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> "httpx.Response":
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> "httpx.Response":
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> "httpx.Response":
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> "httpx.Response":
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close all pooled connections
+        """
+        await self.client.aclose()
@@ -1,13 +1,92 @@
 # base_connector.py
 
 import abc
+from typing import Dict, Generator, List, Optional
 
+import pandas as pd
+import tenacity
+from requests import Response
+
+from DNA_analyser_IBP.adapters.transport import Transport
+from DNA_analyser_IBP.adapters.validations import (
+    ApiEmptyResponse,
+    validate_key_response,
+)
+from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models.user import User
+from DNA_analyser_IBP.result_schemas import decode_result
 
 
 class BaseAdapter:
-    def __init__(self, user: User) -> None:
+    def __init__(self, user: User, transport: Optional[Transport] = None) -> None:
         self.user = user
+        self.transport = transport if transport is not None else Transport(jwt=user.jwt)
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    def _load_result_page(
+        self, *, url: str, payload_key: str, page: int, chunk_size: int
+    ) -> List[dict]:
+        """
+        Send GET for one page of analyse results
+
+        Args:
+            url (str): analyse result url
+            payload_key (str): key of result records in response
+            page (int): page number
+            chunk_size (int): number of records per page
+
+        Returns:
+            List[dict]: result records, empty list if page is empty
+        """
+        params: dict = {
+            "order": "ASC",
+            "requestForAll": "true",
+            "pageSize": chunk_size,
+            "page": page,
+        }
+        response: Response = self.transport.get(url, params=params)
+
+        try:
+            return validate_key_response(
+                response=response, status_code=200, payload_key=payload_key
+            )
+        except ApiEmptyResponse:
+            return list()
+
+    def _load_result_chunks(
+        self,
+        *,
+        url: str,
+        payload_key: str,
+        chunk_size: int,
+        schema: Optional[Dict[str, str]] = None,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Yield analyse results page by page so only one chunk is held in memory
+
+        Args:
+            url (str): analyse result url
+            payload_key (str): key of result records in response
+            chunk_size (int): number of records per chunk
+            schema (Optional[Dict[str, str]]): column types of result
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with results
+        """
+        page: int = Config.RESULT_CONFIG.FIRST_PAGE
+
+        while True:
+            data: List[dict] = self._load_result_page(
+                url=url, payload_key=payload_key, page=page, chunk_size=chunk_size
+            )
+            if not data:
+                return
+
+            yield decode_result(response=data, schema=schema)
+
+            if len(data) < chunk_size:
+                return
+            page += 1
 
 
 class BaseAnalyseAdapter(metaclass=abc.ABCMeta):
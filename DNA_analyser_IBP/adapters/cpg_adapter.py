@@ -1,19 +1,19 @@
-import json
 from typing import Generator, List, Optional
 
 import pandas as pd
-import requests
 import tenacity
 from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
+from DNA_analyser_IBP.adapters.endpoints import CPG_ENDPOINT, cpg_body
 from DNA_analyser_IBP.adapters.validations import (
     validate_key_response,
     validate_text_response,
 )
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models import CpG
-from DNA_analyser_IBP.utils import Logger, generate_dataframe, join_url, login_required
+from DNA_analyser_IBP.result_schemas import decode_result
+from DNA_analyser_IBP.utils import login_required
 
 
 class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
@@ -48,45 +48,26 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             G4HunterModel: G4Hunter model
         """
-
-        conditions: List[bool] = [
-            10 <= min_window_size <= 1E4,
-            0 <= min_gc_percentage <= 1,
-            0 <= min_obs_exp_cpg <= 1,
-            10 <= min_island_merge_gap <= 1E4,
-            second_nucleotide in ["G", "A", "T", "C"],
-        ]
-
-        if all(conditions):
-            header: dict = {
-                "Accept": "application/json",
-                "Authorization": self.user.jwt,
-                "Content-type": "application/json",
-            }
-            data: str = json.dumps(
-                {
-                    "sequence": id,
-                    "tags": tags or list(),
-                    "minWindowSize": min_window_size,
-                    "minGcPercentage": min_gc_percentage,
-                    "minObservedToExpectedCpG": min_obs_exp_cpg,
-                    "minIslandMergeGap": min_island_merge_gap,
-                    "firstNucleotide": "C",
-                    "secondNucleotide": second_nucleotide,
-                }
-            )
-            response: Response = requests.post(
-                join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG),
-                headers=header,
-                data=data,
-            )
+        body: Optional[dict] = cpg_body(
+            id=id,
+            tags=tags,
+            min_window_size=min_window_size,
+            min_gc_percentage=min_gc_percentage,
+            min_obs_exp_cpg=min_obs_exp_cpg,
+            min_island_merge_gap=min_island_merge_gap,
+            second_nucleotide=second_nucleotide,
+        )
+        if body is not None:
+            response: Response = CPG_ENDPOINT.create(
+                server=self.user.server, body=body
+            ).send(self.transport)
             data: dict = validate_key_response(
-                response=response, status_code=200, payload_key="payload"
+                response=response,
+                status_code=CPG_ENDPOINT.create_status_code,
+                payload_key="payload",
             )
 
             return CpG(**data)
-        else:
-            Logger.error("Parameters out of permitted range!")
 
     def load_all(self, tags: List[Optional[str]]) -> Generator[CpG, None, None]:
         """
@@ -98,23 +79,9 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             Generator[CpG, None, None], Exception: CpG object generator
         """
-
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {
-            "order": "ASC",
-            "pageSize": "ALL",
-            "tags": tags or list(),
-            "requestForAll": "true",
-        }
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG),
-            headers=header,
-            params=params,
-        )
+        response: Response = CPG_ENDPOINT.load_all(
+            server=self.user.server, tags=tags
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="items"
         )
@@ -133,16 +100,9 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             RLoopr: CpG object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG, id, "analysis"),
-            headers=header,
-        )
+        response: Response = CPG_ENDPOINT.load_by_id(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="payload"
         )
@@ -160,16 +120,9 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             bool: True if delete is successful False if not
         """
-        header: dict = {
-            "Accept": "*/*",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-
-        response: Response = requests.delete(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG, id),
-            headers=header,
-        )
+        response: Response = CPG_ENDPOINT.delete(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         if response.status_code == 204:
             return True
@@ -187,12 +140,9 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             str: csv file in string
         """
-        header: dict = {"Accept": "text/plain", "Authorization": self.user.jwt}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG, id, "cpg.csv"),
-            headers=header,
-        )
+        response: Response = CPG_ENDPOINT.export_csv(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         return validate_text_response(response=response, status_code=200)
     
@@ -207,20 +157,34 @@ class CpGAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: DataFrame with CpG results
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"order": "ASC", "requestForAll": "true", "pageSize": "ALL"}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.CPG, id, "cpg"),
-            headers=header,
-            params=params,
-        )
+        response: Response = CPG_ENDPOINT.load_result(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
-            response=response, status_code=200, payload_key="items"
+            response=response,
+            status_code=200,
+            payload_key=CPG_ENDPOINT.result_key,
         )
 
-        return generate_dataframe(response=data)
+        return decode_result(response=data, schema=CPG_ENDPOINT.result_schema)
+
+    @login_required
+    def load_result_chunks(
+        self, id: str, chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Send paged GETs to /analyse/cpg/{id}/cpg
+
+        Args:
+            id (str): cpg analyse id
+            chunk_size (int): number of results per chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with CpG results
+        """
+        return self._load_result_chunks(
+            url=CPG_ENDPOINT.result_url(server=self.user.server, id=id),
+            payload_key=CPG_ENDPOINT.result_key,
+            chunk_size=chunk_size,
+            schema=CPG_ENDPOINT.result_schema,
+        )
@@ -0,0 +1,552 @@
+# endpoints.py
+
+import json
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import jwt
+import pandas as pd
+
+from DNA_analyser_IBP.adapters.validations import validate_text_response
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import User
+from DNA_analyser_IBP.result_schemas import ResultSchema
+from DNA_analyser_IBP.type import Types
+from DNA_analyser_IBP.utils import Logger, join_url
+
+if TYPE_CHECKING:
+    from DNA_analyser_IBP.adapters.async_transport import AsyncTransport
+    from DNA_analyser_IBP.adapters.transport import Transport
+
+JSON_HEADER: Dict[str, str] = {"Content-type": "application/json"}
+TEXT_HEADER: Dict[str, str] = {"Accept": "text/plain"}
+DELETE_HEADER: Dict[str, str] = {"Accept": "*/*", "Content-type": "application/json"}
+# all records of endpoint in one response
+ALL_PARAMS: Dict[str, str] = {"order": "ASC", "requestForAll": "true", "pageSize": "ALL"}
+
+BATCH_ENDPOINTS: Dict[str, str] = {
+    Types.SEQUENCE: Config.BATCH_CONFIG.SEQUENCE,
+    Types.G4HUNTER: Config.BATCH_CONFIG.G4HUNTER,
+    Types.RLOOPR: Config.BATCH_CONFIG.RLOOPR,
+    Types.ZDNA: Config.BATCH_CONFIG.ZDNA,
+    Types.CPG: Config.BATCH_CONFIG.CPG,
+}
+
+
+class ApiRequest:
+    """
+    HTTP request of one endpoint call, built once and sent by sync or async transport
+    """
+
+    __slots__ = ("method", "url", "headers", "params", "body")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[dict] = None,
+        body: Optional[str] = None,
+    ):
+        self.method: str = method
+        self.url: str = url
+        self.headers: Optional[Dict[str, str]] = headers
+        self.params: Optional[dict] = params
+        self.body: Optional[str] = body
+
+    def __repr__(self):
+        return f"<ApiRequest {self.method} {self.url}>"
+
+    def _kwargs(self, body_key: str) -> dict:
+        kwargs: dict = {"headers": self.headers, "params": self.params, body_key: self.body}
+        return {key: value for key, value in kwargs.items() if value is not None}
+
+    def send(self, transport: "Transport"):
+        """
+        Send request by sync transport
+
+        Args:
+            transport (Transport): pooled requests transport
+
+        Returns:
+            Response: HTTP response
+        """
+        return getattr(transport, self.method.lower())(self.url, **self._kwargs("data"))
+
+    async def send_async(self, transport: "AsyncTransport"):
+        """
+        Send request by async transport
+
+        Args:
+            transport (AsyncTransport): pooled httpx transport
+
+        Returns:
+            httpx.Response: HTTP response
+        """
+        return await getattr(transport, self.method.lower())(
+            self.url, **self._kwargs("content")
+        )
+
+
+class AnalyseEndpoint:
+    """
+    Requests of one analyse endpoint shared by sync and async adapters
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoint: str,
+        by_id_path: Optional[str],
+        result_path: str,
+        result_key: str,
+        result_schema: Optional[Dict[str, str]],
+        csv_path: str,
+        create_status_code: int,
+        heatmap_label: Optional[str] = None,
+    ):
+        """
+        Args:
+            endpoint (str): analyse endpoint e.g. analyse/g4hunter
+            by_id_path (Optional[str]): path appended to analyse id when loading analyse
+            result_path (str): path of analyse results
+            result_key (str): key of result records in response
+            result_schema (Optional[Dict[str, str]]): column types of results
+            csv_path (str): path of csv export
+            create_status_code (int): HTTP status code of created analyse
+            heatmap_label (Optional[str]): prefix of heatmap columns, None if endpoint has no heatmap
+        """
+        self.endpoint: str = endpoint
+        self.by_id_path: Optional[str] = by_id_path
+        self.result_path: str = result_path
+        self.result_key: str = result_key
+        self.result_schema: Optional[Dict[str, str]] = result_schema
+        self.csv_path: str = csv_path
+        self.create_status_code: int = create_status_code
+        self.heatmap_label: Optional[str] = heatmap_label
+
+    def __repr__(self):
+        return f"<AnalyseEndpoint {self.endpoint}>"
+
+    def create(self, *, server: str, body: dict) -> ApiRequest:
+        return ApiRequest(
+            "POST",
+            join_url(server, self.endpoint),
+            headers=JSON_HEADER,
+            body=json.dumps(body),
+        )
+
+    def load_all(self, *, server: str, tags: List[Optional[str]]) -> ApiRequest:
+        return ApiRequest(
+            "GET",
+            join_url(server, self.endpoint),
+            headers=JSON_HEADER,
+            params={**ALL_PARAMS, "tags": tags or list()},
+        )
+
+    def load_by_id(self, *, server: str, id: str) -> ApiRequest:
+        paths: List[str] = [id, self.by_id_path] if self.by_id_path else [id]
+        return ApiRequest("GET", join_url(server, self.endpoint, *paths), headers=JSON_HEADER)
+
+    def result_url(self, *, server: str, id: str) -> str:
+        return join_url(server, self.endpoint, id, self.result_path)
+
+    def load_result(self, *, server: str, id: str) -> ApiRequest:
+        return ApiRequest(
+            "GET",
+            self.result_url(server=server, id=id),
+            headers=JSON_HEADER,
+            params=ALL_PARAMS,
+        )
+
+    def export_csv(
+        self, *, server: str, id: str, params: Optional[dict] = None
+    ) -> ApiRequest:
+        return ApiRequest(
+            "GET",
+            join_url(server, self.endpoint, id, self.csv_path),
+            headers=TEXT_HEADER,
+            params=params,
+        )
+
+    def load_heatmap(self, *, server: str, id: str, segments: int) -> ApiRequest:
+        return ApiRequest(
+            "GET",
+            join_url(server, self.endpoint, id, "heatmap"),
+            headers=JSON_HEADER,
+            params={"segments": segments},
+        )
+
+    def decode_heatmap(self, data: dict) -> pd.DataFrame:
+        """
+        Return heatmap DataFrame with count and coverage columns prefixed by heatmap label
+
+        Args:
+            data (dict): heatmap response data
+
+        Returns:
+            pd.DataFrame: dataFrame with heatmap data
+        """
+        heatmap: pd.DataFrame = pd.DataFrame(data=data)
+        heatmap.rename(
+            columns={
+                "count": f"{self.heatmap_label}_count",
+                "coverage": f"{self.heatmap_label}_coverage",
+            },
+            inplace=True,
+        )
+        return heatmap
+
+    def delete(self, *, server: str, id: str) -> ApiRequest:
+        return ApiRequest(
+            "DELETE", join_url(server, self.endpoint, id), headers=DELETE_HEADER
+        )
+
+
+G4HUNTER_ENDPOINT: AnalyseEndpoint = AnalyseEndpoint(
+    endpoint=Config.ENDPOINT_CONFIG.G4HUNTER,
+    by_id_path=None,
+    result_path="quadruplex",
+    result_key="items",
+    result_schema=ResultSchema.G4HUNTER,
+    csv_path="quadruplex.csv",
+    create_status_code=201,
+    heatmap_label="PQS",
+)
+ZDNA_ENDPOINT: AnalyseEndpoint = AnalyseEndpoint(
+    endpoint=Config.ENDPOINT_CONFIG.ZDNA,
+    by_id_path="analysis",
+    result_path="zdnas",
+    result_key="items",
+    result_schema=ResultSchema.ZDNA,
+    csv_path="zdna.csv",
+    create_status_code=200,
+    heatmap_label="Z-DNA",
+)
+CPG_ENDPOINT: AnalyseEndpoint = AnalyseEndpoint(
+    endpoint=Config.ENDPOINT_CONFIG.CPG,
+    by_id_path="analysis",
+    result_path="cpg",
+    result_key="items",
+    result_schema=ResultSchema.CPG,
+    csv_path="cpg.csv",
+    create_status_code=200,
+)
+RLOOPR_ENDPOINT: AnalyseEndpoint = AnalyseEndpoint(
+    endpoint=Config.ENDPOINT_CONFIG.RLOOPR,
+    by_id_path="analysis",
+    result_path="rloops",
+    result_key="payload",
+    result_schema=ResultSchema.RLOOPR,
+    csv_path="rloopr.csv",
+    create_status_code=200,
+)
+
+
+def g4hunter_body(
+    *, id: str, tags: Optional[List[str]], threshold: float, window_size: int
+) -> Optional[dict]:
+    """
+    Return body of new g4hunter analyse, None if parameters are out of range
+
+    Args:
+        id (str): sequence id
+        tags (Optional[List[str]]): analyse tags
+        threshold (float): threshold for g4hunter algorithm recommended 1.2
+        window_size (int): window size for g4hunter algorithm recommended 25
+
+    Returns:
+        Optional[dict]: analyse parameters
+    """
+    if 0 <= threshold <= 4 and 10 <= window_size <= 100:
+        return {
+            "sequence": id,
+            "tags": tags or list(),
+            "threshold": threshold,
+            "windowSize": window_size,
+        }
+    Logger.error("Value window size or threshold out of range!")
+    return None
+
+
+def zdna_body(
+    *,
+    id: str,
+    tags: Optional[List[str]],
+    min_sequence_size: int,
+    model: Optional[List[str]],
+    GC_score: float,
+    GTAC_score: float,
+    AT_score: float,
+    oth_score: float,
+    min_score_percentage: float,
+) -> Optional[dict]:
+    """
+    Return body of new z-dna analyse, None if parameters are out of range
+
+    Args:
+        id (str): sequence id
+        tags (Optional[List[str]]): analyse tags
+        min_sequence_size (int): minimal length of sequences searched, minimum 6
+        model (Optional[List[str]]): choice of models influencing the score parameters
+        GC_score (float): score for the GC pair, minimum 0.1
+        GTAC_score (float): score for the GT or AC pair, minimum 0
+        AT_score (float): score for the AT pair, minimum 0
+        oth_score (float): score for other pairs
+        min_score_percentage (float): minimum score of Z-DNA window in percents, minimum 12
+
+    Returns:
+        Optional[dict]: analyse parameters
+    """
+    conditions: Tuple[bool, ...] = (
+        min_sequence_size >= 6,
+        GC_score >= 0.1,
+        GTAC_score >= 0,
+        AT_score >= 0,
+        min_score_percentage >= 12,
+    )
+
+    if all(conditions):
+        return {
+            "sequence": id,
+            "tags": tags or list(),
+            "minSequenceSize": min_sequence_size,
+            "selectedModel": model or list(),
+            "score_gc": GC_score,
+            "score_gtac": GTAC_score,
+            "score_at": AT_score,
+            "score_oth": oth_score,
+            "threshold": min_score_percentage,
+        }
+    Logger.error("Parameters out of permitted range!")
+    return None
+
+
+def cpg_body(
+    *,
+    id: str,
+    tags: Optional[List[str]],
+    min_window_size: int,
+    min_gc_percentage: float,
+    min_obs_exp_cpg: float,
+    min_island_merge_gap: int,
+    second_nucleotide: str,
+) -> Optional[dict]:
+    """
+    Return body of new cpg analyse, None if parameters are out of range
+
+    Args:
+        id (str): sequence id
+        tags (Optional[List[str]]): analyse tags
+        min_window_size (int): smallest window size, min: 10, max: 10 000
+        min_gc_percentage (float): minimum content fraction of C and second nucleotide
+        min_obs_exp_cpg (float): minimum fraction of observed to expected CpG
+        min_island_merge_gap (int): smallest gap merging two islands, min: 10, max: 10 000
+        second_nucleotide (str): "G", "A", "T", or "C"
+
+    Returns:
+        Optional[dict]: analyse parameters
+    """
+    conditions: Tuple[bool, ...] = (
+        10 <= min_window_size <= 1e4,
+        0 <= min_gc_percentage <= 1,
+        0 <= min_obs_exp_cpg <= 1,
+        10 <= min_island_merge_gap <= 1e4,
+        second_nucleotide in ["G", "A", "T", "C"],
+    )
+
+    if all(conditions):
+        return {
+            "sequence": id,
+            "tags": tags or list(),
+            "minWindowSize": min_window_size,
+            "minGcPercentage": min_gc_percentage,
+            "minObservedToExpectedCpG": min_obs_exp_cpg,
+            "minIslandMergeGap": min_island_merge_gap,
+            "firstNucleotide": "C",
+            "secondNucleotide": second_nucleotide,
+        }
+    Logger.error("Parameters out of permitted range!")
+    return None
+
+
+def rloopr_body(
+    *, id: str, tags: Optional[List[str]], riz_model: Optional[List[int]]
+) -> dict:
+    """
+    Return body of new rloopr analyse
+
+    Args:
+        id (str): sequence id
+        tags (Optional[List[str]]): analyse tags
+        riz_model (Optional[List[int]]): RIZ cluster models
+
+    Returns:
+        dict: analyse parameters
+    """
+    return {"sequence": id, "tags": tags or list(), "rizModel": riz_model or list()}
+
+
+def sign_in_request(*, user: User) -> ApiRequest:
+    """
+    Return JWT request, host user is signed in without credentials
+
+    Args:
+        user (User): user with login information
+
+    Returns:
+        ApiRequest: PUT with credentials|POST for host
+    """
+    url: str = join_url(user.server, Config.ENDPOINT_CONFIG.JWT)
+    header: Dict[str, str] = {"Accept": "text/plain", **JSON_HEADER}
+
+    if user.email != "host":
+        return ApiRequest(
+            "PUT",
+            url,
+            headers=header,
+            body=json.dumps({"login": user.email, "password": user.password}),
+        )
+    return ApiRequest("POST", url, headers=header)
+
+
+def authorize_user(*, user: User, response, transport) -> User:
+    """
+    Log user in with JWT from sign in response and authorize transport
+
+    Args:
+        user (User): user with login information
+        response (Response): sign in response
+        transport (Union[Transport, AsyncTransport]): shared transport authorized by new JWT
+
+    Returns:
+        User: logged in user
+    """
+    jwt_token: str = validate_text_response(response=response, status_code=201)
+    data: dict = jwt.decode(jwt_token, options={"verify_signature": False})
+    user.is_logged_in = True
+    user.set_login(jwt=jwt_token, id=data.get("id"))
+    transport.authorize(jwt=jwt_token)
+    Logger.info(f"User {user.email} is successfully loged in ...")
+    return user
+
+
+def batch_request(*, server: str, id: str, type: str) -> ApiRequest:
+    """
+    Return request of batch status, unknown batch type has empty url
+
+    Args:
+        server (str): server url
+        id (str): batch id
+        type (str): batch type
+
+    Returns:
+        ApiRequest: GET of batch endpoint
+    """
+    endpoint: Optional[str] = BATCH_ENDPOINTS.get(type)
+    return ApiRequest("GET", join_url(server, endpoint, id) if endpoint else str())
+
+
+def sequence_fields(
+    *,
+    circular: bool,
+    tags: List[Optional[str]],
+    nucleic_type: str,
+    format: str,
+    name: Optional[str] = None,
+) -> dict:
+    """
+    Return JSON fields of sequence import
+
+    Args:
+        circular (bool): True if sequence is circular False if not
+        tags (List[Optional[str]]): tags for sequence filtering
+        nucleic_type (str): string DNA|RNA
+        format (str): string PLAIN|FASTA|MULTIFASTA
+        name (Optional[str]): sequence name, None for MultiFASTA
+
+    Returns:
+        dict: sequence fields
+    """
+    fields: dict = {"circular": circular, "format": format}
+    if name is not None:
+        fields["name"] = name
+    fields.update({"tags": tags, "type": nucleic_type})
+    return fields
+
+
+def sequence_import_url(*, server: str, source: str) -> str:
+    return join_url(server, Config.ENDPOINT_CONFIG.SEQUENCE, f"import/{source}")
+
+
+def ncbi_request(
+    *,
+    server: str,
+    circular: bool,
+    tags: List[Optional[str]],
+    records: List[Tuple[str, str, List[Optional[str]]]],
+) -> ApiRequest:
+    """
+    Return import of many NCBI records in one ncbis array
+
+    Args:
+        server (str): server url
+        circular (bool): True if sequence is circular False if not
+        tags (List[Optional[str]]): tags shared by all sequences
+        records (List[Tuple[str, str, List[Optional[str]]]]): sequence name, NCBI id and tags of every record
+
+    Returns:
+        ApiRequest: POST to /sequence/import/ncbi
+    """
+    ncbi: list = [
+        {
+            "circular": circular,
+            "name": name,
+            "ncbiId": ncbi_id,
+            "tags": record_tags,
+            "type": "DNA",
+        }
+        for name, ncbi_id, record_tags in records
+    ]
+    return ApiRequest(
+        "POST",
+        sequence_import_url(server=server, source="ncbi"),
+        headers=JSON_HEADER,
+        body=json.dumps(
+            {"circular": circular, "ncbis": ncbi, "tags": tags, "type": "DNA"}
+        ),
+    )
+
+
+def sequence_data_request(
+    *, server: str, id: str, length: int, position: int
+) -> ApiRequest:
+    return ApiRequest(
+        "GET",
+        join_url(server, Config.ENDPOINT_CONFIG.SEQUENCE, id, "data"),
+        headers={**JSON_HEADER, **TEXT_HEADER},
+        params={"len": length, "pos": position},
+    )
+
+
+def sequences_request(*, server: str, tags: List[Optional[str]]) -> ApiRequest:
+    return ApiRequest(
+        "GET",
+        join_url(server, Config.ENDPOINT_CONFIG.SEQUENCE),
+        headers=JSON_HEADER,
+        params={**ALL_PARAMS, "tags": tags},
+    )
+
+
+def sequence_request(*, server: str, id: str) -> ApiRequest:
+    return ApiRequest(
+        "GET", join_url(server, Config.ENDPOINT_CONFIG.SEQUENCE, id), headers=JSON_HEADER
+    )
+
+
+def sequence_delete_request(*, server: str, id: str) -> ApiRequest:
+    return ApiRequest(
+        "DELETE",
+        join_url(server, Config.ENDPOINT_CONFIG.SEQUENCE, id),
+        headers=DELETE_HEADER,
+    )
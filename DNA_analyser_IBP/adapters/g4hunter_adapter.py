@@ -1,22 +1,22 @@
 # g4hunter_caller.py
 
 
-import json
 from typing import Generator, List, Optional
 
 import pandas as pd
-import requests
 import tenacity
 from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
+from DNA_analyser_IBP.adapters.endpoints import G4HUNTER_ENDPOINT, g4hunter_body
 from DNA_analyser_IBP.adapters.validations import (
     validate_key_response,
     validate_text_response,
 )
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models import G4Hunter
-from DNA_analyser_IBP.utils import Logger, generate_dataframe, join_url, login_required
+from DNA_analyser_IBP.result_schemas import decode_result
+from DNA_analyser_IBP.utils import login_required
 
 
 class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
@@ -45,33 +45,20 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             G4HunterModel: G4Hunter model
         """
-        # check range of parameters
-        if 0 <= threshold <= 4 and 10 <= window_size <= 100:
-            header: dict = {
-                "Accept": "application/json",
-                "Authorization": self.user.jwt,
-                "Content-type": "application/json",
-            }
-            data: str = json.dumps(
-                {
-                    "sequence": id,
-                    "tags": tags or list(),
-                    "threshold": threshold,
-                    "windowSize": window_size,
-                }
-            )
-            response: Response = requests.post(
-                join_url(self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER),
-                headers=header,
-                data=data,
-            )
+        body: Optional[dict] = g4hunter_body(
+            id=id, tags=tags, threshold=threshold, window_size=window_size
+        )
+        if body is not None:
+            response: Response = G4HUNTER_ENDPOINT.create(
+                server=self.user.server, body=body
+            ).send(self.transport)
             data: dict = validate_key_response(
-                response=response, status_code=201, payload_key="payload"
+                response=response,
+                status_code=G4HUNTER_ENDPOINT.create_status_code,
+                payload_key="payload",
             )
 
             return G4Hunter(**data)
-        else:
-            Logger.error("Value window size or threshold out of range!")
 
     @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
@@ -84,16 +71,9 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             bool: True if delete is successful False if not
         """
-        header: dict = {
-            "Accept": "*/*",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-
-        response: Response = requests.delete(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER, id),
-            headers=header,
-        )
+        response: Response = G4HUNTER_ENDPOINT.delete(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         if response.status_code == 204:
             return True
@@ -110,16 +90,9 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             G4HunterModel: G4Hunter object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER, id),
-            headers=header,
-        )
+        response: Response = G4HUNTER_ENDPOINT.load_by_id(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="payload"
         )
@@ -137,23 +110,9 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             Generator[G4HunterModel, None, None], Exception: G4Hunter object generator
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {
-            "order": "ASC",
-            "pageSize": "ALL",
-            "tags": tags or list(),
-            "requestForAll": "true",
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER),
-            headers=header,
-            params=params,
-        )
+        response: Response = G4HUNTER_ENDPOINT.load_all(
+            server=self.user.server, tags=tags
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="items"
         )
@@ -172,25 +131,37 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: DataFrame with G4Hunter results
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"order": "ASC", "requestForAll": "true", "pageSize": "ALL"}
-
-        response: Response = requests.get(
-            join_url(
-                self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER, id, "quadruplex"
-            ),
-            headers=header,
-            params=params,
-        )
+        response: Response = G4HUNTER_ENDPOINT.load_result(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
-            response=response, status_code=200, payload_key="items"
+            response=response,
+            status_code=200,
+            payload_key=G4HUNTER_ENDPOINT.result_key,
         )
 
-        return generate_dataframe(response=data)
+        return decode_result(response=data, schema=G4HUNTER_ENDPOINT.result_schema)
+
+    @login_required
+    def load_result_chunks(
+        self, id: str, chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Send paged GETs to /analyse/g4hunter/{id}/quadruplex
+
+        Args:
+            id (str): g4hunter analyse id
+            chunk_size (int): number of results per chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with G4Hunter results
+        """
+        return self._load_result_chunks(
+            url=G4HUNTER_ENDPOINT.result_url(server=self.user.server, id=id),
+            payload_key=G4HUNTER_ENDPOINT.result_key,
+            chunk_size=chunk_size,
+            schema=G4HUNTER_ENDPOINT.result_schema,
+        )
 
     @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
@@ -205,16 +176,11 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             str: csv file in string
         """
-        header: dict = {"Accept": "text/plain", "Authorization": self.user.jwt}
-        params: dict = {"aggregate": "true" if aggregate else "false"}
-
-        response: Response = requests.get(
-            join_url(
-                self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER, id, "quadruplex.csv"
-            ),
-            headers=header,
-            params=params,
-        )
+        response: Response = G4HUNTER_ENDPOINT.export_csv(
+            server=self.user.server,
+            id=id,
+            params={"aggregate": "true" if aggregate else "false"},
+        ).send(self.transport)
 
         return validate_text_response(response=response, status_code=200)
 
@@ -230,25 +196,11 @@ class G4HunterAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: dataFrame with heatmap data
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"segments": segments}
-
-        response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.G4HUNTER, id, "heatmap"),
-            headers=header,
-            params=params,
-        )
+        response: Response = G4HUNTER_ENDPOINT.load_heatmap(
+            server=self.user.server, id=id, segments=segments
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="data"
         )
 
-        heatmap: pd.DataFrame = pd.DataFrame(data=data)
-        heatmap.rename(
-            columns={"count": "PQS_count", "coverage": "PQS_coverage"}, inplace=True
-        )
-
-        return heatmap
+        return G4HUNTER_ENDPOINT.decode_heatmap(data)
@@ -3,7 +3,7 @@
 
 import json
 
-from requests import Response, post
+from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
 from DNA_analyser_IBP.adapters.validations import validate_key_response
@@ -34,11 +34,7 @@ class G4KillerAdapter(BaseAdapter, BaseAnalyseAdapter):
         """
         # check range of parameters
         if sequence and (0 < len(sequence) <= 200) and (0 <= threshold <= 4):
-            header: dict = {
-                "Authorization": self.user.jwt,
-                "Accept": "application/json",
-                "Content-type": "application/json",
-            }
+            header: dict = {"Content-type": "application/json"}
             data: str = json.dumps(
                 {
                     "sequence": sequence,
@@ -47,7 +43,7 @@ class G4KillerAdapter(BaseAdapter, BaseAnalyseAdapter):
                 }
             )
 
-            response: Response = post(
+            response: Response = self.transport.post(
                 join_url(self.user.server, Config.ENDPOINT_CONFIG.G4KILLER),
                 headers=header,
                 data=data,
@@ -0,0 +1,63 @@
+# json_body.py
+
+import json
+from typing import Generator, Iterable, Union
+
+from DNA_analyser_IBP.config import Config
+
+SequenceData = Union[str, bytes, bytearray, memoryview, Iterable[Union[str, bytes]]]
+
+
+def iter_sequence_chunks(
+    sequence: SequenceData, block_size: int = Config.UPLOAD_CONFIG.BLOCK_SIZE
+) -> Generator[str, None, None]:
+    """
+    Yield sequence in string blocks, only one block is copied at once
+
+    Args:
+        sequence (SequenceData): string, ASCII buffer or iterable of string|bytes chunks e.g. file
+        block_size (int): block size of string and buffer sequences
+
+    Returns:
+        Generator[str, None, None]: sequence blocks
+    """
+    if isinstance(sequence, str):
+        for start in range(0, len(sequence), block_size):
+            yield sequence[start : start + block_size]
+    elif isinstance(sequence, (bytes, bytearray, memoryview)):
+        view: memoryview = memoryview(sequence).cast("B")
+        for start in range(0, len(view), block_size):
+            yield str(view[start : start + block_size], "ascii")
+    else:
+        for chunk in sequence:
+            yield chunk if isinstance(chunk, str) else str(chunk, "ascii")
+
+
+def iter_json_body(
+    *,
+    data: dict,
+    key: str,
+    sequence: SequenceData,
+    block_size: int = Config.UPLOAD_CONFIG.BLOCK_SIZE,
+) -> Generator[bytes, None, None]:
+    """
+    Yield JSON object with sequence written block by block into its string field
+
+    Args:
+        data (dict): other JSON fields
+        key (str): sequence field name
+        sequence (SequenceData): sequence data
+        block_size (int): block size of string and buffer sequences
+
+    Returns:
+        Generator[bytes, None, None]: JSON body parts
+    """
+    # sequence field is last, envelope ends with "key": ""}
+    envelope: str = json.dumps({**data, key: str()})
+    yield envelope[:-2].encode("utf-8")
+
+    for chunk in iter_sequence_chunks(sequence, block_size):
+        # escaping is per character, so blocks can be escaped separately
+        yield json.dumps(chunk)[1:-1].encode("ascii")
+
+    yield envelope[-2:].encode("utf-8")
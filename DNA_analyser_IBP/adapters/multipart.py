@@ -0,0 +1,127 @@
+# multipart.py
+
+import gzip
+import json
+import uuid
+import zlib
+from typing import BinaryIO, Generator, Iterable, Tuple, Union
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.utils import _open_fasta
+
+
+def open_sequence_file(source: Union[str, BinaryIO]) -> Tuple[BinaryIO, bool]:
+    """
+    Open sequence file or wrap binary file-like object, gzip and bgzip data
+    are decompressed on the fly
+
+    Args:
+        source (Union[str, BinaryIO]): system path or binary file-like object
+
+    Returns:
+        Tuple[BinaryIO, bool]: binary stream, True if stream has to be closed by caller
+    """
+    if isinstance(source, str):
+        return _open_fasta(source), True
+
+    if hasattr(source, "peek"):
+        # peek does not consume magic bytes of non seekable buffered streams
+        magic: bytes = source.peek(2)[:2]
+    elif source.seekable():
+        position: int = source.tell()
+        magic = source.read(2)
+        source.seek(position)
+    else:
+        raise ValueError("File-like object has to be seekable or buffered!")
+
+    if magic == b"\x1f\x8b":
+        # bgzip is multi member gzip, GzipFile reads all members and keeps source open
+        return gzip.GzipFile(fileobj=source, mode="rb"), True
+    return source, False
+
+
+def iter_multipart(
+    *,
+    data: dict,
+    file: BinaryIO,
+    boundary: str,
+    block_size: int = Config.UPLOAD_CONFIG.BLOCK_SIZE,
+) -> Generator[bytes, None, None]:
+    """
+    Yield multipart/form-data body with json field and file field read in blocks
+
+    Args:
+        data (dict): json field content
+        file (BinaryIO): file field content
+        boundary (str): multipart boundary
+        block_size (int): file block size in bytes
+
+    Returns:
+        Generator[bytes, None, None]: body parts
+    """
+    yield (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="json"\r\n\r\n'
+        f"{json.dumps(data)}\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="filename"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("utf-8")
+
+    while True:
+        block: bytes = file.read(block_size)
+        if not block:
+            break
+        yield block
+
+    yield f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+
+def iter_gzip(
+    chunks: Iterable[bytes], level: int = Config.UPLOAD_CONFIG.COMPRESS_LEVEL
+) -> Generator[bytes, None, None]:
+    """
+    Compress body chunks into one gzip stream
+
+    Args:
+        chunks (Iterable[bytes]): body chunks
+        level (int): compression level 1-9
+
+    Returns:
+        Generator[bytes, None, None]: gzip compressed body chunks
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        compressed: bytes = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+def create_multipart_body(
+    *, data: dict, file: BinaryIO, compress: bool = False
+) -> Tuple[dict, Generator[bytes, None, None]]:
+    """
+    Create headers and streamed multipart body, body is sent with chunked transfer encoding
+
+    Args:
+        data (dict): json field content
+        file (BinaryIO): file field content
+        compress (bool): True = compress whole body and set Content-Encoding gzip
+
+    Returns:
+        Tuple[dict, Generator[bytes, None, None]]: request headers and body
+    """
+    boundary: str = uuid.uuid4().hex
+    header: dict = {"Content-type": f"multipart/form-data; boundary={boundary}"}
+    body: Generator[bytes, None, None] = iter_multipart(
+        data=data, file=file, boundary=boundary
+    )
+
+    if compress:
+        header["Content-Encoding"] = "gzip"
+        body = iter_gzip(body)
+
+    return header, body
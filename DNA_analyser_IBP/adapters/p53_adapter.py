@@ -2,8 +2,12 @@
 
 
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Generator, List, Optional
 
-from requests import Response, post
+import tenacity
+from requests import RequestException, Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
 from DNA_analyser_IBP.adapters.validations import validate_key_response
@@ -17,6 +21,12 @@ class P53Adapter(BaseAdapter, BaseAnalyseAdapter):
     P53 connector used for generating analyse for given sequence
     """
 
+    # only transport errors are retried, rejected windows fail at once in batches
+    @tenacity.retry(
+        wait=Config.TENACITY_CONFIG.WAIT,
+        stop=Config.TENACITY_CONFIG.STOP,
+        retry=tenacity.retry_if_exception_type(RequestException),
+    )
     @login_required
     def create_analyse(self, sequence: str) -> P53:
         """
@@ -30,14 +40,10 @@ class P53Adapter(BaseAdapter, BaseAnalyseAdapter):
         """
         # check if sequence length is exactly 20 chars
         if sequence and len(sequence) == 20:
-            header: dict = {
-                "Authorization": self.user.jwt,
-                "Accept": "application/json",
-                "Content-type": "application/json",
-            }
+            header: dict = {"Content-type": "application/json"}
             data: str = json.dumps({"sequence": sequence})
 
-            response: Response = post(
+            response: Response = self.transport.post(
                 join_url(self.user.server, Config.ENDPOINT_CONFIG.P53),
                 headers=header,
                 data=data,
@@ -49,3 +55,42 @@ class P53Adapter(BaseAdapter, BaseAnalyseAdapter):
             return P53(**response_data)
         else:
             Logger.error("Sequence length must be exactly 20 characters!")
+
+    @login_required
+    def create_analyses(
+        self, sequences: List[str], max_workers: Optional[int] = None
+    ) -> Generator[Optional[P53], None, None]:
+        """
+        Send POST to /analyse/p53predictor/tool for every sequence concurrently, only
+        2 * max_workers requests are in flight or waiting at once
+
+        Args:
+            sequences (List[str]): sequence strings of length 20
+            max_workers (Optional[int]): number of concurrent requests [default=transport pool size]
+
+        Returns:
+            Generator[Optional[P53], None, None]: P53 objects in order of sequences, None for failed sequence
+        """
+        max_workers: int = max_workers or self.transport.pool_size
+        pending: Deque[Future] = deque()
+
+        def _result(future: Future) -> Optional[P53]:
+            try:
+                return future.result()
+            except Exception as e:
+                Logger.error(f"P53 prediction cannot be created: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for sequence in sequences:
+                    pending.append(executor.submit(self.create_analyse, sequence))
+                    if len(pending) >= 2 * max_workers:
+                        yield _result(pending.popleft())
+
+                while pending:
+                    yield _result(pending.popleft())
+            finally:
+                # consumer stopped early, do not send rest of requests
+                for future in pending:
+                    future.cancel()
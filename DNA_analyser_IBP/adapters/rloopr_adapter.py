@@ -1,22 +1,22 @@
 # g4hunter_caller.py
 
 
-import json
 from typing import Generator, List, Optional
 
 import pandas as pd
-import requests
 import tenacity
 from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
+from DNA_analyser_IBP.adapters.endpoints import RLOOPR_ENDPOINT, rloopr_body
 from DNA_analyser_IBP.adapters.validations import (
     validate_key_response,
     validate_text_response,
 )
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models import RLoopr
-from DNA_analyser_IBP.utils import generate_dataframe, join_url, login_required
+from DNA_analyser_IBP.result_schemas import decode_result
+from DNA_analyser_IBP.utils import login_required
 
 
 class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
@@ -40,25 +40,14 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             RLoopr: RLoopr model
         """
-        header: dict = {
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-        data: str = json.dumps(
-            {
-                "sequence": id,
-                "tags": tags or list(),
-                "rizModel": riz_model or list(),
-            }
-        )
-        response: Response = requests.post(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR),
-            headers=header,
-            data=data,
-        )
+        response: Response = RLOOPR_ENDPOINT.create(
+            server=self.user.server,
+            body=rloopr_body(id=id, tags=tags, riz_model=riz_model),
+        ).send(self.transport)
         data: dict = validate_key_response(
-            response=response, status_code=200, payload_key="payload"
+            response=response,
+            status_code=RLOOPR_ENDPOINT.create_status_code,
+            payload_key="payload",
         )
 
         return RLoopr(**data)
@@ -74,23 +63,9 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             Generator[RLoopr, None, None], Exception: RLoopr object generator
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {
-            "order": "ASC",
-            "pageSize": "ALL",
-            "tags": tags or list(),
-            "requestForAll": "true",
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR),
-            headers=header,
-            params=params,
-        )
+        response: Response = RLOOPR_ENDPOINT.load_all(
+            server=self.user.server, tags=tags
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="items"
         )
@@ -109,16 +84,9 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             RLoopr: RLoopr object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR, id, "analysis"),
-            headers=header,
-        )
+        response: Response = RLOOPR_ENDPOINT.load_by_id(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="payload"
         )
@@ -136,16 +104,9 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             bool: True if delete is successful False if not
         """
-        header: dict = {
-            "Accept": "*/*",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-
-        response: Response = requests.delete(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR, id),
-            headers=header,
-        )
+        response: Response = RLOOPR_ENDPOINT.delete(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         if response.status_code == 204:
             return True
@@ -163,12 +124,9 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             str: csv file in string
         """
-        header: dict = {"Accept": "text/plain", "Authorization": self.user.jwt}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR, id, "rloopr.csv"),
-            headers=header,
-        )
+        response: Response = RLOOPR_ENDPOINT.export_csv(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         return validate_text_response(response=response, status_code=200)
 
@@ -183,20 +141,34 @@ class RLooprAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: DataFrame with RLoopr results
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"order": "ASC", "requestForAll": "true", "pageSize": "ALL"}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.RLOOPR, id, "rloops"),
-            headers=header,
-            params=params,
-        )
+        response: Response = RLOOPR_ENDPOINT.load_result(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
-            response=response, status_code=200, payload_key="payload"
+            response=response,
+            status_code=200,
+            payload_key=RLOOPR_ENDPOINT.result_key,
         )
 
-        return generate_dataframe(response=data)
+        return decode_result(response=data, schema=RLOOPR_ENDPOINT.result_schema)
+
+    @login_required
+    def load_result_chunks(
+        self, id: str, chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Send paged GETs to /analyse/rloopr/{id}/rloops
+
+        Args:
+            id (str): rloopr analyse id
+            chunk_size (int): number of results per chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with RLoopr results
+        """
+        return self._load_result_chunks(
+            url=RLOOPR_ENDPOINT.result_url(server=self.user.server, id=id),
+            payload_key=RLOOPR_ENDPOINT.result_key,
+            chunk_size=chunk_size,
+            schema=RLOOPR_ENDPOINT.result_schema,
+        )
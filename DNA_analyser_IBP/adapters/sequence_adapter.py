@@ -1,20 +1,49 @@
 # sequence_connector.py
 
-import json
-from typing import Generator, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
 import tenacity
-from requests import Response, delete, get, patch, post
-from requests_toolbelt import MultipartEncoder
+from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter
+from DNA_analyser_IBP.adapters.endpoints import (
+    JSON_HEADER,
+    ncbi_request,
+    sequence_data_request,
+    sequence_delete_request,
+    sequence_fields,
+    sequence_import_url,
+    sequence_request,
+    sequences_request,
+)
+from DNA_analyser_IBP.adapters.json_body import SequenceData, iter_json_body
+from DNA_analyser_IBP.adapters.multipart import (
+    create_multipart_body,
+    open_sequence_file,
+)
 from DNA_analyser_IBP.adapters.validations import (
     validate_key_response,
     validate_text_response,
 )
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models import Sequence
-from DNA_analyser_IBP.utils import Logger, join_url, login_required
+from DNA_analyser_IBP.type import DataOutput
+from DNA_analyser_IBP.utils import Logger, convert_data, join_url, login_required
+
+T = TypeVar("T")
 
 
 class SequenceAdapter(BaseAdapter):
@@ -22,22 +51,22 @@ class SequenceAdapter(BaseAdapter):
     Sequence connector used for sequence manipulation
     """
 
-    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
     def create_text_sequence(
         self,
         circular: bool,
-        data: str,
+        data: SequenceData,
         name: str,
         tags: List[Optional[str]],
         nucleic_type: str,
     ) -> Sequence:
         """
-        Send POST to /sequence/import/text
+        Send POST to /sequence/import/text, JSON body is streamed around sequence
+        blocks so sequence is never copied as a whole
 
         Args:
             circular (bool): True if sequence is circular False if not
-            data (str): string data with sequence
+            data (SequenceData): sequence string, ASCII buffer or iterable of chunks e.g. file
             name (str): sequence name
             tags (List[Optional[str]]): tags for sequence filtering
             nucleic_type (str): string DNA|RNA
@@ -45,88 +74,175 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             SequenceModel: Sequence object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        data: str = json.dumps(
-            {
-                "circular": circular,
-                "data": data,
-                "format": "PLAIN",
-                "name": name,
-                "tags": tags,
-                "type": nucleic_type,
-            }
+        fields: dict = sequence_fields(
+            circular=circular,
+            tags=tags,
+            nucleic_type=nucleic_type,
+            format="PLAIN",
+            name=name,
         )
+        # iterators can be consumed only once, so they are not retried
+        replayable: bool = isinstance(data, (str, bytes, bytearray, memoryview))
+
+        def _post() -> Sequence:
+            response: Response = self.transport.post(
+                sequence_import_url(server=self.user.server, source="text"),
+                headers=JSON_HEADER,
+                data=iter_json_body(data=fields, key="data", sequence=data),
+            )
+            payload: dict = validate_key_response(
+                response=response, status_code=201, payload_key="payload"
+            )
 
-        response: Response = post(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, "import/text"),
-            headers=header,
-            data=data,
+            return Sequence(**payload)
+
+        retrying: tenacity.Retrying = tenacity.Retrying(
+            wait=Config.TENACITY_CONFIG.WAIT,
+            stop=Config.TENACITY_CONFIG.STOP
+            if replayable
+            else tenacity.stop_after_attempt(1),
         )
-        data: dict = validate_key_response(
-            response=response, status_code=201, payload_key="payload"
+        return retrying(_post)
+
+    def _post_file(
+        self,
+        *,
+        data: dict,
+        source: Union[str, BinaryIO],
+        compress: bool,
+        handle: Callable[[Response], T],
+    ) -> T:
+        """
+        Send POST to /sequence/import/file with streamed multipart body, every attempt
+        opens file again, file-like objects are rewound or sent only once
+
+        Args:
+            data (dict): json field content
+            source (Union[str, BinaryIO]): system path or binary file-like object
+            compress (bool): True = send body with Content-Encoding gzip
+            handle (Callable[[Response], T]): response validation
+
+        Returns:
+            T: validated response
+        """
+        position: Optional[int] = (
+            source.tell() if not isinstance(source, str) and source.seekable() else None
         )
 
-        return Sequence(**data)
+        def _post() -> T:
+            if position is not None:
+                source.seek(position)
+            file, owned = open_sequence_file(source)
+
+            try:
+                header, body = create_multipart_body(
+                    data=data, file=file, compress=compress
+                )
+                response: Response = self.transport.post(
+                    sequence_import_url(server=self.user.server, source="file"),
+                    headers=header,
+                    data=body,
+                )
+            finally:
+                if owned:
+                    file.close()
+
+            return handle(response)
+
+        retrying: tenacity.Retrying = tenacity.Retrying(
+            wait=Config.TENACITY_CONFIG.WAIT,
+            stop=Config.TENACITY_CONFIG.STOP
+            if isinstance(source, str) or position is not None
+            else tenacity.stop_after_attempt(1),
+        )
+        return retrying(_post)
 
-    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
     def create_file_sequence(
         self,
         circular: bool,
-        path: str,
+        path: Union[str, BinaryIO],
         name: str,
         tags: List[Optional[str]],
         nucleic_type: str,
         format: str,
+        compress: bool = False,
     ) -> Sequence:
         """
-        Send POST to /sequence/import/file
+        Send POST to /sequence/import/file, file is streamed in blocks and
+        gzip or bgzip compressed files are decompressed on the fly
 
         Args:
             circular (bool): True if sequence is circular False if not
-            path (str): absolute path to sequence file
+            path (Union[str, BinaryIO]): absolute path to sequence file or binary file-like object
             name (str): sequence name
             tags (List[Optional[str]]): tags for sequence filtering
             nucleic_type (str): string DNA|RNA
             format (str): string FASTA | PLAIN
+            compress (bool): True = send gzip compressed body with Content-Encoding [default=False]
 
         Returns:
             SequenceModel: Sequence object
         """
-        data: str = json.dumps(
-            {
-                "circular": circular,
-                "format": format,
-                "name": name,
-                "tags": tags,
-                "type": nucleic_type,
-            }
+        data: dict = sequence_fields(
+            circular=circular,
+            tags=tags,
+            nucleic_type=nucleic_type,
+            format=format,
+            name=name,
         )
-        multi_encoder: MultipartEncoder = MultipartEncoder(
-            fields={"json": data, "file": ("filename", open(path, "rb"))}
-        )
-        header: dict = {
-            "Content-type": multi_encoder.content_type,
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = post(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, "import/file"),
-            headers=header,
-            data=multi_encoder,
+
+        return self._post_file(
+            data=data,
+            source=path,
+            compress=compress,
+            handle=lambda response: Sequence(
+                **validate_key_response(
+                    response=response, status_code=201, payload_key="payload"
+                )
+            ),
         )
-        data: dict = validate_key_response(
-            response=response, status_code=201, payload_key="payload"
+
+    @login_required
+    def create_multifasta_sequence(
+        self,
+        circular: bool,
+        path: Union[str, BinaryIO],
+        tags: List[Optional[str]],
+        nucleic_type: str,
+        compress: bool = False,
+    ) -> Optional[List[Sequence]]:
+        """
+        Send POST to /sequence/import/file with whole MultiFASTA file in one multipart upload
+
+        Args:
+            circular (bool): True if sequence is circular False if not
+            path (Union[str, BinaryIO]): absolute path to multifasta file or binary file-like object
+            tags (List[Optional[str]]): tags for sequence filtering
+            nucleic_type (str): string DNA|RNA
+            compress (bool): True = send gzip compressed body with Content-Encoding [default=False]
+
+        Returns:
+            Optional[List[Sequence]]: Sequence objects, None if server does not support bulk import
+        """
+        data: dict = sequence_fields(
+            circular=circular, tags=tags, nucleic_type=nucleic_type, format="MULTIFASTA"
         )
 
-        return Sequence(**data)
+        def _handle(response: Response) -> Optional[List[Sequence]]:
+            # older servers reject unknown format, records are then uploaded one by one
+            if response.status_code in Config.TRANSPORT_CONFIG.UNSUPPORTED_STATUS_CODES:
+                return None
+
+            items: list = validate_key_response(
+                response=response, status_code=201, payload_key="items"
+            )
+            return [Sequence(**sequence) for sequence in items]
+
+        return self._post_file(
+            data=data, source=path, compress=compress, handle=_handle
+        )
 
-    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
     def create_ncbi_sequence(
         self,
@@ -147,72 +263,176 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             SequenceModel: Sequence object
         """
-        ncbi: list = [
-            {
-                "circular": circular,
-                "name": name,
-                "ncbiId": ncbi_id,
-                "tags": tags,
-                "type": "DNA",
-            }
-        ]
-        data: str = json.dumps(
-            {"circular": circular, "ncbis": ncbi, "tags": tags, "type": "DNA"}
-        )
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        response: Response = post(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, "import/ncbi"),
-            headers=header,
-            data=data,
-        )
-        data: dict = validate_key_response(
+        return self.create_ncbi_sequences(
+            circular=circular, tags=tags, records=[(name, ncbi_id, tags)]
+        )[0]
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    @login_required
+    def create_ncbi_sequences(
+        self,
+        circular: bool,
+        tags: List[Optional[str]],
+        records: List[Tuple[str, str, List[Optional[str]]]],
+    ) -> List[Sequence]:
+        """
+        Send POST to /sequence/import/ncbi with many NCBI records in one ncbis array
+
+        Args:
+            circular (bool): True if sequence is circular False if not
+            tags (List[Optional[str]]): tags shared by all sequences
+            records (List[Tuple[str, str, List[Optional[str]]]]): sequence name, NCBI id and tags of every record
+
+        Returns:
+            List[Sequence]: Sequence objects in order of records
+        """
+        response: Response = ncbi_request(
+            server=self.user.server, circular=circular, tags=tags, records=records
+        ).send(self.transport)
+        items: list = validate_key_response(
             response=response, status_code=201, payload_key="items"
         )
 
-        return Sequence(**data[0])
+        return [Sequence(**sequence) for sequence in items]
+
+    @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
+    def _load_data_window(self, *, id: str, length: int, position: int) -> bytes:
+        """
+        Send GET to /sequence/{id}/data for one window of max 1000 bp
+
+        Args:
+            id (str): sequence id
+            length (int): data string length
+            position (int): data start position
+
+        Returns:
+            bytes: ASCII sequence data
+        """
+        response: Response = sequence_data_request(
+            server=self.user.server, id=id, length=length, position=position
+        ).send(self.transport)
+
+        return validate_text_response(response=response, status_code=200).encode(
+            "ascii"
+        )
+
+    def _iter_data_windows(
+        self, *, id: str, length: int, position: int, max_workers: int
+    ) -> Generator[bytes, None, None]:
+        """
+        Fetch windows concurrently and yield them in sequence order, only
+        2 * max_workers windows are in flight or waiting at once
+
+        Args:
+            id (str): sequence id
+            length (int): data string length
+            position (int): data start position
+            max_workers (int): number of concurrent requests
+
+        Returns:
+            Generator[bytes, None, None]: ASCII data windows
+        """
+        window_size: int = Config.DATA_CONFIG.WINDOW_SIZE
+        end: int = position + length
+        pending: Deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for start in range(position, end, window_size):
+                    pending.append(
+                        executor.submit(
+                            self._load_data_window,
+                            id=id,
+                            length=min(window_size, end - start),
+                            position=start,
+                        )
+                    )
+                    if len(pending) >= 2 * max_workers:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # consumer stopped early, do not download rest of windows
+                for future in pending:
+                    future.cancel()
 
     @login_required
-    def load_data(
-        self, id: str, length: int, position: int, sequence_length: int
-    ) -> str:
+    def iter_data(
+        self,
+        id: str,
+        length: int,
+        position: int,
+        sequence_length: int,
+        max_workers: Optional[int] = None,
+    ) -> Optional[Generator[bytes, None, None]]:
         """
-        Send GET to /sequence/{id}/data
+        Send GET to /sequence/{id}/data for each 1000 bp window of interval concurrently
 
         Args:
             id (str): sequence id
             length (int): data string length
             position (int): data start position
             sequence_length (int): sequence length for check
+            max_workers (Optional[int]): number of concurrent requests [default=transport pool size]
 
         Returns:
-            str: String with part of sequence data
+            Optional[Generator[bytes, None, None]]: ASCII data windows in sequence order
         """
-        if (
-            position >= 0
-            and 0 < length <= 1000
-            and position + length <= sequence_length
-        ):
-            header: dict = {
-                "Content-type": "application/json",
-                "Accept": "text/plain",
-                "Authorization": self.user.jwt,
-            }
-            params: dict = {"len": length, "pos": position}
-
-            response: Response = get(
-                join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, id, "data"),
-                headers=header,
-                params=params,
+        if position >= 0 and 0 < length and position + length <= sequence_length:
+            return self._iter_data_windows(
+                id=id,
+                length=length,
+                position=position,
+                max_workers=max_workers or self.transport.pool_size,
             )
-
-            return validate_text_response(response=response, status_code=200)
         else:
             Logger.error("Values out of range!")
 
+    @login_required
+    def load_data(
+        self,
+        id: str,
+        length: int,
+        position: int,
+        sequence_length: int,
+        output: str = DataOutput.STRING,
+        max_workers: Optional[int] = None,
+    ) -> Optional[Union[str, bytes, np.ndarray]]:
+        """
+        Send GET to /sequence/{id}/data, intervals longer than 1000 bp are fetched
+        in concurrent windows and joined in preallocated buffer
+
+        Args:
+            id (str): sequence id
+            length (int): data string length
+            position (int): data start position
+            sequence_length (int): sequence length for check
+            output (str): str|bytes|numpy [default=str]
+            max_workers (Optional[int]): number of concurrent requests [default=transport pool size]
+
+        Returns:
+            Optional[Union[str, bytes, np.ndarray]]: part of sequence data
+        """
+        windows: Optional[Generator[bytes, None, None]] = self.iter_data(
+            id=id,
+            length=length,
+            position=position,
+            sequence_length=sequence_length,
+            max_workers=max_workers,
+        )
+        if windows is None:
+            return None
+
+        data: bytearray = bytearray(length)
+        offset: int = 0
+
+        for window in windows:
+            data[offset : offset + len(window)] = window
+            offset += len(window)
+
+        return convert_data(data=data[:offset] if offset < length else data, output=output)
+
     @login_required
     def load_all(self, tags: List[Optional[str]]) -> Generator[Sequence, None, None]:
         """
@@ -224,23 +444,9 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             Generator[SequenceModel, None, None]: Sequence object generator
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {
-            "order": "ASC",
-            "requestForAll": "true",
-            "pageSize": "ALL",
-            "tags": tags,
-        }
-
-        response: Response = get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE),
-            headers=header,
-            params=params,
-        )
+        response: Response = sequences_request(
+            server=self.user.server, tags=tags
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="items"
         )
@@ -259,15 +465,8 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             SequenceModel: Sequence object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, id),
-            headers=header,
+        response: Response = sequence_request(server=self.user.server, id=id).send(
+            self.transport
         )
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="payload"
@@ -287,9 +486,9 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             bool: True if re-count is successful False if not
         """
-        header: dict = {"Accept": "*/*", "Authorization": self.user.jwt}
+        header: dict = {"Accept": "*/*"}
 
-        response: Response = patch(
+        response: Response = self.transport.patch(
             join_url(
                 self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, id, "nucleic-counts"
             ),
@@ -312,16 +511,9 @@ class SequenceAdapter(BaseAdapter):
         Returns:
             bool: True if delete is successful False if not
         """
-        header: dict = {
-            "Accept": "*/*",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-
-        response: Response = delete(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.SEQUENCE, id),
-            headers=header,
-        )
+        response: Response = sequence_delete_request(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         if response.status_code == 204:
             return True
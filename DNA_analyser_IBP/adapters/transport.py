@@ -0,0 +1,92 @@
+# transport.py
+
+from typing import Optional
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from DNA_analyser_IBP.config import Config
+
+
+class Transport:
+    """
+    HTTP transport shared by all adapters, keeps connections to server alive
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        jwt: Optional[str] = None,
+    ) -> None:
+        """
+        Create pooled HTTP session
+
+        Args:
+            pool_size (int): max number of kept-alive connections per host
+            jwt (Optional[str]): JSON web token used as default Authorization header
+        """
+        self.pool_size: int = pool_size
+        self.session: Session = Session()
+
+        http_adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=Config.TRANSPORT_CONFIG.POOL_CONNECTIONS,
+            pool_maxsize=pool_size,
+        )
+        self.session.mount("http://", http_adapter)
+        self.session.mount("https://", http_adapter)
+        self.session.headers.update(
+            {"Accept": "application/json", "Connection": "keep-alive"}
+        )
+        self.authorize(jwt=jwt)
+
+    def __repr__(self):
+        return f"<Transport pool_size: {self.pool_size}>"
+
+    def authorize(self, *, jwt: Optional[str]) -> None:
+        """
+        Set JWT as default Authorization header
+
+        Args:
+            jwt (Optional[str]): JSON web token, None removes header
+        """
+        if jwt is not None:
+            self.session.headers["Authorization"] = jwt
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """
+        Send request through pooled session, stalled connection fails after timeout
+
+        Args:
+            method (str): HTTP method
+            url (str): endpoint url
+            **kwargs: requests keyword arguments e.g. headers, params, data, timeout
+
+        Returns:
+            Response: HTTP response
+        """
+        kwargs.setdefault("timeout", Config.TRANSPORT_CONFIG.TIMEOUT)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close all pooled connections
+        """
+        self.session.close()
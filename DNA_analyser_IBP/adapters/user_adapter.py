@@ -1,15 +1,14 @@
 # user_connector.py
 
 
-import json
+from typing import Optional
 
-import jwt
-from requests import Response, post, put
+from requests import Response
 
-from DNA_analyser_IBP.adapters.validations import validate_text_response
-from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.adapters.endpoints import authorize_user, sign_in_request
+from DNA_analyser_IBP.adapters.transport import Transport
 from DNA_analyser_IBP.models import User
-from DNA_analyser_IBP.utils import Logger, exception_handler, join_url
+from DNA_analyser_IBP.utils import exception_handler
 
 
 class UserAdapter:
@@ -19,33 +18,18 @@ class UserAdapter:
 
     @staticmethod
     @exception_handler
-    def sign_in(user: User) -> User:
+    def sign_in(user: User, transport: Optional[Transport] = None) -> User:
         """
         Sign in to API http://bioinformatics.ibp.cz:8888/api
 
+        Args:
+            user (User): user with login information
+            transport (Optional[Transport]): shared transport authorized by new JWT
+
         Returns:
             tuple: JWT string, user id, expiration date
         """
-        header = {
-            "Accept": "text/plain",
-            "Content-type": "application/json",
-        }
-        data: str = json.dumps({"login": user.email, "password": user.password})
-
-        if user.email != "host":
-            response: Response = put(
-                join_url(user.server, Config.ENDPOINT_CONFIG.JWT),
-                data=data,
-                headers=header,
-            )
-        else:
-            response: Response = post(
-                join_url(user.server, Config.ENDPOINT_CONFIG.JWT), headers=header
-            )
-
-        jwt_token: str = validate_text_response(response=response, status_code=201)
-        data: dict = jwt.decode(jwt_token, options={"verify_signature": False})
-        user.is_logged_in = True
-        user.set_login(jwt=jwt_token, id=data.get("id"))
-        Logger.info(f"User {user.email} is successfully loged in ...")
-        return user
+        transport: Transport = transport if transport is not None else Transport()
+        response: Response = sign_in_request(user=user).send(transport)
+
+        return authorize_user(user=user, response=response, transport=transport)
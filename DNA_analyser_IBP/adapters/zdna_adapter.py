@@ -1,19 +1,19 @@
-import json
 from typing import Generator, List, Optional
 
 import pandas as pd
-import requests
 import tenacity
 from requests import Response
 
 from DNA_analyser_IBP.adapters.base_adapter import BaseAdapter, BaseAnalyseAdapter
+from DNA_analyser_IBP.adapters.endpoints import ZDNA_ENDPOINT, zdna_body
 from DNA_analyser_IBP.adapters.validations import (
     validate_key_response,
     validate_text_response,
 )
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.models import ZDna
-from DNA_analyser_IBP.utils import Logger, generate_dataframe, join_url, login_required
+from DNA_analyser_IBP.result_schemas import decode_result
+from DNA_analyser_IBP.utils import login_required
 
 
 class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
@@ -45,48 +45,28 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         AT_score (float): score for the AT pair, minimum 0, defaults: 0 (model 1), 0.5 (model 2)
         min_score_perc (float): minimum score for the searched Z-DNA window (input values as percentages), minimum: 12, defaults: 12 (model 1), 50 (model 2)
         """
-        conditions: List[bool] = (
-            min_sequence_size >= 6,
-            GC_score >= 0.1,
-            GTAC_score >= 0,
-            AT_score >= 0,
-            min_score_percentage >= 12
+        body: Optional[dict] = zdna_body(
+            id=id,
+            tags=tags,
+            min_sequence_size=min_sequence_size,
+            model=model,
+            GC_score=GC_score,
+            GTAC_score=GTAC_score,
+            AT_score=AT_score,
+            oth_score=oth_score,
+            min_score_percentage=min_score_percentage,
         )
-
-        if all(conditions):
-            header: dict = {
-                "Accept": "application/json",
-                "Authorization": self.user.jwt,
-                "Content-type": "application/json",
-            }
-
-            data: str = json.dumps(
-                {
-                    "sequence": id,
-                    "tags": tags or list(),
-                    "minSequenceSize": min_sequence_size,
-                    "selectedModel": model or list(),
-                    "score_gc": GC_score,
-                    "score_gtac": GTAC_score,
-                    "score_at": AT_score,
-                    "score_oth": oth_score,
-                    "threshold": min_score_percentage,
-                }
-            )
-
-            response: Response = requests.post(
-                join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA),
-                headers=header,
-                data=data,
-            )
-
+        if body is not None:
+            response: Response = ZDNA_ENDPOINT.create(
+                server=self.user.server, body=body
+            ).send(self.transport)
             data: dict = validate_key_response(
-                response=response, status_code=200, payload_key="payload"
+                response=response,
+                status_code=ZDNA_ENDPOINT.create_status_code,
+                payload_key="payload",
             )
 
             return ZDna(**data)
-        else:
-            Logger.error("Parameters out of permitted range!")
 
     @login_required
     def load_all(self, tags: List[Optional[str]]) -> Generator[ZDna, None, None]:
@@ -99,22 +79,9 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             Generator[ZDna, None, None], Exception: ZDna object generator
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {
-            "order": "ASC",
-            "pageSize": "ALL",
-            "tags": tags or list(),
-            "requestForAll": "true",
-        }
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA),
-            headers=header,
-            params=params,
-        )
+        response: Response = ZDNA_ENDPOINT.load_all(
+            server=self.user.server, tags=tags
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="items"
         )
@@ -133,16 +100,9 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             ZDna: ZDna object
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA, id, "analysis"),
-            headers=header,
-        )
+        response: Response = ZDNA_ENDPOINT.load_by_id(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="payload"
         )
@@ -160,16 +120,9 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             bool: True if delete is successful False if not
         """
-        header: dict = {
-            "Accept": "*/*",
-            "Authorization": self.user.jwt,
-            "Content-type": "application/json",
-        }
-
-        response: Response = requests.delete(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA, id),
-            headers=header,
-        )
+        response: Response = ZDNA_ENDPOINT.delete(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         if response.status_code == 204:
             return True
@@ -186,23 +139,37 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: DataFrame with ZDna results
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"order": "ASC", "requestForAll": "true", "pageSize": "ALL"}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA, id, "zdnas"),
-            headers=header,
-            params=params,
-        )
+        response: Response = ZDNA_ENDPOINT.load_result(
+            server=self.user.server, id=id
+        ).send(self.transport)
         data: dict = validate_key_response(
-            response=response, status_code=200, payload_key="items"
+            response=response,
+            status_code=200,
+            payload_key=ZDNA_ENDPOINT.result_key,
         )
 
-        return generate_dataframe(response=data)
+        return decode_result(response=data, schema=ZDNA_ENDPOINT.result_schema)
+
+    @login_required
+    def load_result_chunks(
+        self, id: str, chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Send paged GETs to /analyse/zdna/{id}/zdnas
+
+        Args:
+            id (str): zdna analyse id
+            chunk_size (int): number of results per chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with Z-DNA results
+        """
+        return self._load_result_chunks(
+            url=ZDNA_ENDPOINT.result_url(server=self.user.server, id=id),
+            payload_key=ZDNA_ENDPOINT.result_key,
+            chunk_size=chunk_size,
+            schema=ZDNA_ENDPOINT.result_schema,
+        )
 
     @tenacity.retry(wait=Config.TENACITY_CONFIG.WAIT, stop=Config.TENACITY_CONFIG.STOP)
     @login_required
@@ -216,12 +183,9 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             str: csv file in string
         """
-        header: dict = {"Accept": "text/plain", "Authorization": self.user.jwt}
-
-        response: Response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA, id, "zdna.csv"),
-            headers=header,
-        )
+        response: Response = ZDNA_ENDPOINT.export_csv(
+            server=self.user.server, id=id
+        ).send(self.transport)
 
         return validate_text_response(response=response, status_code=200)
 
@@ -237,25 +201,11 @@ class ZDnaAdapter(BaseAdapter, BaseAnalyseAdapter):
         Returns:
             pd.DataFrame: dataFrame with heatmap data
         """
-        header: dict = {
-            "Content-type": "application/json",
-            "Accept": "application/json",
-            "Authorization": self.user.jwt,
-        }
-        params: dict = {"segments": segments}
-
-        response = requests.get(
-            join_url(self.user.server, Config.ENDPOINT_CONFIG.ZDNA, id, "heatmap"),
-            headers=header,
-            params=params,
-        )
+        response: Response = ZDNA_ENDPOINT.load_heatmap(
+            server=self.user.server, id=id, segments=segments
+        ).send(self.transport)
         data: dict = validate_key_response(
             response=response, status_code=200, payload_key="data"
         )
 
-        heatmap: pd.DataFrame = pd.DataFrame(data=data)
-        heatmap.rename(
-            columns={"count": "Z-DNA_count", "coverage": "Z-DNA_coverage"}, inplace=True
-        )
-
-        return heatmap
+        return ZDNA_ENDPOINT.decode_heatmap(data)
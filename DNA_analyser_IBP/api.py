@@ -5,12 +5,15 @@ Module with API object for manipulation with BPI REST API.
 """
 
 from getpass import getpass
+from typing import Optional
 
-from DNA_analyser_IBP.adapters import UserAdapter
+from DNA_analyser_IBP.adapters import Transport, UserAdapter
+from DNA_analyser_IBP.cache import ResultCache
 from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.interfaces import Interfaces
 from DNA_analyser_IBP.models import User
 from DNA_analyser_IBP.ports import Ports
+from DNA_analyser_IBP.sequence_index import SequenceIndex
 from DNA_analyser_IBP.utils import Logger
 
 
@@ -26,6 +29,10 @@ class Api:
         email: str = None,
         password: str = None,
         server: str = Config.SERVER_CONFIG.PRODUCTION,
+        pool_size: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        cache_dir: Optional[str] = None,
+        cache_size: int = Config.CACHE_CONFIG.MAX_SIZE,
+        sequence_index: Optional[str] = None,
     ):
         """
         Create API object and login
@@ -34,6 +41,10 @@ class Api:
             email (str): email account registered in bioinformatics IBP
             password (str): account password
             server (str): URL to ibp bioinformatics server [Default=http://bioinformatics.ibp.cz:8888/api]
+            pool_size (int): number of kept-alive connections to server [Default=10]
+            cache_dir (Optional[str]): directory of local cache of finished results [Default=None]
+            cache_size (int): max size of local result cache in bytes [Default=2GB]
+            sequence_index (Optional[str]): SQLite file of local index of uploaded sequences used to skip duplicates [Default=None]
         """
         # retrieve data from user, default = host account if not provided in constructor
         if email is None or password is None:
@@ -42,10 +53,23 @@ class Api:
 
         Logger.info(f"User {email} is trying to login ...")
 
+        # one pooled transport shared by all adapters
+        self.__transport = Transport(pool_size=pool_size)
+
         # user
-        self.__user = UserAdapter.sign_in(User(email, password, server))
-        self.__ports = Ports(user=self.__user)
-        self.__interfaces = Interfaces(ports=self.__ports)
+        self.__user = UserAdapter.sign_in(
+            User(email, password, server), transport=self.__transport
+        )
+        self.cache = ResultCache(directory=cache_dir, max_size=cache_size)
+        self.__ports = Ports(
+            user=self.__user, transport=self.__transport, cache=self.cache
+        )
+        self.sequence_index = (
+            SequenceIndex(path=sequence_index) if sequence_index is not None else None
+        )
+        self.__interfaces = Interfaces(
+            ports=self.__ports, sequence_index=self.sequence_index
+        )
         self.tools = self.__interfaces.extras
 
         if self.__user and self.__user.is_logged_in:
@@ -0,0 +1,75 @@
+# async_api.py
+"""
+Module with asyncio API object for manipulation with BPI REST API.
+"""
+
+from DNA_analyser_IBP.adapters.async_adapters import AsyncUserAdapter
+from DNA_analyser_IBP.adapters.async_transport import AsyncTransport
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import User
+from DNA_analyser_IBP.ports.async_ports import AsyncPorts
+from DNA_analyser_IBP.utils import Logger
+
+
+class AsyncApi:
+    """
+    AsyncApi class contains awaitable methods for working with BPI REST API.
+    All calls share one pooled async HTTP client, use it as async context manager:
+
+        async with AsyncApi(email="host", password="host") as api:
+            analyses = await asyncio.gather(*[api.g4hunter.create_analyse(...) ...])
+    """
+
+    def __init__(
+        self,
+        *,
+        email: str = "host",
+        password: str = "host",
+        server: str = Config.SERVER_CONFIG.PRODUCTION,
+        pool_size: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+    ):
+        """
+        Create async API object, login is done by awaiting sign_in
+
+        Args:
+            email (str): email account registered in bioinformatics IBP [Default=host]
+            password (str): account password [Default=host]
+            server (str): URL to ibp bioinformatics server [Default=http://bioinformatics.ibp.cz:8888/api]
+            pool_size (int): max number of concurrent connections to server [Default=10]
+        """
+        self.__transport = AsyncTransport(pool_size=pool_size)
+        self.user = User(email, password, server)
+
+    def __repr__(self):
+        return f"<AsyncApi: {self.user.server} user: {self.user.email}>"
+
+    def __str__(self):
+        return f"AsyncApi: {self.user.server} user: {self.user.email}"
+
+    async def __aenter__(self) -> "AsyncApi":
+        await self.sign_in()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def sign_in(self) -> None:
+        """
+        Login user and create async ports
+        """
+        Logger.info(f"User {self.user.email} is trying to login ...")
+        self.user = await AsyncUserAdapter.sign_in(self.user, self.__transport)
+
+        ports: AsyncPorts = AsyncPorts(user=self.user, transport=self.__transport)
+        self.batch = ports.batch
+        self.sequence = ports.sequence
+        self.g4hunter = ports.g4hunter
+        self.rloopr = ports.rloopr
+        self.zdna = ports.zdna
+        self.cpg = ports.cpg
+
+    async def close(self) -> None:
+        """
+        Close all pooled connections
+        """
+        await self.__transport.close()
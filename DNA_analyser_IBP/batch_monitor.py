@@ -0,0 +1,263 @@
+# batch_monitor.py
+
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import pandas as pd
+from tqdm import tqdm
+
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.type import Types
+from DNA_analyser_IBP.utils import Logger
+
+if TYPE_CHECKING:
+    from DNA_analyser_IBP.models import Batch
+    from DNA_analyser_IBP.ports import Ports
+
+
+class BatchJob:
+    """
+    Outstanding batch tracked by BatchMonitor
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Optional[str],
+        type: str,
+        name: str,
+        sequence_id: Optional[str] = None,
+        submitted: Optional[float] = None,
+        min_interval: float = Config.MONITOR_CONFIG.MIN_INTERVAL,
+    ):
+        self.id: Optional[str] = id
+        self.type: str = type
+        self.name: str = name
+        self.sequence_id: Optional[str] = sequence_id
+        self.submitted: float = (
+            submitted if submitted is not None else time.monotonic()
+        )
+        self.status: Optional[str] = None if id is not None else BatchStatus.FAILED
+        self.progress: Optional[float] = None
+        self.polled: Optional[float] = None
+        self.elapsed: Optional[float] = None
+        self.interval: float = min_interval
+        self.next_poll: float = 0.0
+
+    def __str__(self):
+        return f"BatchJob {self.id} {self.name}"
+
+    def __repr__(self):
+        return f"<BatchJob {self.id} {self.name}>"
+
+    def is_done(self) -> bool:
+        """
+        Return if batch reached final status
+        """
+        return self.status in [BatchStatus.FINISH, BatchStatus.FAILED]
+
+    def update(
+        self,
+        *,
+        batch: "Batch",
+        now: float,
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+    ) -> None:
+        """
+        Update job from polled batch and schedule next poll
+
+        Batches which did not start yet or do not move are polled less and less often,
+        running batches are polled again around half of their estimated remaining time.
+
+        Args:
+            batch (Batch): polled batch
+            now (float): monotonic time of poll
+            min_interval (float): shortest polling interval
+            max_interval (float): longest polling interval
+            backoff (float): interval multiplier for idle batches
+        """
+        progress: Optional[float] = (
+            float(batch.progress) if batch.progress is not None else None
+        )
+        interval: float = self.interval * backoff
+
+        if batch.started and progress is not None and self.progress is not None:
+            progress_delta: float = progress - self.progress
+            if progress_delta > 0 and now > self.polled:
+                rate: float = progress_delta / (now - self.polled)
+                interval = (100 - progress) / rate / 2
+
+        self.status = batch.status
+        self.progress = progress
+        self.polled = now
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.next_poll = now + self.interval
+
+        if self.is_done():
+            self.elapsed = now - self.submitted
+
+
+class BatchMonitor:
+    """
+    Track many batches from one thread with one aggregated status bar
+    """
+
+    def __init__(
+        self,
+        ports: "Ports",
+        *,
+        description: Optional[str] = None,
+        min_interval: float = Config.MONITOR_CONFIG.MIN_INTERVAL,
+        max_interval: float = Config.MONITOR_CONFIG.MAX_INTERVAL,
+        backoff: float = Config.MONITOR_CONFIG.BACKOFF,
+    ):
+        """
+        Create batch monitor
+
+        Args:
+            ports (Ports): ports
+            description (Optional[str]): status bar description
+            min_interval (float): shortest polling interval of one batch [seconds]
+            max_interval (float): longest polling interval of one batch [seconds]
+            backoff (float): polling interval multiplier for batches without progress
+        """
+        self.__ports: "Ports" = ports
+        self.description: Optional[str] = description
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        self.jobs: List[BatchJob] = list()
+
+    def add(
+        self,
+        *,
+        id: Optional[str],
+        type: str,
+        name: str,
+        sequence_id: Optional[str] = None,
+        submitted: Optional[float] = None,
+    ) -> BatchJob:
+        """
+        Add batch to outstanding batches
+
+        Args:
+            id (Optional[str]): sequence|analyse id, None if submission failed
+            type (str): batch type e.g. Types.G4HUNTER
+            name (str): sequence|analyse name
+            sequence_id (Optional[str]): id of analysed sequence
+            submitted (Optional[float]): monotonic submission time [default=now]
+
+        Returns:
+            BatchJob: tracked job
+        """
+        job: BatchJob = BatchJob(
+            id=id,
+            type=type,
+            name=name,
+            sequence_id=sequence_id,
+            submitted=submitted,
+            min_interval=self.min_interval,
+        )
+        if job.is_done():
+            job.elapsed = time.monotonic() - job.submitted
+        self.jobs.append(job)
+        return job
+
+    def wait(self) -> pd.DataFrame:
+        """
+        Poll all outstanding batches in one loop until they finish or fail
+
+        Returns:
+            pd.DataFrame: sequence id, name, id, final status and elapsed seconds for every job
+        """
+        outstanding: List[BatchJob] = [job for job in self.jobs if not job.is_done()]
+
+        with tqdm(
+            desc=self.description or "Processing batches",
+            total=len(self.jobs),
+            initial=len(self.jobs) - len(outstanding),
+            unit=" batch",
+            ascii=True,
+        ) as statusbar:
+            while outstanding:
+                now: float = time.monotonic()
+
+                for job in [job for job in outstanding if job.next_poll <= now]:
+                    self._poll(job=job)
+                    if job.is_done():
+                        outstanding.remove(job)
+                        statusbar.update(1)
+
+                statusbar.set_postfix(self._count_statuses(), refresh=True)
+
+                if outstanding:
+                    next_poll: float = min(job.next_poll for job in outstanding)
+                    time.sleep(max(next_poll - time.monotonic(), 0))
+
+        for job in self.jobs:
+            if job.status == BatchStatus.FAILED:
+                Logger.error(self._failed_message(job=job))
+
+        return pd.DataFrame(
+            data=[
+                [job.sequence_id, job.name, job.id, job.status, job.elapsed]
+                for job in self.jobs
+            ],
+            columns=["sequence_id", "name", "id", "status", "elapsed"],
+        )
+
+    def _poll(self, *, job: BatchJob) -> None:
+        """
+        Get batch status of one job
+
+        Args:
+            job (BatchJob): polled job
+        """
+        try:
+            batch: "Batch" = self.__ports.batch.get_batch_status(
+                id=job.id, type=job.type
+            )
+        except Exception as e:
+            Logger.error(f"Batch {job.name} cannot be checked: {e}")
+            job.status = BatchStatus.FAILED
+            job.elapsed = time.monotonic() - job.submitted
+            return
+
+        job.update(
+            batch=batch,
+            now=time.monotonic(),
+            min_interval=self.min_interval,
+            max_interval=self.max_interval,
+            backoff=self.backoff,
+        )
+
+    def _count_statuses(self) -> Dict[str, int]:
+        """
+        Count jobs by their last known status
+
+        Returns:
+            Dict[str, int]: status counts
+        """
+        counts: Dict[str, int] = dict()
+        for job in self.jobs:
+            status: str = job.status or BatchStatus.CREATED
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    @staticmethod
+    def _failed_message(*, job: BatchJob) -> str:
+        """
+        Return error message for failed job
+
+        Args:
+            job (BatchJob): failed job
+
+        Returns:
+            str: error message
+        """
+        if job.type == Types.SEQUENCE:
+            return f"Uploading sequence {job.name} failed!"
+        return f"Analyse {job.name} failed!"
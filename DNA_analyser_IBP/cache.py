@@ -0,0 +1,287 @@
+# cache.py
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.sqlite_store import SQLiteStore
+from DNA_analyser_IBP.utils import Logger
+
+
+class ToolResults(SQLiteStore):
+    """
+    SQLite table of memoized tool results e.g. P53 predictions keyed by sequence
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS tool_results (
+            tool TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (tool, key)
+        );
+    """
+
+    def get(self, *, tool: str, keys: List[str]) -> Dict[str, dict]:
+        """
+        Return stored results of found keys
+
+        Args:
+            tool (str): tool name
+            keys (List[str]): result keys
+
+        Returns:
+            Dict[str, dict]: stored results of found keys
+        """
+        results: Dict[str, dict] = dict()
+
+        # SQLite limits number of query parameters
+        for start in range(0, len(keys), 500):
+            chunk: List[str] = keys[start : start + 500]
+            placeholders: str = ", ".join("?" * len(chunk))
+            rows: List[Tuple[str, str]] = self._fetch(
+                "SELECT key, value FROM tool_results "
+                f"WHERE tool = ? AND key IN ({placeholders})",
+                (tool, *chunk),
+            )
+            results.update((key, json.loads(value)) for key, value in rows)
+
+        return results
+
+    def set(self, *, tool: str, results: Dict[str, dict]) -> None:
+        """
+        Store JSON serializable results by key
+
+        Args:
+            tool (str): tool name
+            results (Dict[str, dict]): JSON serializable results by key
+        """
+        self._execute_many(
+            "INSERT OR REPLACE INTO tool_results (tool, key, value) VALUES (?, ?, ?)",
+            [(tool, key, json.dumps(value)) for key, value in results.items()],
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all stored results
+        """
+        self._execute("DELETE FROM tool_results")
+
+
+class ResultCache:
+    """
+    Local on-disk cache of finished analyse results, least recently used files are evicted
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Optional[str] = None,
+        max_size: int = Config.CACHE_CONFIG.MAX_SIZE,
+    ) -> None:
+        """
+        Create result cache, cache is disabled without directory
+
+        Args:
+            directory (Optional[str]): cache directory [Default=None]
+            max_size (int): max size of all cached files in bytes
+        """
+        self.directory: Optional[str] = directory
+        self.max_size: int = max_size
+        # tool results are memoized in SQLite, in memory without directory
+        self.__tools: Optional[ToolResults] = None
+        self.__tools_lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"<ResultCache directory: {self.directory} max_size: {self.max_size}>"
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    @staticmethod
+    def get_key(*, id: str, endpoint: str, **params) -> str:
+        """
+        Create cache key from analyse id, endpoint and request parameters
+
+        Args:
+            id (str): analyse id
+            endpoint (str): analyse result endpoint
+            **params: request parameters e.g. aggregate, segments
+
+        Returns:
+            str: cache key
+        """
+        data: str = json.dumps(
+            {"id": id, "endpoint": endpoint, "params": params}, sort_keys=True
+        )
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{Config.CACHE_CONFIG.FILE_SUFFIX}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return cached value and mark it as recently used
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            Optional[Any]: cached value or None if value is not cached
+        """
+        path: str = self._get_path(key)
+
+        try:
+            with open(path, "rb") as cache_file:
+                value: Any = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # broken or incompatible file is dropped and loaded again
+            os.remove(path)
+            return None
+
+        os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value and evict least recently used values over max size
+
+        Args:
+            key (str): cache key
+            value (Any): picklable value
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory)
+
+        with os.fdopen(file_descriptor, "wb") as cache_file:
+            pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self._get_path(key))
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used files until cache fits into max size
+        """
+        files: List[Tuple[float, int, str]] = list()
+
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(Config.CACHE_CONFIG.FILE_SUFFIX):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size: int = sum(file_size for _, file_size, _ in files)
+
+        for _, file_size, path in sorted(files):
+            if size <= self.max_size:
+                break
+            os.remove(path)
+            size -= file_size
+
+    def _get_tools(self) -> ToolResults:
+        """
+        Open tool result table on first use
+
+        Returns:
+            ToolResults: tool result table
+        """
+        with self.__tools_lock:
+            if self.__tools is None:
+                self.__tools = ToolResults(
+                    path=os.path.join(self.directory, Config.CACHE_CONFIG.TOOL_FILE)
+                    if self.enabled
+                    else ":memory:"
+                )
+            return self.__tools
+
+    def get_tool_results(self, *, tool: str, keys: List[str]) -> Dict[str, dict]:
+        """
+        Return memoized tool results e.g. P53 predictions keyed by sequence
+
+        Args:
+            tool (str): tool name
+            keys (List[str]): result keys
+
+        Returns:
+            Dict[str, dict]: stored results of found keys
+        """
+        return self._get_tools().get(tool=tool, keys=keys)
+
+    def set_tool_results(self, *, tool: str, results: Dict[str, dict]) -> None:
+        """
+        Store tool results, results are never evicted
+
+        Args:
+            tool (str): tool name
+            results (Dict[str, dict]): JSON serializable results by key
+        """
+        self._get_tools().set(tool=tool, results=results)
+
+    def clear(self) -> None:
+        """
+        Remove all cached values
+        """
+        if self.__tools is not None:
+            self.__tools.clear()
+
+        if not self.enabled:
+            return
+
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(Config.CACHE_CONFIG.FILE_SUFFIX):
+                    os.remove(entry.path)
+
+    def load(
+        self,
+        *,
+        id: str,
+        endpoint: str,
+        loader: Callable[[], Any],
+        is_finished: Callable[[], bool],
+        use_cache: bool = True,
+        **params,
+    ) -> Any:
+        """
+        Return cached result or load it, only results of finished analyses are stored
+
+        Args:
+            id (str): analyse id
+            endpoint (str): analyse result endpoint
+            loader (Callable[[], Any]): function loading result from server
+            is_finished (Callable[[], bool]): function checking if analyse is finished
+            use_cache (bool): False = bypass cache and always load from server
+            **params: request parameters e.g. aggregate, segments
+
+        Returns:
+            Any: analyse result
+        """
+        if not self.enabled or not use_cache:
+            return loader()
+
+        key: str = self.get_key(id=id, endpoint=endpoint, **params)
+        value: Optional[Any] = self.get(key)
+
+        if value is not None:
+            Logger.info(f"Analyse {id} result loaded from cache ...")
+            return value
+
+        # finished is checked before loading, so stored result is always complete
+        finished: bool = is_finished()
+        value = loader()
+
+        if finished and value is not None:
+            self.set(key, value)
+
+        return value
@@ -57,6 +57,103 @@ class TenacityConfig:
     STOP = stop_after_attempt(5)
 
 
+class TransportConfig:
+    """
+    HTTP transport config
+    """
+
+    POOL_SIZE: int = 10
+    POOL_CONNECTIONS: int = 1
+    TIMEOUT: float = 60.0
+    # missing endpoint or format, validation errors as 400 and 422 are raised
+    UNSUPPORTED_STATUS_CODES: tuple = (404, 405, 415)
+
+
+class ResultConfig:
+    """
+    Paged result loading config
+    """
+
+    CHUNK_SIZE: int = 50000
+    FIRST_PAGE: int = 0
+
+
+class CacheConfig:
+    """
+    Local result cache config
+    """
+
+    MAX_SIZE: int = 2 * 1024 ** 3
+    FILE_SUFFIX: str = ".pickle"
+    TOOL_FILE: str = "tools.sqlite"
+    # tool results are committed in batches, so long runs keep finished results after crash
+    TOOL_COMMIT_SIZE: int = 1000
+
+
+class DataConfig:
+    """
+    Sequence data loading config
+    """
+
+    WINDOW_SIZE: int = 1000
+
+
+class FastaConfig:
+    """
+    FASTA parsing config
+    """
+
+    BLOCK_SIZE: int = 4 * 1024 ** 2
+    INDEX_SUFFIX: str = ".fai"
+
+
+class UploadConfig:
+    """
+    Streamed sequence file upload config
+    """
+
+    BLOCK_SIZE: int = 1024 ** 2
+    COMPRESS_LEVEL: int = 6
+
+
+class NcbiConfig:
+    """
+    NCBI import config
+    """
+
+    BATCH_SIZE: int = 10
+
+
+class EngineConfig:
+    """
+    Local analyse engines config
+    """
+
+    G4KILLER_BATCH_SIZE: int = 256
+    # server scores are compared with local scores up to this difference
+    SCORE_TOLERANCE: float = 0.01
+
+
+class P53Config:
+    """
+    P53 predictor scan config
+    """
+
+    WINDOW_SIZE: int = 20
+    HALF_SITE: str = "RRRCWWGYYY"
+    SCAN_BATCH_SIZE: int = 10000
+
+
+class MonitorConfig:
+    """
+    Batch monitor polling config [seconds]
+    """
+
+    MIN_INTERVAL: float = 0.5
+    MAX_INTERVAL: float = 30.0
+    BACKOFF: float = 1.5
+
+
 class Config:
     """
     Connector urls
@@ -67,3 +164,13 @@ class Config:
     EXTRAS_CONFIG: ExtrasConfig = ExtrasConfig()
     BATCH_CONFIG: BatchConfig = BatchConfig()
     TENACITY_CONFIG: TenacityConfig = TenacityConfig()
+    TRANSPORT_CONFIG: TransportConfig = TransportConfig()
+    MONITOR_CONFIG: MonitorConfig = MonitorConfig()
+    RESULT_CONFIG: ResultConfig = ResultConfig()
+    CACHE_CONFIG: CacheConfig = CacheConfig()
+    FASTA_CONFIG: FastaConfig = FastaConfig()
+    DATA_CONFIG: DataConfig = DataConfig()
+    UPLOAD_CONFIG: UploadConfig = UploadConfig()
+    NCBI_CONFIG: NcbiConfig = NcbiConfig()
+    ENGINE_CONFIG: EngineConfig = EngineConfig()
+    P53_CONFIG: P53Config = P53Config()
@@ -0,0 +1,28 @@
+from DNA_analyser_IBP.engines.g4hunter import (
+    find_quadruplexes,
+    g4hunter_base_scores,
+    g4hunter_matrix_sums,
+    g4hunter_window_sums,
+)
+from DNA_analyser_IBP.engines.g4killer import kill_quadruplexes
+from DNA_analyser_IBP.engines.p53 import half_site_mismatches, iter_p53_windows
+from DNA_analyser_IBP.engines.zdna import (
+    encode_dinucleotides,
+    find_zdna,
+    sweep_zdna,
+    zdna_parameters,
+)
+
+__all__ = [
+    "encode_dinucleotides",
+    "find_quadruplexes",
+    "find_zdna",
+    "g4hunter_base_scores",
+    "g4hunter_matrix_sums",
+    "g4hunter_window_sums",
+    "half_site_mismatches",
+    "iter_p53_windows",
+    "kill_quadruplexes",
+    "sweep_zdna",
+    "zdna_parameters",
+]
@@ -0,0 +1,209 @@
+# g4hunter.py
+
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from DNA_analyser_IBP.result_schemas import (
+    ResultSchema,
+    decode_result,
+    empty_result,
+)
+
+# max score of one base, runs longer than 4 G|C score as 4
+MAX_RUN_SCORE: int = 4
+
+G4HUNTER_COLUMNS: List[str] = [
+    "id",
+    "position",
+    "length",
+    "score",
+    "absScore",
+    "sequence",
+    "subScoreList",
+]
+
+
+def _as_codes(sequence: Union[str, bytes, bytearray, memoryview]) -> np.ndarray:
+    """
+    Return upper cased ASCII codes of sequence
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+
+    Returns:
+        np.ndarray: uint8 codes
+    """
+    data: bytes = (
+        sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    )
+    return np.frombuffer(data.upper(), dtype=np.uint8)
+
+
+def _run_scores(mask: np.ndarray) -> np.ndarray:
+    """
+    Return length of run every masked base belongs to, capped to MAX_RUN_SCORE
+
+    Args:
+        mask (np.ndarray): bool mask of G|C bases
+
+    Returns:
+        np.ndarray: int8 run score of every base, 0 for unmasked bases
+    """
+    edges: np.ndarray = np.flatnonzero(
+        np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+    )
+    starts, ends = edges[::2], edges[1::2]
+    scores: np.ndarray = np.zeros(len(mask), dtype=np.int8)
+    # masked bases are in run order, so each run length is repeated over its bases
+    scores[mask] = np.repeat(np.minimum(ends - starts, MAX_RUN_SCORE), ends - starts)
+    return scores
+
+
+def g4hunter_base_scores(
+    sequence: Union[str, bytes, bytearray, memoryview]
+) -> np.ndarray:
+    """
+    Return G4Hunter score of every base, G runs score 1-4 by run length, C runs -1 to -4
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+
+    Returns:
+        np.ndarray: int8 base scores
+    """
+    codes: np.ndarray = _as_codes(sequence)
+    return _run_scores(codes == ord("G")) - _run_scores(codes == ord("C"))
+
+
+def _matrix_run_sums(mask: np.ndarray) -> np.ndarray:
+    """
+    Return sum of run scores of every row, run of length L adds L * min(L, 4)
+
+    Args:
+        mask (np.ndarray): 2D bool mask of G|C bases
+
+    Returns:
+        np.ndarray: int64 sum of every row
+    """
+    columns: np.ndarray = np.arange(mask.shape[1])
+    # length of run up to every column is distance from last unmasked column
+    last_reset: np.ndarray = np.maximum.accumulate(
+        np.where(mask, -1, columns), axis=1
+    )
+    run_lengths: np.ndarray = (columns - last_reset).astype(np.int64)
+    run_ends: np.ndarray = mask & ~np.pad(
+        mask[:, 1:], ((0, 0), (0, 1)), constant_values=False
+    )
+    return np.where(
+        run_ends, run_lengths * np.minimum(run_lengths, MAX_RUN_SCORE), 0
+    ).sum(axis=1)
+
+
+def g4hunter_matrix_sums(codes: np.ndarray) -> np.ndarray:
+    """
+    Return sum of G4Hunter base scores of every row, rows are scored at once
+    so many equally long sequences can be compared without python loop
+
+    Args:
+        codes (np.ndarray): 2D uint8 upper cased ASCII codes, one sequence per row
+
+    Returns:
+        np.ndarray: int64 score sum of every row
+    """
+    return _matrix_run_sums(codes == ord("G")) - _matrix_run_sums(codes == ord("C"))
+
+
+def _cumulative_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Return cumulative sum of base scores starting with 0, so sum of scores[i:j]
+    is cumulative[j] - cumulative[i]
+
+    Args:
+        scores (np.ndarray): base scores
+
+    Returns:
+        np.ndarray: int64 cumulative sums
+    """
+    return np.concatenate(([0], np.cumsum(scores, dtype=np.int64)))
+
+
+def g4hunter_window_sums(scores: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Return sum of base scores in every window from cumulative sum
+
+    Args:
+        scores (np.ndarray): base scores
+        window_size (int): window size
+
+    Returns:
+        np.ndarray: int64 window sums, one for every window start
+    """
+    cumulative: np.ndarray = _cumulative_scores(scores)
+    return cumulative[window_size:] - cumulative[:-window_size]
+
+
+def find_quadruplexes(
+    *,
+    sequence: Union[str, bytes, bytearray, memoryview],
+    threshold: float,
+    window_size: int,
+) -> pd.DataFrame:
+    """
+    Find potential quadruplexes, consecutive windows with the same sign and absolute mean
+    score above threshold are merged into one quadruplex
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+        threshold (float): g4hunter threshold recommended 1.2
+        window_size (int): g4hunter window size recommended 25
+
+    Returns:
+        pd.DataFrame: quadruplexes with the same columns as server results, 0-based positions
+    """
+    if not (0 <= threshold <= 4 and 10 <= window_size <= 100):
+        raise ValueError("Value window size or threshold out of range!")
+
+    data: bytes = (
+        sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    ).upper()
+    scores: np.ndarray = g4hunter_base_scores(data)
+
+    if len(scores) < window_size:
+        return empty_result(columns=G4HUNTER_COLUMNS, schema=ResultSchema.G4HUNTER)
+
+    cumulative: np.ndarray = _cumulative_scores(scores)
+    sums: np.ndarray = cumulative[window_size:] - cumulative[:-window_size]
+    # compare integer sums, mean scores exactly on threshold are kept
+    hits: np.ndarray = np.flatnonzero(np.abs(sums) >= threshold * window_size - 1e-9)
+
+    if not len(hits):
+        return empty_result(columns=G4HUNTER_COLUMNS, schema=ResultSchema.G4HUNTER)
+
+    breaks: np.ndarray = (
+        np.flatnonzero((np.diff(hits) != 1) | (np.diff(np.sign(sums[hits])) != 0))
+        + 1
+    )
+    results: List[dict] = list()
+
+    for index, (start, end) in enumerate(
+        zip(np.concatenate(([0], breaks)), np.concatenate((breaks, [len(hits)])))
+    ):
+        first, last = int(hits[start]), int(hits[end - 1])
+        length: int = last - first + window_size
+        score: float = float(cumulative[first + length] - cumulative[first]) / length
+
+        results.append(
+            {
+                "id": index + 1,
+                "position": first,
+                "length": length,
+                "score": score,
+                "absScore": abs(score),
+                "sequence": data[first : first + length].decode("ascii"),
+                "subScoreList": (sums[first : last + 1] / window_size).tolist(),
+            }
+        )
+
+    return decode_result(response=results, schema=ResultSchema.G4HUNTER)
@@ -0,0 +1,210 @@
+# g4killer.py
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.engines.g4hunter import MAX_RUN_SCORE, g4hunter_matrix_sums
+
+# bases mutated G|C base can be replaced with, ties are resolved in this order
+REPLACEMENTS: Dict[str, str] = {"G": "ACT", "C": "AGT"}
+# padding of shorter sequences, N does not change G4Hunter score
+PADDING: int = ord("N")
+
+
+def _to_matrix(sequences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack sequences into one padded matrix
+
+    Args:
+        sequences (List[str]): upper cased sequences
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: uint8 matrix with one sequence per row and sequence lengths
+    """
+    lengths: np.ndarray = np.array([len(sequence) for sequence in sequences])
+    matrix: np.ndarray = np.full(
+        (len(sequences), lengths.max(initial=0)), PADDING, dtype=np.uint8
+    )
+    for row, sequence in enumerate(sequences):
+        matrix[row, : len(sequence)] = np.frombuffer(
+            sequence.encode("ascii"), dtype=np.uint8
+        )
+    return matrix, lengths
+
+
+def _run_score(lengths: np.ndarray) -> np.ndarray:
+    """
+    Return score of runs with given lengths, run of length L scores L * min(L, 4)
+    """
+    return lengths * np.minimum(lengths, MAX_RUN_SCORE)
+
+
+def _run_lengths(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return length of run ending just before and starting just after every column
+
+    Args:
+        mask (np.ndarray): 2D bool mask of G|C bases
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: int64 left and right run lengths
+    """
+    columns: np.ndarray = np.arange(mask.shape[1])
+    forward: np.ndarray = columns - np.maximum.accumulate(
+        np.where(mask, -1, columns), axis=1
+    )
+    flipped: np.ndarray = mask[:, ::-1]
+    backward: np.ndarray = (
+        columns - np.maximum.accumulate(np.where(flipped, -1, columns), axis=1)
+    )[:, ::-1]
+
+    return (
+        np.pad(forward[:, :-1], ((0, 0), (1, 0))).astype(np.int64),
+        np.pad(backward[:, 1:], ((0, 0), (0, 1))).astype(np.int64),
+    )
+
+
+def _kill_batch(
+    *, sequences: List[str], threshold: float, complementary: bool
+) -> List[dict]:
+    """
+    Greedy G4Killer search of one batch, every step applies single mutation with the
+    lowest resulting score to all sequences still above threshold at once
+
+    Mutation of one base changes only its own run and runs it can join, so score change
+    of every candidate mutation is computed from run lengths around it without rescoring.
+
+    Args:
+        sequences (List[str]): upper cased sequences
+        threshold (float): target g4hunter score
+        complementary (bool): True = mutate C bases, False = mutate G bases
+
+    Returns:
+        List[dict]: G4Killer results in order of sequences
+    """
+    # objective is score of mutated strand, G strand score or negated C strand score
+    sign: int = -1 if complementary else 1
+    target, other = ("C", "G") if complementary else ("G", "C")
+    replacements: np.ndarray = np.frombuffer(
+        REPLACEMENTS[target].encode("ascii"), dtype=np.uint8
+    )
+    # replacement by opposite base can join its neighbouring runs
+    joins: np.ndarray = replacements == ord(other)
+
+    current, lengths = _to_matrix(sequences)
+    origin_sums: np.ndarray = g4hunter_matrix_sums(current)
+    sums: np.ndarray = origin_sums.copy()
+    # scores are compared as integer sums, so ties are exact
+    limits: np.ndarray = threshold * lengths + 1e-9
+    changes: np.ndarray = np.zeros(len(sequences), dtype=np.int64)
+    variants: List[List[str]] = [list() for _ in sequences]
+    active: np.ndarray = np.flatnonzero(sign * sums > limits)
+
+    while len(active):
+        codes: np.ndarray = current[active]
+        targets: np.ndarray = codes == ord(target)
+        left, right = _run_lengths(targets)
+        other_left, other_right = _run_lengths(codes == ord(other))
+
+        split: np.ndarray = (
+            _run_score(left) + _run_score(right) - _run_score(left + 1 + right)
+        )
+        join: np.ndarray = (
+            _run_score(other_left + 1 + other_right)
+            - _run_score(other_left)
+            - _run_score(other_right)
+        )
+        # objective change of every position and replacement, positions x replacements
+        deltas: np.ndarray = split[:, :, None] - join[:, :, None] * joins
+        deltas = np.where(targets[:, :, None], deltas, np.iinfo(np.int64).max)
+        deltas = deltas.reshape(len(active), -1)
+
+        # first candidate is the lowest position and replacement in REPLACEMENTS order
+        best: np.ndarray = deltas.argmin(axis=1)
+        movable: np.ndarray = targets.any(axis=1)
+        if not movable.any():
+            break
+
+        active, deltas, best = active[movable], deltas[movable], best[movable]
+        best_deltas: np.ndarray = deltas[np.arange(len(active)), best]
+        positions, bases = np.divmod(best, len(replacements))
+        previous: np.ndarray = current[active, positions]
+
+        current[active, positions] = replacements[bases]
+        sums[active] += sign * best_deltas
+        changes[active] += 1
+
+        done: np.ndarray = sign * sums[active] <= limits[active]
+        for index in np.flatnonzero(done):
+            row: int = active[index]
+            # restore last mutation and list all equally scored alternatives
+            current[row, positions[index]] = previous[index]
+            variants[row] = list()
+            for candidate in np.flatnonzero(deltas[index] == best_deltas[index]):
+                position, base = divmod(candidate, len(replacements))
+                mutated: np.ndarray = current[row, : lengths[row]].copy()
+                mutated[position] = replacements[base]
+                variants[row].append(mutated.tobytes().decode("ascii"))
+            current[row, positions[index]] = replacements[bases[index]]
+
+        active = active[~done]
+
+    return [
+        {
+            "originSequence": sequence,
+            "originScore": float(origin_sums[row] / lengths[row]),
+            "mutationScore": float(sums[row] / lengths[row]),
+            "changeCount": int(changes[row]),
+            "mutationSequences": variants[row],
+            "onComplementary": complementary,
+            "targetThreshold": threshold,
+        }
+        for row, sequence in enumerate(sequences)
+    ]
+
+
+def kill_quadruplexes(
+    *,
+    sequences: List[str],
+    threshold: float,
+    complementary: bool = False,
+    batch_size: int = Config.ENGINE_CONFIG.G4KILLER_BATCH_SIZE,
+) -> List[dict]:
+    """
+    Find minimal number of G (C on complementary) mutations lowering G4Hunter score
+    of whole sequence to threshold, all equally scored final sequences are returned
+
+    Args:
+        sequences (List[str]): origin sequences
+        threshold (float): target g4hunter score in interval <0;4>
+        complementary (bool): True if use for C sequence False for G sequence [default=False]
+        batch_size (int): number of sequences searched at once [default=256]
+
+    Returns:
+        List[dict]: G4Killer results with server response keys in order of sequences
+    """
+    if not 0 <= threshold <= 4:
+        raise ValueError("Value threshold out of interval <0;4>!")
+    if not all(sequences):
+        raise ValueError("Sequences cannot be empty!")
+
+    upper: List[str] = [sequence.upper() for sequence in sequences]
+    # similar lengths in one batch keep padding small
+    order: List[int] = sorted(range(len(upper)), key=lambda index: len(upper[index]))
+    results: List[dict] = [dict() for _ in upper]
+
+    for start in range(0, len(order), batch_size):
+        batch: List[int] = order[start : start + batch_size]
+        for index, result in zip(
+            batch,
+            _kill_batch(
+                sequences=[upper[index] for index in batch],
+                threshold=threshold,
+                complementary=complementary,
+            ),
+        ):
+            results[index] = result
+
+    return results
@@ -0,0 +1,118 @@
+# p53.py
+
+from typing import Dict, Generator, Iterable, Tuple, Union
+
+import numpy as np
+
+from DNA_analyser_IBP.config import Config
+
+# IUPAC nucleotide codes used in response element patterns
+IUPAC: Dict[str, str] = {
+    "A": "A",
+    "C": "C",
+    "G": "G",
+    "T": "T",
+    "R": "AG",
+    "Y": "CT",
+    "W": "AT",
+    "S": "CG",
+    "K": "GT",
+    "M": "AC",
+    "N": "ACGT",
+}
+# whitespace is not part of nucleotide data
+WHITESPACE: bytes = b" \t\r\n"
+
+
+def _pattern_table(pattern: str) -> np.ndarray:
+    """
+    Return table of allowed ASCII codes for every pattern position
+
+    Args:
+        pattern (str): IUPAC pattern e.g. RRRCWWGYYY
+
+    Returns:
+        np.ndarray: bool table [pattern length x 256]
+    """
+    table: np.ndarray = np.zeros((len(pattern), 256), dtype=bool)
+    for index, code in enumerate(pattern.upper()):
+        for nucleotide in IUPAC[code]:
+            table[index, ord(nucleotide)] = True
+    return table
+
+
+def half_site_mismatches(
+    codes: np.ndarray, pattern: str = Config.P53_CONFIG.HALF_SITE
+) -> np.ndarray:
+    """
+    Return number of mismatches against half-site pattern for every start position
+
+    Args:
+        codes (np.ndarray): uint8 upper cased ASCII codes
+        pattern (str): IUPAC half-site pattern [default=RRRCWWGYYY]
+
+    Returns:
+        np.ndarray: int8 mismatch count of every position where pattern fits
+    """
+    table: np.ndarray = _pattern_table(pattern)
+    count: int = len(codes) - len(pattern) + 1
+    mismatches: np.ndarray = np.zeros(max(count, 0), dtype=np.int8)
+
+    for index in range(len(pattern)):
+        mismatches += ~table[index][codes[index : index + count]]
+    return mismatches
+
+
+def iter_p53_windows(
+    *,
+    chunks: Iterable[Union[str, bytes, bytearray, memoryview]],
+    step: int = 1,
+    mismatches: int = 0,
+    window_size: int = Config.P53_CONFIG.WINDOW_SIZE,
+    pattern: str = Config.P53_CONFIG.HALF_SITE,
+) -> Generator[Tuple[int, str], None, None]:
+    """
+    Yield windows of streamed sequence containing at least one half-site, windows
+    crossing chunk borders are yielded once
+
+    Args:
+        chunks (Iterable[Union[str, bytes, bytearray, memoryview]]): sequence data blocks
+        step (int): distance of window starts [default=1]
+        mismatches (int): max mismatches of half-site [default=0]
+        window_size (int): window length [default=20]
+        pattern (str): IUPAC half-site pattern [default=RRRCWWGYYY]
+
+    Returns:
+        Generator[Tuple[int, str], None, None]: 0-based window position and upper cased window
+    """
+    # window passes if half-site starts at one of its first window_size - pattern + 1 bases
+    span: int = window_size - len(pattern) + 1
+    carry: bytes = bytes()
+    offset: int = 0
+
+    for chunk in chunks:
+        block: bytes = (
+            chunk.encode("ascii") if isinstance(chunk, str) else bytes(chunk)
+        ).translate(None, WHITESPACE)
+        data: bytes = carry + block.upper()
+
+        if len(data) < window_size:
+            carry = data
+            continue
+
+        hits: np.ndarray = (
+            half_site_mismatches(np.frombuffer(data, dtype=np.uint8), pattern)
+            <= mismatches
+        )
+        cumulative: np.ndarray = np.concatenate(([0], np.cumsum(hits)))
+        starts: np.ndarray = np.arange(len(data) - window_size + 1)
+        passed: np.ndarray = (cumulative[starts + span] - cumulative[starts] > 0) & (
+            (offset + starts) % step == 0
+        )
+
+        for start in np.flatnonzero(passed):
+            yield offset + int(start), data[start : start + window_size].decode("ascii")
+
+        # last window_size - 1 bases start windows continuing in next chunk
+        offset += len(data) - window_size + 1
+        carry = data[len(data) - window_size + 1 :]
@@ -0,0 +1,299 @@
+# zdna.py
+
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from DNA_analyser_IBP.result_schemas import (
+    ResultSchema,
+    decode_result,
+    empty_result,
+)
+
+# default scores of server prediction models
+MODEL_DEFAULTS: Dict[str, Dict[str, float]] = {
+    "model1": {
+        "GC_score": 25,
+        "GTAC_score": 3,
+        "AT_score": 0,
+        "oth_score": 0,
+        "min_score_percentage": 12,
+    },
+    "model2": {
+        "GC_score": 2,
+        "GTAC_score": 1,
+        "AT_score": 0.5,
+        "oth_score": 0,
+        "min_score_percentage": 50,
+    },
+}
+ZDNA_COLUMNS: List[str] = list(ResultSchema.ZDNA.keys())
+
+# dinucleotide classes, index into score table
+GC, GTAC, AT, OTHER = range(4)
+DINUCLEOTIDES: Dict[str, int] = {
+    "GC": GC,
+    "CG": GC,
+    "GT": GTAC,
+    "TG": GTAC,
+    "AC": GTAC,
+    "CA": GTAC,
+    "AT": AT,
+    "TA": AT,
+}
+
+
+def _class_table() -> np.ndarray:
+    """
+    Return dinucleotide class of every pair of ASCII codes, pairs not alternating
+    purine and pyrimidine (and pairs with N) are OTHER
+
+    Returns:
+        np.ndarray: int8 table [256 x 256]
+    """
+    table: np.ndarray = np.full((256, 256), OTHER, dtype=np.int8)
+    for pair, code in DINUCLEOTIDES.items():
+        table[ord(pair[0]), ord(pair[1])] = code
+    return table
+
+
+CLASS_TABLE: np.ndarray = _class_table()
+
+
+def zdna_parameters(
+    *,
+    model: Optional[Union[str, List[str]]] = "model1",
+    GC_score: Optional[float] = None,
+    GTAC_score: Optional[float] = None,
+    AT_score: Optional[float] = None,
+    oth_score: Optional[float] = None,
+    min_score_percentage: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Return scores of model, scores given explicitly override model defaults
+
+    Args:
+        model (Optional[Union[str, List[str]]]): model1|model2, "1"|"2" or list with one of them [default=model1]
+        GC_score (Optional[float]): score for the GC pair [default=model]
+        GTAC_score (Optional[float]): score for the GT or AC pair [default=model]
+        AT_score (Optional[float]): score for the AT pair [default=model]
+        oth_score (Optional[float]): score for the other pairs [default=model]
+        min_score_percentage (Optional[float]): minimum window score in % of max score [default=model]
+
+    Returns:
+        Dict[str, float]: GC_score, GTAC_score, AT_score, oth_score and min_score_percentage
+    """
+    name: str = (model[0] if model else "model1") if isinstance(model, list) else model
+    name = f"model{name}" if name in ["1", "2"] else name or "model1"
+    if name not in MODEL_DEFAULTS:
+        raise ValueError(f"Model {name} could not be resolved!")
+
+    given: Dict[str, Optional[float]] = {
+        "GC_score": GC_score,
+        "GTAC_score": GTAC_score,
+        "AT_score": AT_score,
+        "oth_score": oth_score,
+        "min_score_percentage": min_score_percentage,
+    }
+    return {
+        key: value if value is not None else MODEL_DEFAULTS[name][key]
+        for key, value in given.items()
+    }
+
+
+def encode_dinucleotides(
+    sequence: Union[str, bytes, bytearray, memoryview]
+) -> np.ndarray:
+    """
+    Return dinucleotide class of every step between neighbouring bases, encoding
+    does not depend on scores so it is reused for every scored parameter set
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+
+    Returns:
+        np.ndarray: int8 classes GC|GTAC|AT|OTHER, one shorter than sequence
+    """
+    data: bytes = (
+        sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    )
+    codes: np.ndarray = np.frombuffer(data.upper(), dtype=np.uint8)
+    return CLASS_TABLE[codes[:-1], codes[1:]]
+
+
+def _find_regions(
+    *,
+    data: bytes,
+    classes: np.ndarray,
+    min_sequence_size: int,
+    GC_score: float,
+    GTAC_score: float,
+    AT_score: float,
+    oth_score: float,
+    min_score_percentage: float,
+) -> List[dict]:
+    """
+    Find Z-DNA regions in encoded sequence, overlapping windows with score above
+    min_score_percentage of max (all GC) score are merged into one region
+
+    Args:
+        data (bytes): upper cased sequence
+        classes (np.ndarray): dinucleotide classes of sequence
+        min_sequence_size (int): window length in bases
+        GC_score (float): score for the GC pair
+        GTAC_score (float): score for the GT or AC pair
+        AT_score (float): score for the AT pair
+        oth_score (float): score for the other pairs
+        min_score_percentage (float): minimum window score in % of max score
+
+    Returns:
+        List[dict]: regions with 0-based position, length, score sum and sequence
+    """
+    # window of N bases has N - 1 dinucleotide steps
+    steps: int = min_sequence_size - 1
+    if len(classes) < steps:
+        return list()
+
+    scores: np.ndarray = np.array(
+        [GC_score, GTAC_score, AT_score, oth_score], dtype=np.float64
+    )[classes]
+    cumulative: np.ndarray = np.concatenate(([0.0], np.cumsum(scores)))
+    sums: np.ndarray = cumulative[steps:] - cumulative[:-steps]
+    hits: np.ndarray = np.flatnonzero(
+        sums >= min_score_percentage / 100 * steps * GC_score - 1e-9
+    )
+
+    if not len(hits):
+        return list()
+
+    # windows starting within one window length overlap
+    breaks: np.ndarray = np.flatnonzero(np.diff(hits) >= min_sequence_size) + 1
+    firsts: np.ndarray = hits[np.concatenate(([0], breaks))]
+    lasts: np.ndarray = hits[np.concatenate((breaks, [len(hits)])) - 1]
+    lengths: np.ndarray = lasts - firsts + min_sequence_size
+    totals: np.ndarray = cumulative[firsts + lengths - 1] - cumulative[firsts]
+
+    return [
+        {
+            "position": int(first),
+            "length": int(length),
+            "score": float(total),
+            "sequence": data[first : first + length].decode("ascii"),
+        }
+        for first, length, total in zip(firsts, lengths, totals)
+    ]
+
+
+def _validate(parameters: Dict[str, float], min_sequence_size: int) -> None:
+    """
+    Raise ValueError for parameters rejected by server
+    """
+    if not (
+        min_sequence_size >= 6
+        and parameters["GC_score"] >= 0.1
+        and parameters["GTAC_score"] >= 0
+        and parameters["AT_score"] >= 0
+        and parameters["min_score_percentage"] >= 12
+    ):
+        raise ValueError("Parameters out of permitted range!")
+
+
+def find_zdna(
+    *,
+    sequence: Union[str, bytes, bytearray, memoryview],
+    min_sequence_size: int = 10,
+    model: Optional[Union[str, List[str]]] = "model1",
+    GC_score: Optional[float] = None,
+    GTAC_score: Optional[float] = None,
+    AT_score: Optional[float] = None,
+    oth_score: Optional[float] = None,
+    min_score_percentage: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Find potential Z-DNA regions, every dinucleotide step is scored by model and windows
+    of min_sequence_size bases with score above min_score_percentage of max score are merged
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+        min_sequence_size (int): minimal length of searched sequences, minimum 6 [default=10]
+        model (Optional[Union[str, List[str]]]): model1|model2 providing default scores [default=model1]
+        GC_score (Optional[float]): score for the GC pair, minimum 0.1 [default=model]
+        GTAC_score (Optional[float]): score for the GT or AC pair, minimum 0 [default=model]
+        AT_score (Optional[float]): score for the AT pair, minimum 0 [default=model]
+        oth_score (Optional[float]): score for the other pairs [default=model]
+        min_score_percentage (Optional[float]): minimum window score in % of max score, minimum 12 [default=model]
+
+    Returns:
+        pd.DataFrame: Z-DNA regions with the same columns as server results, 0-based positions
+    """
+    parameters: Dict[str, float] = zdna_parameters(
+        model=model,
+        GC_score=GC_score,
+        GTAC_score=GTAC_score,
+        AT_score=AT_score,
+        oth_score=oth_score,
+        min_score_percentage=min_score_percentage,
+    )
+    _validate(parameters, min_sequence_size)
+
+    data: bytes = (
+        sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    ).upper()
+    results: List[dict] = _find_regions(
+        data=data,
+        classes=encode_dinucleotides(data),
+        min_sequence_size=min_sequence_size,
+        **parameters,
+    )
+
+    if not results:
+        return empty_result(columns=ZDNA_COLUMNS, schema=ResultSchema.ZDNA)
+    return decode_result(response=results, schema=ResultSchema.ZDNA)
+
+
+def sweep_zdna(
+    *,
+    sequence: Union[str, bytes, bytearray, memoryview],
+    grid: Iterable[Dict[str, float]],
+) -> pd.DataFrame:
+    """
+    Find Z-DNA regions for every parameter set of grid, sequence is encoded only once
+
+    Args:
+        sequence (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+        grid (Iterable[Dict[str, float]]): keyword arguments of find_zdna without sequence
+
+    Returns:
+        pd.DataFrame: Z-DNA regions with resolved parameter columns of every parameter set
+    """
+    data: bytes = (
+        sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+    ).upper()
+    classes: np.ndarray = encode_dinucleotides(data)
+    frames: List[pd.DataFrame] = list()
+
+    for parameters in grid:
+        parameters = dict(parameters)
+        min_sequence_size: int = parameters.pop("min_sequence_size", 10)
+        scores: Dict[str, float] = zdna_parameters(**parameters)
+        _validate(scores, min_sequence_size)
+
+        results: List[dict] = _find_regions(
+            data=data,
+            classes=classes,
+            min_sequence_size=min_sequence_size,
+            **scores,
+        )
+        frame: pd.DataFrame = (
+            decode_result(response=results, schema=ResultSchema.ZDNA)
+            if results
+            else empty_result(columns=ZDNA_COLUMNS, schema=ResultSchema.ZDNA)
+        )
+        frames.append(
+            frame.assign(min_sequence_size=min_sequence_size, **scores)
+        )
+
+    if not frames:
+        return empty_result(columns=ZDNA_COLUMNS, schema=ResultSchema.ZDNA)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,308 @@
+# fasta_index.py
+
+import mmap
+import os
+from typing import Dict, Generator, List, Optional
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.utils import is_compressed
+
+
+class FastaIndexRecord:
+    """One faidx line, record name, length, data offset and line layout"""
+
+    __slots__ = ("name", "length", "offset", "line_bases", "line_width")
+
+    def __init__(
+        self, *, name: str, length: int, offset: int, line_bases: int, line_width: int
+    ):
+        self.name: str = name
+        self.length: int = length
+        self.offset: int = offset
+        self.line_bases: int = line_bases
+        self.line_width: int = line_width
+
+    def __repr__(self):
+        return f"<FastaIndexRecord {self.name} length: {self.length}>"
+
+    def get_offset(self, position: int) -> int:
+        """
+        Return file offset of given sequence position
+
+        Args:
+            position (int): 0-based sequence position
+
+        Returns:
+            int: file offset
+        """
+        if self.line_bases == 0:
+            return self.offset
+        return (
+            self.offset
+            + (position // self.line_bases) * self.line_width
+            + position % self.line_bases
+        )
+
+    def to_line(self) -> str:
+        return f"{self.name}\t{self.length}\t{self.offset}\t{self.line_bases}\t{self.line_width}\n"
+
+
+def build_fasta_index(*, path: str) -> List[FastaIndexRecord]:
+    """
+    Scan FASTA file and create faidx compatible records, all lines of one
+    record except the last one have to have the same length
+
+    Args:
+        path (str): system path to uncompressed fasta file
+
+    Returns:
+        List[FastaIndexRecord]: index records in file order
+    """
+    records: List[FastaIndexRecord] = list()
+    record: Optional[dict] = None
+    last_line: bool = False
+    file_offset: int = 0
+
+    def _close() -> None:
+        if record is not None:
+            records.append(FastaIndexRecord(**record))
+
+    with open(path, "rb") as fasta:
+        for line in fasta:
+            line_width: int = len(line)
+
+            if line.startswith(b">"):
+                _close()
+                record = dict(
+                    name=line[1:].split()[0].decode() if line[1:].split() else str(),
+                    length=0,
+                    offset=file_offset + line_width,
+                    line_bases=0,
+                    line_width=0,
+                )
+                last_line = False
+            elif record is not None:
+                line_bases: int = len(line.rstrip(b"\r\n"))
+
+                if line_bases == 0:
+                    last_line = True
+                elif last_line:
+                    raise ValueError(
+                        f"Record {record['name']} has different line lengths, file cannot be indexed!"
+                    )
+                elif record["line_bases"] == 0:
+                    record["line_bases"] = line_bases
+                    record["line_width"] = line_width
+                elif line_bases != record["line_bases"]:
+                    # shorter line is allowed only at the end of record
+                    if line_bases > record["line_bases"]:
+                        raise ValueError(
+                            f"Record {record['name']} has different line lengths, file cannot be indexed!"
+                        )
+                    last_line = True
+
+                record["length"] += line_bases
+
+            file_offset += line_width
+
+    _close()
+    return records
+
+
+def write_fasta_index(*, records: List[FastaIndexRecord], path: str) -> None:
+    """
+    Write index records into faidx file
+
+    Args:
+        records (List[FastaIndexRecord]): index records
+        path (str): system path to .fai file
+    """
+    with open(path, "w") as index_file:
+        index_file.writelines(record.to_line() for record in records)
+
+
+def read_fasta_index(*, path: str) -> List[FastaIndexRecord]:
+    """
+    Read faidx file
+
+    Args:
+        path (str): system path to .fai file
+
+    Returns:
+        List[FastaIndexRecord]: index records in file order
+    """
+    records: List[FastaIndexRecord] = list()
+
+    with open(path, "r") as index_file:
+        for line in index_file:
+            if not line.strip():
+                continue
+            name, length, offset, line_bases, line_width = line.rstrip("\n").split("\t")[:5]
+            records.append(
+                FastaIndexRecord(
+                    name=name,
+                    length=int(length),
+                    offset=int(offset),
+                    line_bases=int(line_bases),
+                    line_width=int(line_width),
+                )
+            )
+
+    return records
+
+
+class FastaIndex:
+    """
+    Random access to local FASTA file through faidx index and memory map
+    """
+
+    def __init__(self, *, path: str, index_path: Optional[str] = None) -> None:
+        """
+        Open FASTA file, index is loaded from .fai file or created next to FASTA file
+
+        Args:
+            path (str): system path to uncompressed fasta file
+            index_path (Optional[str]): system path to .fai file [Default=path + .fai]
+        """
+        if is_compressed(path):
+            raise ValueError(
+                f"File {path} is compressed, only uncompressed FASTA can be indexed!"
+            )
+
+        self.path: str = path
+        self.index_path: str = (
+            index_path
+            if index_path is not None
+            else f"{path}{Config.FASTA_CONFIG.INDEX_SUFFIX}"
+        )
+
+        if os.path.exists(self.index_path) and os.path.getmtime(
+            self.index_path
+        ) >= os.path.getmtime(path):
+            records: List[FastaIndexRecord] = read_fasta_index(path=self.index_path)
+        else:
+            records = build_fasta_index(path=path)
+            write_fasta_index(records=records, path=self.index_path)
+
+        self.records: Dict[str, FastaIndexRecord] = {
+            record.name: record for record in records
+        }
+        self.__file = open(path, "rb")
+        # empty file cannot be mapped
+        self.__data = (
+            mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.path.getsize(path)
+            else bytes()
+        )
+
+    def __repr__(self):
+        return f"<FastaIndex {self.path} records: {len(self.records)}>"
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.records
+
+    def close(self) -> None:
+        """
+        Close memory map and FASTA file
+        """
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.close()
+        self.__file.close()
+
+    def get_record(self, name: Optional[str] = None) -> FastaIndexRecord:
+        """
+        Return index record by name, name can be omitted for single record file
+
+        Args:
+            name (Optional[str]): record name [Default=None]
+
+        Returns:
+            FastaIndexRecord: index record
+        """
+        if name is None:
+            if len(self.records) != 1:
+                raise ValueError(
+                    f"File {self.path} contains {len(self.records)} records, record name has to be set!"
+                )
+            return next(iter(self.records.values()))
+
+        if name not in self.records:
+            raise KeyError(f"Record {name} is not in file {self.path}!")
+        return self.records[name]
+
+    def fetch_bytes(
+        self, length: int = 100, position: int = 0, *, name: Optional[str] = None
+    ) -> bytes:
+        """
+        Return slice of record sequence in ASCII bytes
+
+        Args:
+            length (int): data string length [default=100]
+            position (int): 0-based data start position [default=0]
+            name (Optional[str]): record name [Default=None]
+
+        Returns:
+            bytes: sequence data
+        """
+        record: FastaIndexRecord = self.get_record(name)
+
+        if position < 0 or length < 0 or position + length > record.length:
+            raise ValueError(
+                f"Interval {position}-{position + length} is out of record {record.name} with length {record.length}!"
+            )
+
+        data: bytes = self.__data[
+            record.get_offset(position) : record.get_offset(position + length)
+        ]
+        return data.translate(None, b"\r\n")
+
+    def iter_bytes(
+        self,
+        length: int = 100,
+        position: int = 0,
+        *,
+        name: Optional[str] = None,
+        block_size: int = Config.FASTA_CONFIG.BLOCK_SIZE,
+    ) -> Generator[bytes, None, None]:
+        """
+        Yield slice of record sequence in ASCII blocks
+
+        Args:
+            length (int): data string length [default=100]
+            position (int): 0-based data start position [default=0]
+            name (Optional[str]): record name [Default=None]
+            block_size (int): max block length
+
+        Returns:
+            Generator[bytes, None, None]: sequence data blocks
+        """
+        end: int = position + length
+
+        for start in range(position, end, block_size):
+            yield self.fetch_bytes(
+                length=min(block_size, end - start), position=start, name=name
+            )
+
+    def fetch(
+        self, length: int = 100, position: int = 0, *, name: Optional[str] = None
+    ) -> str:
+        """
+        Return slice of record sequence
+
+        Args:
+            length (int): data string length [default=100]
+            position (int): 0-based data start position [default=0]
+            name (Optional[str]): record name [Default=None]
+
+        Returns:
+            str: sequence data
+        """
+        return self.fetch_bytes(length=length, position=position, name=name).decode(
+            "ascii"
+        )
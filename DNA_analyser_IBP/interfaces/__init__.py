@@ -1,6 +1,6 @@
 # __init__.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from DNA_analyser_IBP.interfaces.extras_interface import Extras
 from DNA_analyser_IBP.interfaces.g4hunter_interface import G4Hunter
@@ -13,6 +13,7 @@ from DNA_analyser_IBP.interfaces.sequence_interface import Sequence
 
 if TYPE_CHECKING:
     from DNA_analyser_IBP.ports import Ports
+    from DNA_analyser_IBP.sequence_index import SequenceIndex
 
 __all__ = ["Interfaces"]
 
@@ -22,11 +23,13 @@ class Interfaces:
     Adapter class
     """
 
-    def __init__(self, ports: "Ports"):
+    def __init__(
+        self, ports: "Ports", sequence_index: Optional["SequenceIndex"] = None
+    ):
         """
         Create all interfaces
         """
-        self.sequence: Sequence = Sequence(ports=ports)
+        self.sequence: Sequence = Sequence(ports=ports, index=sequence_index)
         self.g4hunter: G4Hunter = G4Hunter(ports=ports)
         self.g4killer: G4Killer = G4Killer(ports=ports)
         self.p53_predictor: P53 = P53(ports=ports)
@@ -1,14 +1,34 @@
 # api_interface.py
 
+import os
+import uuid
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Union
+from datetime import datetime
+from typing import Callable, Dict, Generator, List, Optional, Tuple, Union
 
 import pandas as pd
 
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.ports import Ports
+from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.type import DataOutput
+from DNA_analyser_IBP.utils import (
+    Logger,
+    exception_handler,
+    normalize_name,
+    save_chunks,
+)
+
 
 class AnalyseInterface(metaclass=ABCMeta):
     """Interface for api endpoint caller has to have at least this methods"""
 
+    @property
+    @abstractmethod
+    def _port(self) -> Port:
+        """Port of analyse endpoint e.g. ports.g4hunter"""
+        raise NotImplementedError("You should implement this!")
+
     @abstractmethod
     def load_all(self, filter_tag: Optional[List[str]]) -> pd.DataFrame:
         raise NotImplementedError("You should implement this!")
@@ -24,3 +44,222 @@ class AnalyseInterface(metaclass=ABCMeta):
     @abstractmethod
     def analyse_creator(self, *args):
         raise NotImplemented("You should implement this!")
+
+    @exception_handler
+    def iter_results(
+        self,
+        chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE,
+        *,
+        analyse: Union[pd.Series, pd.DataFrame],
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Return generator of analyse results in DataFrame chunks
+
+        Args:
+            chunk_size (int): max number of results in one chunk [Default=50000]
+            analyse (Union[pd.Series, pd.DataFrame]): analyse, first row of DataFrame is used
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with results
+        """
+        if isinstance(analyse, pd.Series):
+            id: str = analyse["id"]
+        elif isinstance(analyse, pd.DataFrame):
+            id: str = analyse.iloc[0]["id"]
+        else:
+            Logger.error("You have to insert pd.Series or pd.DataFrame!")
+            return
+
+        return self._load_result_chunks(id=id, chunk_size=chunk_size)
+
+    @exception_handler
+    def save_results(
+        self,
+        chunk_size: int = Config.RESULT_CONFIG.CHUNK_SIZE,
+        *,
+        analyse: Union[pd.Series, pd.DataFrame],
+        path: str,
+    ) -> None:
+        """
+        Save analyses results into csv files chunk by chunk
+
+        Args:
+            chunk_size (int): max number of results held in memory [Default=50000]
+            analyse (Union[pd.Series, pd.DataFrame]): analyse DataFrame|Series
+            path (str): absolute system path to output folder
+        """
+
+        def _save_results(id: str, name: str) -> None:
+            name: str = normalize_name(name=name)
+            file_path: str = os.path.join(path, f"{name}_{id}_results.csv")
+            rows: int = save_chunks(
+                chunks=self._load_result_chunks(id=id, chunk_size=chunk_size),
+                file_path=file_path,
+            )
+            Logger.info(f"file created -> {file_path} ({rows} results)")
+
+        if isinstance(analyse, pd.DataFrame):
+            for _, row in analyse.iterrows():
+                _save_results(id=row["id"], name=row["title"])
+        else:
+            _save_results(id=analyse["id"], name=analyse["title"])
+
+    def _load_result_chunks(
+        self, *, id: str, chunk_size: int
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Return generator of results in DataFrame chunks
+
+        Args:
+            id (str): analyse id
+            chunk_size (int): max number of results in one chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with results
+        """
+        return self._port.load_result_chunks(id=id, chunk_size=chunk_size)
+
+
+class LocalAnalyseMixin:
+    """
+    Analyses scored by local engine without server batch, results are kept in memory
+    and served by the same result methods as server analyses
+    """
+
+    def __init__(self, ports: Ports):
+        self.__ports = ports
+        # local analyse id -> results scored by local engine
+        self.__local: Dict[str, pd.DataFrame] = dict()
+
+    def _local_analyse_creator(
+        self,
+        *,
+        tags: Optional[List[str]],
+        sequence: Union[pd.DataFrame, pd.Series, str, Dict[str, str]],
+        engine: Callable[[Union[str, bytes]], pd.DataFrame],
+        create: Callable[..., object],
+    ) -> pd.DataFrame:
+        """
+        Score sequences by local engine, uploaded sequences are downloaded first
+
+        Args:
+            tags (Optional[List[str]]): tags for analyse filtering
+            sequence (Union[pd.DataFrame, pd.Series, str, Dict[str, str]]): one or many sequences to analyse
+            engine (Callable[[Union[str, bytes]], pd.DataFrame]): local engine returning results of sequence data
+            create (Callable[..., object]): analyse model of data, results and shared analyse fields
+
+        Returns:
+            pd.DataFrame: DataFrame with local analyses
+        """
+
+        def _load_data(row: pd.Series) -> bytes:
+            return self.__ports.sequence.load_data(
+                id=row["id"],
+                length=row["length"],
+                position=0,
+                sequence_length=row["length"],
+                output=DataOutput.BYTES,
+            )
+
+        # sequence id, name, tags and data of every analysed sequence
+        records: List[Tuple[Optional[str], str, List[Optional[str]], Callable]] = list()
+
+        if isinstance(sequence, str):
+            records.append((None, "sequence", tags or list(), lambda: sequence))
+        elif isinstance(sequence, dict):
+            for name, data in sequence.items():
+                records.append((None, name, tags or list(), lambda data=data: data))
+        elif isinstance(sequence, pd.DataFrame):
+            for _, row in sequence.iterrows():
+                records.append(
+                    (
+                        row["id"],
+                        row["name"],
+                        self._process_tags(tags, row["tags"]),
+                        lambda row=row: _load_data(row),
+                    )
+                )
+        else:
+            records.append(
+                (
+                    sequence["id"],
+                    sequence["name"],
+                    self._process_tags(tags, sequence["tags"]),
+                    lambda: _load_data(sequence),
+                )
+            )
+
+        analyses: List[pd.DataFrame] = list()
+        for sequence_id, name, analyse_tags, load in records:
+            created: str = datetime.now().isoformat()
+            data: Union[str, bytes] = load()
+            results: pd.DataFrame = engine(data)
+            id: str = f"local-{uuid.uuid4().hex}"
+            self.__local[id] = results
+
+            analyses.append(
+                create(
+                    data=data,
+                    results=results,
+                    id=id,
+                    title=normalize_name(name),
+                    tags=analyse_tags,
+                    created=created,
+                    finished=datetime.now().isoformat(),
+                    sequenceId=sequence_id,
+                    resultCount=len(results),
+                ).get_data_frame()
+            )
+            Logger.info(f"Analyse {name} scored locally ({len(results)} results)")
+
+        return pd.concat(analyses, ignore_index=True)
+
+    def _load_local_result(self, *, id: str) -> Optional[pd.DataFrame]:
+        """
+        Return copy of local analyse results
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            Optional[pd.DataFrame]: results or None if analyse is not local
+        """
+        results: Optional[pd.DataFrame] = self.__local.get(id)
+        return results.copy() if results is not None else None
+
+    def _load_result_chunks(
+        self, *, id: str, chunk_size: int
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Return generator of results in DataFrame chunks, local results are sliced from memory
+
+        Args:
+            id (str): analyse id
+            chunk_size (int): max number of results in one chunk
+
+        Returns:
+            Generator[pd.DataFrame, None, None]: DataFrame chunks with results
+        """
+        if id not in self.__local:
+            return super()._load_result_chunks(id=id, chunk_size=chunk_size)
+
+        results: pd.DataFrame = self.__local[id]
+        return (
+            results.iloc[start : start + chunk_size].reset_index(drop=True)
+            for start in range(0, len(results), chunk_size)
+        )
+
+    def _delete_local(self, *, id: str) -> bool:
+        """
+        Delete local analyse results
+
+        Args:
+            id (str): analyse id
+
+        Returns:
+            bool: True if analyse was local
+        """
+        if self.__local.pop(id, None) is None:
+            return False
+        Logger.info(f"Local analyse {id} was deleted!")
+        return True
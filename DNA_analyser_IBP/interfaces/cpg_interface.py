@@ -2,16 +2,21 @@
 
 import os
 import time
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
 import pandas as pd
 
 from DNA_analyser_IBP.interfaces.analyse_interface import AnalyseInterface
 from DNA_analyser_IBP.models import CpG as Analyse
 from DNA_analyser_IBP.ports import Ports
-from DNA_analyser_IBP.statusbar import status_bar
+from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.statusbar import multiple_status_bar, status_bar
 from DNA_analyser_IBP.type import Types
-from DNA_analyser_IBP.utils import Logger, exception_handler, normalize_name
+from DNA_analyser_IBP.utils import (
+    Logger,
+    exception_handler,
+    normalize_name,
+)
 
 class CpG(AnalyseInterface):
     """
@@ -21,16 +26,21 @@ class CpG(AnalyseInterface):
     def __init__(self, ports: Ports):
         self.__ports: Ports = ports
 
+    @property
+    def _port(self) -> Port:
+        return self.__ports.cpg
+
     @exception_handler
     def analyse_creator(self, 
         tags: Optional[List[str]] = None,
         min_window_size: Optional[int] = 200,
+        max_workers: Optional[int] = None,
         *,
         min_gc_percentage: Optional[float] = 0.5,
         min_obs_exp_cpg: Optional[float] = 0.6,
         min_island_merge_gap: Optional[int] = 100,
         second_nucleotide: Optional[str] = "G",
-        sequence = Union[pd.DataFrame, pd.Series]) -> None:
+        sequence = Union[pd.DataFrame, pd.Series]) -> Optional[pd.DataFrame]:
         """
         Create CpG Hunter analyse
 
@@ -38,29 +48,57 @@ class CpG(AnalyseInterface):
             tags (Optional[List[str]]): tags for analyse filtering [default=None],
             sequence (Union[pd.DataFrame, pd.Series]): one or many sequences to analyse,
             min_window_size (Optional[int]): 
+            max_workers (Optional[int]): analyse sequences concurrently with given number of workers, single sequence is tracked the same way [default=None]
             min_gc_percentage (Optional[float]):
             min_obs_exp_cpg (Optional[float]):
             min_island_merge_gap (Optional[int]):
             second_nucleotide (Optional[str]):
+
+        Returns:
+            Optional[pd.DataFrame]: analyse id, final batch status and elapsed time for each sequence if max_workers is set
         """
         
+        def _create_analyse(id: str, tags: List[Optional[str]]) -> Callable:
+            return lambda: self.__ports.cpg.create_analyse(
+                id=id,
+                tags=tags,
+                min_window_size=min_window_size,
+                min_gc_percentage=min_gc_percentage,
+                min_obs_exp_cpg=min_obs_exp_cpg,
+                min_island_merge_gap=min_island_merge_gap,
+                second_nucleotide=second_nucleotide,
+            )
+
         def _analyse_creator(id: str, name: str, tags: List[Optional[str]]) -> None:
             status_bar(
                 ports=self.__ports,
-                func=lambda: self.__ports.cpg.create_analyse(
-                    id=id,
-                    tags=tags,
-                    min_window_size=min_window_size,
-                    min_gc_percentage=min_gc_percentage,
-                    min_obs_exp_cpg=min_obs_exp_cpg,
-                    min_island_merge_gap=min_island_merge_gap,
-                    second_nucleotide=second_nucleotide,
-                ),
+                func=_create_analyse(id=id, tags=tags),
                 name=normalize_name(name),
                 type=Types.CPG,
             )
 
+        # single sequence is tracked as one row table when max_workers is set
+        if isinstance(sequence, pd.Series) and max_workers is not None:
+            sequence = sequence.to_frame().T
+
         if isinstance(sequence, pd.DataFrame):
+            if max_workers is not None:
+                jobs: list = [
+                    (
+                        row["id"],
+                        normalize_name(row["name"]),
+                        _create_analyse(
+                            id=row["id"], tags=self._process_tags(tags, row["tags"])
+                        ),
+                    )
+                    for _, row in sequence.iterrows()
+                ]
+                return multiple_status_bar(
+                    ports=self.__ports,
+                    jobs=jobs,
+                    type=Types.CPG,
+                    max_workers=max_workers,
+                )
             for _, row in sequence.iterrows():
                 _tags = self._process_tags(tags, row["tags"])
                 _analyse_creator(id=row["id"], name=row["name"], tags=_tags)
@@ -153,6 +191,7 @@ class CpG(AnalyseInterface):
         *,
         analyse: Union[pd.DataFrame, pd.Series],
         path: str,
+        use_cache: bool = True,
     ) -> None:
         """
         Export CpX analyses result into csv files
@@ -160,6 +199,7 @@ class CpG(AnalyseInterface):
         Args:
             analyse (Union[pd.DataFrame, pd.Series]): g4hunter analyse DataFrame|Series
             path (str): absolute system path to output folder
+            use_cache (bool): False = bypass local result cache [Default=True]
         """
 
         def _export_csv(id: str, name: str) -> None:
@@ -167,7 +207,7 @@ class CpG(AnalyseInterface):
             file_path: str = os.path.join(path, f"{name}_result.csv")
 
             with open(file_path, "w") as new_file:
-                data: str = self.__ports.cpg.export_csv(id=id)
+                data: str = self.__ports.cpg.export_csv(id=id, use_cache=use_cache)
                 new_file.write(data)
             Logger.info(f"file created -> {file_path}")
 
@@ -178,19 +218,27 @@ class CpG(AnalyseInterface):
             _export_csv(id=analyse["id"], name=analyse["title"])
 
     @exception_handler
-    def load_results(self, *, analyse: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    def load_results(
+        self, *, analyse: Union[pd.Series, pd.DataFrame], use_cache: bool = True
+    ) -> pd.DataFrame:
         """
         Return cpg analyses results in DataFrame
 
         Args:
             analyse (Union[pd.Series, pd.DataFrame]): cpg analyse
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: DataFrame with cpg hunter results
         """
         if isinstance(analyse, pd.Series):
-            return self.__ports.cpg.load_result(id=analyse["id"])
+            return self.__ports.cpg.load_result(
+                id=analyse["id"], use_cache=use_cache
+            )
         elif isinstance(analyse, pd.DataFrame):
-            return self.__ports.cpg.load_result(id=analyse.iloc[0]["id"])
+            return self.__ports.cpg.load_result(
+                id=analyse.iloc[0]["id"], use_cache=use_cache
+            )
         else:
-            Logger.error("You have to insert pd.Series or pd.DataFrame!")
\ No newline at end of file
+            Logger.error("You have to insert pd.Series or pd.DataFrame!")
+
@@ -1,20 +1,15 @@
 # extras_interface.py
 
-import csv
 import os
-from typing import List, Union
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import requests
 import tenacity
 
-from DNA_analyser_IBP.intersection import (
-    Annotation,
-    G4Result,
-    create_annotation_list,
-    create_g4hunter_list,
-    get_annotation_labels,
-)
+from DNA_analyser_IBP.intersection import FilePairing, overlay_files, pair_files
 from DNA_analyser_IBP.utils import (
     Logger,
     _multifasta_parser,
@@ -153,49 +148,131 @@ class Extras:
             (pd.DataFrame): intersection result
         """
         if 0 < area_size <= 1000:
-            annotation_list: List[Annotation] = create_annotation_list(
-                annotation=annotation_file, area_size=area_size
+            labels, counts = overlay_files(
+                analyse_file=analyse_file,
+                annotation_file=annotation_file,
+                area_size=area_size,
+            )
+            result: pd.DataFrame = self._create_overlay_dataframe(
+                labels=labels, counts=counts
             )
-            analyse_list: List[G4Result] = create_g4hunter_list(analyse=analyse_file)
-
-            labels: List[str] = get_annotation_labels(annotation_list=annotation_list)
-            result: list = [[label] + [0, 0, 0] * 6 for label in labels]
-
-            for annotation in annotation_list:
-                for analyse in analyse_list:
-                    group_id: int = analyse.get_group_id()
-                    # remove PQS which will never use again (optimization)
-                    if (annotation.before - analyse.position) >= 100000:
-                        analyse_list.remove(analyse)
-                    # if too far from analyse
-                    if analyse.position > annotation.after:
-                        break
-                    # overlay
-                    else:
-                        label_index: int = labels.index(annotation.feature)
-                        result[label_index][group_id] += annotation.is_before(analyse)
-                        result[label_index][group_id + 1] += annotation.is_in(analyse)
-                        result[label_index][group_id + 2] += annotation.is_after(
-                            analyse
-                        )
             # get outpath for overlay file
             if overlay_path:
-                path: str = get_file_name(
+                self._save_overlay(
+                    data=result,
                     original_path=annotation_file,
-                    out_path=overlay_path,
-                    file_format="csv",
+                    overlay_path=overlay_path,
                 )
-                pd.DataFrame(
-                    data=result, columns=Extras._INTERSECTION_DATAFRAME_COLUMNS
-                ).to_csv(path)
-                Logger.info(f"Overlay analysis {path} save!")
                 return None
-            return pd.DataFrame(
-                data=result, columns=Extras._INTERSECTION_DATAFRAME_COLUMNS
-            )
+            return result
         else:
             Logger.error("Overlay area must be in interval (0,1000>!")
 
+    @exception_handler
+    def annotation_overlay_batch(
+        self,
+        *,
+        file_pairs: List[List[str]],
+        area_size: int = 100,
+        overlay_path: str = "",
+        max_workers: Optional[int] = None,
+    ) -> Union[pd.DataFrame, None]:
+        """
+        Create overlays for many annotation and G4Hunter analyse file pairs in parallel processes
+
+        Args:
+            file_pairs (List[List[str]]): [annotation, analyse] pairs from annotation_analyse_pair_creator
+            area_size (int): size of overlay region outside annotation [Default=100]
+            overlay_path (str): folder where each overlay is saved as soon as it is finished [Default=""]
+            max_workers (Optional[int]): number of worker processes [Default=number of CPUs]
+
+        Returns:
+            (pd.DataFrame): all overlays with ANNOTATION and ANALYSE file columns
+        """
+        if not 0 < area_size <= 1000:
+            Logger.error("Overlay area must be in interval (0,1000>!")
+            return None
+
+        results: dict = dict()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict = {
+                executor.submit(
+                    overlay_files,
+                    analyse_file=analyse,
+                    annotation_file=annotation,
+                    area_size=area_size,
+                ): index
+                for index, (annotation, analyse) in enumerate(file_pairs)
+            }
+
+            for future in as_completed(futures):
+                index: int = futures[future]
+                annotation, analyse = file_pairs[index]
+                try:
+                    labels, counts = future.result()
+                except Exception as e:
+                    Logger.error(f"Overlay of {annotation} and {analyse} failed! {e}")
+                    continue
+
+                data: pd.DataFrame = self._create_overlay_dataframe(
+                    labels=labels, counts=counts
+                )
+                if overlay_path:
+                    # annotation can be shared by many pairs, file is named by both
+                    name: str = os.path.basename(annotation).rsplit(".", 1)[0]
+                    self._save_overlay(
+                        data=data,
+                        original_path=f"{name}_{os.path.basename(analyse)}",
+                        overlay_path=overlay_path,
+                    )
+                data.insert(0, "ANALYSE", analyse)
+                data.insert(0, "ANNOTATION", annotation)
+                results[index] = data
+
+        if results:
+            return pd.concat(
+                [results[index] for index in sorted(results)], ignore_index=True
+            )
+        return pd.DataFrame(
+            columns=["ANNOTATION", "ANALYSE"] + Extras._INTERSECTION_DATAFRAME_COLUMNS
+        )
+
+    @staticmethod
+    def _create_overlay_dataframe(
+        *, labels: List[str], counts: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Create overlay dataframe from feature labels and overlay counts
+
+        Args:
+            labels (List[str]): feature labels
+            counts (np.ndarray): overlay counts of features
+
+        Returns:
+            (pd.DataFrame): intersection result
+        """
+        result: list = [[label] + row for label, row in zip(labels, counts.tolist())]
+        return pd.DataFrame(data=result, columns=Extras._INTERSECTION_DATAFRAME_COLUMNS)
+
+    @staticmethod
+    def _save_overlay(
+        *, data: pd.DataFrame, original_path: str, overlay_path: str
+    ) -> None:
+        """
+        Save overlay dataframe into csv named by original file
+
+        Args:
+            data (pd.DataFrame): intersection result
+            original_path (str): file path giving name of overlay csv
+            overlay_path (str): overlay output folder
+        """
+        path: str = get_file_name(
+            original_path=original_path, out_path=overlay_path, file_format="csv"
+        )
+        data.to_csv(path)
+        Logger.info(f"Overlay analysis {path} save!")
+
     @exception_handler
     def multifasta_to_fasta(self, *, path: str, out_path: str) -> None:
         """
@@ -206,11 +283,13 @@ class Extras:
             out_path (str): absolute system path into output folder with FASTAs
         """
         if os.path.exists(out_path):
-            for sequence_name, sequence_nucleic in _multifasta_parser(path=path):
+            for sequence_name, sequence_nucleic in _multifasta_parser(
+                path=path, as_memoryview=True
+            ):
                 sequence_name: str = normalize_name(name=sequence_name)
 
-                with open(f"{out_path}/{sequence_name}.txt", "w") as fasta:
-                    fasta.write(f">{sequence_name}\n")
+                with open(f"{out_path}/{sequence_name}.txt", "wb") as fasta:
+                    fasta.write(f">{sequence_name}\n".encode())
                     fasta.write(sequence_nucleic)
                     Logger.info(f"File {path}/{sequence_name}.txt was created!")
         else:
@@ -218,7 +297,11 @@ class Extras:
 
     @exception_handler
     def annotation_analyse_pair_creator(
-        self, *, analyse_list: List[str], annotation_list: List[str]
+        self,
+        *,
+        analyse_list: List[str],
+        annotation_list: List[str],
+        key: Optional[Callable[[str], str]] = None,
     ) -> List[List[str]]:
         """
         Make list of file pairs for annotation analysis
@@ -226,16 +309,27 @@ class Extras:
         Args:
             analyse_list (List[str]): list of analyse files made by glog
             annotation_list (List[str]): list of annotation files made by glob
+            key (Optional[Callable[[str], str]]): function returning pairing key of file path,
+                default pairs annotation name found in analyse name [Default=None]
 
         Returns:
             List[str]: file pairs based on their similar names
         """
-        file_pairs: list = list()
+        pairing: FilePairing = pair_files(
+            annotation_list=annotation_list, analyse_list=analyse_list, key=key
+        )
+
+        if pairing.unmatched_annotations:
+            Logger.info(
+                f"{len(pairing.unmatched_annotations)} annotation files without analyse: "
+                f"{pairing.unmatched_annotations}"
+            )
+        if pairing.unmatched_analyses:
+            Logger.info(
+                f"{len(pairing.unmatched_analyses)} analyse files without annotation: "
+                f"{pairing.unmatched_analyses}"
+            )
+        for annotation, analyses in pairing.ambiguous.items():
+            Logger.error(f"Annotation {annotation} matches more analyses: {analyses}")
 
-        for annotation in annotation_list:
-            file_name = os.path.basename(annotation).split(".")[0]
-            for analyse in analyse_list:
-                compare_name = os.path.basename(analyse)
-                if file_name in compare_name:
-                    file_pairs.append([annotation, analyse])
-        return file_pairs
+        return pairing.pairs
@@ -2,25 +2,39 @@
 
 import os
 import time
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from DNA_analyser_IBP.interfaces.analyse_interface import AnalyseInterface
+from DNA_analyser_IBP.engines import find_quadruplexes
+from DNA_analyser_IBP.interfaces.analyse_interface import (
+    AnalyseInterface,
+    LocalAnalyseMixin,
+)
 from DNA_analyser_IBP.models import G4Hunter as Analyse
 from DNA_analyser_IBP.ports import Ports
-from DNA_analyser_IBP.statusbar import status_bar
+from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.statusbar import multiple_status_bar, status_bar
 from DNA_analyser_IBP.type import Types
-from DNA_analyser_IBP.utils import Logger, exception_handler, normalize_name
+from DNA_analyser_IBP.utils import (
+    Logger,
+    exception_handler,
+    normalize_name,
+)
 
 
-class G4Hunter(AnalyseInterface):
+class G4Hunter(LocalAnalyseMixin, AnalyseInterface):
     """Api interface for g4hunter analyse caller"""
 
     def __init__(self, ports: Ports):
+        super().__init__(ports)
         self.__ports = ports
 
+    @property
+    def _port(self) -> Port:
+        return self.__ports.g4hunter
+
     @exception_handler
     def load_all(self, tags: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -61,22 +75,31 @@ class G4Hunter(AnalyseInterface):
         return g4hunter.get_data_frame()
 
     @exception_handler
-    def load_results(self, *, analyse: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    def load_results(
+        self, *, analyse: Union[pd.Series, pd.DataFrame], use_cache: bool = True
+    ) -> pd.DataFrame:
         """
         Return g4hunter analyses results in DataFrame
 
         Args:
             analyse (Union[pd.Series, pd.DataFrame]): g4hunter analyse
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: DataFrame with g4hunter results
         """
         if isinstance(analyse, pd.Series):
-            return self.__ports.g4hunter.load_result(id=analyse["id"])
+            id: str = analyse["id"]
         elif isinstance(analyse, pd.DataFrame):
-            return self.__ports.g4hunter.load_result(id=analyse.iloc[0]["id"])
+            id: str = analyse.iloc[0]["id"]
         else:
             Logger.error("You have to insert pd.Series or pd.DataFrame!")
+            return
+
+        local: Optional[pd.DataFrame] = self._load_local_result(id=id)
+        if local is not None:
+            return local
+        return self.__ports.g4hunter.load_result(id=id, use_cache=use_cache)
 
     @exception_handler
     def get_heatmap_data(
@@ -84,6 +107,7 @@ class G4Hunter(AnalyseInterface):
         segments: Optional[int] = 31,
         *,
         analyse: Union[pd.Series, pd.DataFrame],
+        use_cache: bool = True,
     ) -> pd.DataFrame:
         """
         Return DataFrame with heatmap data
@@ -91,13 +115,14 @@ class G4Hunter(AnalyseInterface):
         Args:
             segments (Optional[int]): g4hunter analyse series [Default=31]
             analyse (Union[pd.Series, pd.DataFrame]): analyse series data to get heatmap
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: raw data used to create heatmap
         """
         if isinstance(analyse, pd.Series):
             return self.__ports.g4hunter.load_heatmap(
-                id=analyse["id"], segments=segments
+                id=analyse["id"], segments=segments, use_cache=use_cache
             )
         else:
             Logger.error("You have to insert pd.Series!")
@@ -193,36 +218,84 @@ class G4Hunter(AnalyseInterface):
     def analyse_creator(
         self,
         tags: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        local: bool = False,
         *,
-        sequence: Union[pd.DataFrame, pd.Series],
+        sequence: Union[pd.DataFrame, pd.Series, str, Dict[str, str]],
         threshold: float,
         window_size: int,
-    ) -> None:
+    ) -> Optional[pd.DataFrame]:
         """
-        Create G4hunter analyse
+        Create G4hunter analyse, with local=True sequences are scored by local engine
+        without server batch and results are kept in memory
 
         Args:
             tags (Optional[List[str]]): tags for analyse filtering [default=None]
-            sequence (Union[pd.DataFrame, pd.Series]): one or many sequences to analyse
+            max_workers (Optional[int]): analyse sequences concurrently with given number of workers, single sequence is tracked the same way [default=None]
+            local (bool): True = score sequences locally, always used for raw sequence strings [default=False]
+            sequence (Union[pd.DataFrame, pd.Series, str, Dict[str, str]]): one or many sequences to analyse, raw sequence or name -> sequence dict
             threshold (float): g4hunter threshold recommended 1.2
             window_size (int): g4hunter window size recommended 25
+
+        Returns:
+            Optional[pd.DataFrame]: analyse id, final batch status and elapsed time for each sequence if max_workers is set,
+            local analyses in DataFrame if local is set
         """
+        if local or isinstance(sequence, (str, dict)):
+            return self._local_analyse_creator(
+                tags=tags,
+                sequence=sequence,
+                engine=lambda data: find_quadruplexes(
+                    sequence=data, threshold=threshold, window_size=window_size
+                ),
+                create=lambda data, results, **fields: Analyse(
+                    **fields,
+                    threshold=threshold,
+                    # quadruplexes per 1000 bp
+                    frequency=len(results) / len(data) * 1000 if len(data) else 0.0,
+                    windowSize=window_size,
+                ),
+            )
+
+        def _create_analyse(id: str, tags: List[Optional[str]]) -> Callable:
+            return lambda: self.__ports.g4hunter.create_analyse(
+                id=id,
+                tags=tags,
+                threshold=threshold,
+                window_size=window_size,
+            )
 
         def _analyse_creator(id: str, name: str, tags: List[Optional[str]]) -> None:
             name: str = normalize_name(name)
             status_bar(
                 ports=self.__ports,
-                func=lambda: self.__ports.g4hunter.create_analyse(
-                    id=id,
-                    tags=tags,
-                    threshold=threshold,
-                    window_size=window_size,
-                ),
+                func=_create_analyse(id=id, tags=tags),
                 name=name,
                 type=Types.G4HUNTER,
             )
 
+        # single sequence is tracked as one row table when max_workers is set
+        if isinstance(sequence, pd.Series) and max_workers is not None:
+            sequence = sequence.to_frame().T
+
         if isinstance(sequence, pd.DataFrame):
+            if max_workers is not None:
+                jobs: list = [
+                    (
+                        row["id"],
+                        normalize_name(row["name"]),
+                        _create_analyse(
+                            id=row["id"], tags=self._process_tags(tags, row["tags"])
+                        ),
+                    )
+                    for _, row in sequence.iterrows()
+                ]
+                return multiple_status_bar(
+                    ports=self.__ports,
+                    jobs=jobs,
+                    type=Types.G4HUNTER,
+                    max_workers=max_workers,
+                )
             for _, row in sequence.iterrows():
                 _tags = self._process_tags(tags, row["tags"])
                 _analyse_creator(id=row["id"], name=row["name"], tags=_tags)
@@ -255,6 +328,7 @@ class G4Hunter(AnalyseInterface):
         analyse: Union[pd.DataFrame, pd.Series],
         path: str,
         aggregate: bool = True,
+        use_cache: bool = True,
     ) -> None:
         """
         Export G4Hunter analyses result into csv files
@@ -263,6 +337,7 @@ class G4Hunter(AnalyseInterface):
             analyse (Union[pd.DataFrame, pd.Series]): g4hunter analyse DataFrame|Series
             path (str): absolute system path to output folder
             aggregate (bool): True = aggregation, False = no aggregation
+            use_cache (bool): False = bypass local result cache [Default=True]
         """
 
         def _export_csv(id: str, name: str) -> None:
@@ -270,7 +345,9 @@ class G4Hunter(AnalyseInterface):
             file_path: str = os.path.join(path, f"{name}_{id}_result.csv")
 
             with open(file_path, "w") as new_file:
-                data: str = self.__ports.g4hunter.export_csv(id=id, aggregate=aggregate)
+                data: str = self.__ports.g4hunter.export_csv(
+                    id=id, aggregate=aggregate, use_cache=use_cache
+                )
                 new_file.write(data)
             Logger.info(f"file created -> {file_path}")
 
@@ -290,6 +367,8 @@ class G4Hunter(AnalyseInterface):
         """
 
         def _delete(id: str) -> None:
+            if self._delete_local(id=id):
+                return
             if self.__ports.g4hunter.delete(id=id):
                 Logger.info(f"G4hunter analyse {id} was deleted!")
                 time.sleep(1)
@@ -1,16 +1,20 @@
 # g4killer_interface.py
 
-from typing import TYPE_CHECKING, List
+import random
+from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
 
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.engines import kill_quadruplexes
 from DNA_analyser_IBP.interfaces.tool_interface import ToolInterface
+from DNA_analyser_IBP.models import G4Killer as AnalyseModel
 from DNA_analyser_IBP.ports import Ports
 from DNA_analyser_IBP.utils import exception_handler
 from DNA_analyser_IBP.utils import Logger
 
-if TYPE_CHECKING:
-    from DNA_analyser_IBP.models import G4Killer as AnalyseModel
+# server accepts sequences up to this length
+MAX_SERVER_LENGTH: int = 200
 
 
 class G4Killer(ToolInterface):
@@ -21,20 +25,39 @@ class G4Killer(ToolInterface):
 
     @exception_handler
     def run(
-        self, complementary: bool = False, *, sequence: str, threshold: float
+        self,
+        complementary: bool = False,
+        local: bool = False,
+        *,
+        sequence: str,
+        threshold: float,
     ) -> pd.DataFrame:
         """
         Run G4Killer tool
 
         Args:
             complementary (bool): True if use for C sequence False for G sequence [default=False]
+            local (bool): True = search mutations by local engine without server [default=False]
             sequence (str): original sequence
             threshold (float): G4hunter target score in interval (0;4)
 
         Returns:
             pd.DataFrame: DataFrame with G4Killer result
         """
-        result: "AnalyseModel" = self.__ports.g4killer.create_analyse(
+        if local:
+            return (
+                AnalyseModel(
+                    **kill_quadruplexes(
+                        sequences=[sequence],
+                        threshold=threshold,
+                        complementary=complementary,
+                    )[0]
+                )
+                .get_data_frame()
+                .T
+            )
+
+        result: AnalyseModel = self.__ports.g4killer.create_analyse(
             sequence=sequence,
             threshold=threshold,
             complementary=complementary,
@@ -43,20 +66,49 @@ class G4Killer(ToolInterface):
 
     @exception_handler
     def run_multiple(
-        self, complementary: bool = False, *, sequences: List[str], threshold: float
+        self,
+        complementary: bool = False,
+        local: bool = False,
+        cross_check: int = 0,
+        *,
+        sequences: List[str],
+        threshold: float,
     ) -> pd.DataFrame:
         """
-        Run G4Killer tool for multiple sequences
+        Run G4Killer tool for multiple sequences, local engine searches all sequences
+        at once and random sample of them can be cross-checked against server
 
         Args:
             complementary (bool): True if use for C sequence False for G sequence [default=False]
+            local (bool): True = search mutations by local engine without server [default=False]
+            cross_check (int): number of random sequences sent also to server, result gets server_match column [default=0]
             sequences (List[str]): original sequences stored in list
             threshold (float): G4hunter target score in interval (0;4)
 
         Returns:
             pd.DataFrame: DataFrame with all G4Killer results
         """
-        if sequences:
+        if sequences and local:
+            # one frame from all records, per model frames are slow for thousands of results
+            data: pd.DataFrame = pd.DataFrame.from_records(
+                [
+                    vars(AnalyseModel(**result))
+                    for result in kill_quadruplexes(
+                        sequences=sequences,
+                        threshold=threshold,
+                        complementary=complementary,
+                    )
+                ]
+            )
+            if cross_check:
+                data["server_match"] = self._cross_check(
+                    data=data,
+                    sample_size=cross_check,
+                    threshold=threshold,
+                    complementary=complementary,
+                )
+            return data
+        elif sequences:
             list_g4killer: list = [
                 self.__ports.g4killer.create_analyse(
                     sequence=sequence, threshold=threshold, complementary=complementary
@@ -70,3 +122,56 @@ class G4Killer(ToolInterface):
             return data
         else:
             Logger.error("You should provide sequence list!")
+
+    def _cross_check(
+        self,
+        *,
+        data: pd.DataFrame,
+        sample_size: int,
+        threshold: float,
+        complementary: bool,
+    ) -> List[Optional[bool]]:
+        """
+        Compare random sample of local results with server results
+
+        Args:
+            data (pd.DataFrame): local G4Killer results
+            sample_size (int): number of checked sequences
+            threshold (float): G4hunter target score in interval (0;4)
+            complementary (bool): True if use for C sequence False for G sequence
+
+        Returns:
+            List[Optional[bool]]: True|False for checked results, None for others
+        """
+        tolerance: float = Config.ENGINE_CONFIG.SCORE_TOLERANCE
+        # server accepts only short sequences
+        allowed: List[int] = [
+            index
+            for index, sequence in enumerate(data["origin_sequence"])
+            if len(sequence) <= MAX_SERVER_LENGTH
+        ]
+        matches: List[Optional[bool]] = [None] * len(data)
+
+        for index in sorted(random.sample(allowed, min(sample_size, len(allowed)))):
+            local: pd.Series = data.iloc[index]
+            server: Optional[AnalyseModel] = self.__ports.g4killer.create_analyse(
+                sequence=local["origin_sequence"],
+                threshold=threshold,
+                complementary=complementary,
+            )
+            matches[index] = (
+                server is not None
+                and server.change_count == local["change_count"]
+                and abs(server.origin_score - local["origin_score"]) <= tolerance
+                and abs(server.mutation_score - local["mutation_score"]) <= tolerance
+            )
+            if not matches[index]:
+                Logger.error(
+                    f"G4Killer result of {local['origin_sequence']} differs from server result!"
+                )
+
+        checked: List[bool] = [match for match in matches if match is not None]
+        Logger.info(
+            f"{sum(checked)} of {len(checked)} G4Killer results match server results ..."
+        )
+        return matches
@@ -1,9 +1,23 @@
 # p53_interface.py
 
-from typing import TYPE_CHECKING, List
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.engines import iter_p53_windows
+from DNA_analyser_IBP.fasta_index import FastaIndex
 from DNA_analyser_IBP.interfaces.tool_interface import ToolInterface
 from DNA_analyser_IBP.ports import Ports
 from DNA_analyser_IBP.utils import exception_handler
@@ -13,6 +27,16 @@ if TYPE_CHECKING:
     from DNA_analyser_IBP.models import P53 as AnalyseModel
 
 
+SCAN_COLUMNS: List[str] = [
+    "sequence",
+    "affinity",
+    "predictor",
+    "difference",
+    "length",
+    "position",
+]
+
+
 class P53(ToolInterface):
     """Api interface for p53 caller"""
 
@@ -36,25 +60,198 @@ class P53(ToolInterface):
         return p53killer.get_data_frame().T
 
     @exception_handler
-    def run_multiple(self, *, sequences: List[str]) -> pd.DataFrame:
+    def run_multiple(
+        self,
+        max_workers: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        use_cache: bool = True,
+        *,
+        sequences: List[str],
+    ) -> pd.DataFrame:
         """
-        Run P53 tool for multiple sequences
+        Run P53 tool for multiple sequences, repeated sequences are sent only once,
+        unique sequences concurrently and predictions are memoized by sequence
 
         Args:
+            max_workers (int): number of concurrent requests [default=10]
+            use_cache (bool): False = bypass memoized predictions [Default=True]
             sequences (List[str]): list of sequences sequence [length=20] to analyse
 
         Returns:
-            pd.DataFrame: DataFrame with P53predictor result
+            pd.DataFrame: DataFrame with P53predictor result in order of input sequences
         """
         if sequences:
-            list_p53: list = [
-                self.__ports.p53.create_analyse(sequence=sequence)
-                for sequence in sequences
-            ]
-            data: pd.DataFrame = pd.concat(
-                [p53.get_data_frame() for p53 in list_p53],
-                ignore_index=True,
+            # the same 20-mer is memoized once regardless of case and whitespace
+            normalized: List[str] = [sequence.strip().upper() for sequence in sequences]
+            results: Dict[str, Optional["AnalyseModel"]] = (
+                self.__ports.p53.create_analyses(
+                    sequences=normalized, max_workers=max_workers, use_cache=use_cache
+                )
+            )
+            Logger.info(
+                f"{len(results)} unique of {len(sequences)} sequences were predicted ..."
+            )
+
+            # rows keep input sequence as given, failed ones have empty prediction
+            data: pd.DataFrame = pd.DataFrame.from_records(
+                [
+                    {**vars(results[key]), "sequence": sequence}
+                    if results[key] is not None
+                    else {"sequence": sequence}
+                    for sequence, key in zip(sequences, normalized)
+                ]
             )
             return data
         else:
             Logger.error("You should provide sequence list!")
+
+    @exception_handler
+    def scan(
+        self,
+        step: int = 1,
+        mismatches: int = 0,
+        max_workers: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        use_cache: bool = True,
+        record: Optional[str] = None,
+        *,
+        sequence: Optional[Union[str, pd.Series, pd.DataFrame]] = None,
+        path: Optional[str] = None,
+        cutoff: float,
+    ) -> pd.DataFrame:
+        """
+        Scan sequence with sliding 20 bp window, windows without RRRCWWGYYY half-site are
+        skipped locally and the rest is predicted in batches of concurrent requests
+
+        Args:
+            step (int): distance of window starts [default=1]
+            mismatches (int): max mismatches of half-site prefilter [default=0]
+            max_workers (int): number of concurrent requests [default=10]
+            use_cache (bool): False = bypass memoized predictions [Default=True]
+            record (Optional[str]): record name in multifasta file [default=None]
+            sequence (Optional[Union[str, pd.Series, pd.DataFrame]]): sequence string or uploaded sequence
+            path (Optional[str]): absolute path to uncompressed local FASTA file instead of sequence
+            cutoff (float): min affinity of returned windows
+
+        Returns:
+            pd.DataFrame: P53predictor results of windows with affinity above cutoff, position is 0-based window start
+        """
+        if (sequence is None) == (path is None):
+            Logger.error("You have to insert sequence or path!")
+            return
+
+        windows_count: int = 0
+        results: List[dict] = list()
+
+        with self._open_scan_source(
+            sequence=sequence, path=path, record=record, max_workers=max_workers
+        ) as chunks:
+            windows: Generator[Tuple[int, str], None, None] = iter_p53_windows(
+                chunks=chunks, step=step, mismatches=mismatches
+            )
+            while True:
+                batch: List[Tuple[int, str]] = list(
+                    islice(windows, Config.P53_CONFIG.SCAN_BATCH_SIZE)
+                )
+                if not batch:
+                    break
+
+                windows_count += len(batch)
+                predictions: Dict[str, Optional["AnalyseModel"]] = (
+                    self.__ports.p53.create_analyses(
+                        sequences=[window for _, window in batch],
+                        max_workers=max_workers,
+                        use_cache=use_cache,
+                    )
+                )
+                for position, window in batch:
+                    prediction: Optional["AnalyseModel"] = predictions[window]
+                    if (
+                        prediction is not None
+                        and prediction.affinity is not None
+                        and prediction.affinity >= cutoff
+                    ):
+                        results.append({**vars(prediction), "position": position})
+
+        Logger.info(
+            f"{windows_count} windows passed half-site prefilter, "
+            f"{len(results)} are above cutoff ..."
+        )
+        return pd.DataFrame.from_records(results, columns=SCAN_COLUMNS)
+
+    def _open_scan_source(
+        self,
+        *,
+        sequence: Optional[Union[str, pd.Series, pd.DataFrame]],
+        path: Optional[str],
+        record: Optional[str],
+        max_workers: int,
+    ) -> "ScanSource":
+        """
+        Return context manager yielding data blocks of scanned sequence
+
+        Args:
+            sequence (Optional[Union[str, pd.Series, pd.DataFrame]]): sequence string or uploaded sequence
+            path (Optional[str]): absolute path to uncompressed local FASTA file
+            record (Optional[str]): record name in multifasta file
+            max_workers (int): number of concurrent data requests
+
+        Returns:
+            ScanSource: context manager with data blocks
+        """
+        if path is not None:
+            fasta_index: FastaIndex = FastaIndex(path=path)
+            try:
+                fasta_record = fasta_index.get_record(record)
+            except (KeyError, ValueError):
+                fasta_index.close()
+                raise
+            return ScanSource(
+                chunks=fasta_index.iter_bytes(
+                    length=fasta_record.length, position=0, name=fasta_record.name
+                ),
+                close=fasta_index.close,
+            )
+
+        if isinstance(sequence, str):
+            block_size: int = Config.FASTA_CONFIG.BLOCK_SIZE
+            return ScanSource(
+                chunks=(
+                    sequence[start : start + block_size]
+                    for start in range(0, len(sequence), block_size)
+                )
+            )
+
+        if isinstance(sequence, pd.DataFrame):
+            sequence: pd.Series = sequence.iloc[0]
+        windows: Optional[Generator[bytes, None, None]] = (
+            self.__ports.sequence.iter_data(
+                id=sequence["id"],
+                length=sequence["length"],
+                position=0,
+                sequence_length=sequence["length"],
+                max_workers=max_workers,
+            )
+        )
+        return ScanSource(chunks=windows if windows is not None else list())
+
+
+class ScanSource:
+    """Data blocks of scanned sequence closed after scan"""
+
+    def __init__(
+        self,
+        *,
+        chunks: Iterable[Union[str, bytes]],
+        close: Optional[Callable[[], None]] = None,
+    ):
+        self.chunks: Iterable[Union[str, bytes]] = chunks
+        self.__close: Optional[Callable[[], None]] = close
+
+    def __enter__(self) -> Iterable[Union[str, bytes]]:
+        return self.chunks
+
+    def __exit__(self, *args) -> None:
+        # stops concurrent downloads of unread windows
+        if hasattr(self.chunks, "close"):
+            self.chunks.close()
+        if self.__close is not None:
+            self.__close()
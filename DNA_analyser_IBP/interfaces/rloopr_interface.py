@@ -2,16 +2,21 @@
 
 import os
 import time
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
 import pandas as pd
 
 from DNA_analyser_IBP.interfaces.analyse_interface import AnalyseInterface
 from DNA_analyser_IBP.models import RLoopr as Analyse
 from DNA_analyser_IBP.ports import Ports
-from DNA_analyser_IBP.statusbar import status_bar
+from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.statusbar import multiple_status_bar, status_bar
 from DNA_analyser_IBP.type import Types
-from DNA_analyser_IBP.utils import Logger, exception_handler, normalize_name
+from DNA_analyser_IBP.utils import (
+    Logger,
+    exception_handler,
+    normalize_name,
+)
 
 
 class Rloopr(AnalyseInterface):
@@ -20,15 +25,20 @@ class Rloopr(AnalyseInterface):
     def __init__(self, ports: Ports):
         self.__ports: Ports = ports
 
+    @property
+    def _port(self) -> Port:
+        return self.__ports.rloopr
+
     @exception_handler
     def analyse_creator(
         self,
         tags: Optional[List[str]] = None,
         riz_3g_cluster: Optional[bool] = False,
         riz_2g_cluster: Optional[bool] = False,
+        max_workers: Optional[int] = None,
         *,
         sequence: Union[pd.DataFrame, pd.Series],
-    ) -> None:
+    ) -> Optional[pd.DataFrame]:
         """
         Create Rloopr analyse
 
@@ -37,23 +47,51 @@ class Rloopr(AnalyseInterface):
             sequence (Union[pd.DataFrame, pd.Series]): one or many sequences to analyse
             riz_3g_cluster (Optional[bool]):
             riz_2g_cluster (Optional[bool]):
+            max_workers (Optional[int]): analyse sequences concurrently with given number of workers, single sequence is tracked the same way [default=None]
+
+        Returns:
+            Optional[pd.DataFrame]: analyse id, final batch status and elapsed time for each sequence if max_workers is set
         """
 
+        def _create_analyse(id: str, tags: List[Optional[str]]) -> Callable:
+            return lambda: self.__ports.rloopr.create_analyse(
+                id=id,
+                tags=tags,
+                riz_model=self._process_riz_models(
+                    riz_2g_cluster=riz_2g_cluster, riz_3g_cluster=riz_3g_cluster
+                ),
+            )
+
         def _analyse_creator(id: str, name: str, tags: List[Optional[str]]) -> None:
             status_bar(
                 ports=self.__ports,
-                func=lambda: self.__ports.rloopr.create_analyse(
-                    id=id,
-                    tags=tags,
-                    riz_model=self._process_riz_models(
-                        riz_2g_cluster=riz_2g_cluster, riz_3g_cluster=riz_3g_cluster
-                    ),
-                ),
+                func=_create_analyse(id=id, tags=tags),
                 name=normalize_name(name),
                 type=Types.RLOOPR,
             )
 
+        # single sequence is tracked as one row table when max_workers is set
+        if isinstance(sequence, pd.Series) and max_workers is not None:
+            sequence = sequence.to_frame().T
+
         if isinstance(sequence, pd.DataFrame):
+            if max_workers is not None:
+                jobs: list = [
+                    (
+                        row["id"],
+                        normalize_name(row["name"]),
+                        _create_analyse(
+                            id=row["id"], tags=self._process_tags(tags, row["tags"])
+                        ),
+                    )
+                    for _, row in sequence.iterrows()
+                ]
+                return multiple_status_bar(
+                    ports=self.__ports,
+                    jobs=jobs,
+                    type=Types.RLOOPR,
+                    max_workers=max_workers,
+                )
             for _, row in sequence.iterrows():
                 _tags = self._process_tags(tags, row["tags"])
                 _analyse_creator(id=row["id"], name=row["name"], tags=_tags)
@@ -165,6 +203,7 @@ class Rloopr(AnalyseInterface):
         *,
         analyse: Union[pd.DataFrame, pd.Series],
         path: str,
+        use_cache: bool = True,
     ) -> None:
         """
         Export RLoopr analyses result into csv files
@@ -172,6 +211,7 @@ class Rloopr(AnalyseInterface):
         Args:
             analyse (Union[pd.DataFrame, pd.Series]): g4hunter analyse DataFrame|Series
             path (str): absolute system path to output folder
+            use_cache (bool): False = bypass local result cache [Default=True]
         """
 
         def _export_csv(id: str, name: str) -> None:
@@ -179,7 +219,7 @@ class Rloopr(AnalyseInterface):
             file_path: str = os.path.join(path, f"{name}_result.csv")
 
             with open(file_path, "w") as new_file:
-                data: str = self.__ports.g4hunter.export_csv(id=id)
+                data: str = self.__ports.rloopr.export_csv(id=id, use_cache=use_cache)
                 new_file.write(data)
             Logger.info(f"file created -> {file_path}")
 
@@ -190,19 +230,27 @@ class Rloopr(AnalyseInterface):
             _export_csv(id=analyse["id"], name=analyse["title"])
 
     @exception_handler
-    def load_results(self, *, analyse: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    def load_results(
+        self, *, analyse: Union[pd.Series, pd.DataFrame], use_cache: bool = True
+    ) -> pd.DataFrame:
         """
         Return rloopr analyses results in DataFrame
 
         Args:
             analyse (Union[pd.Series, pd.DataFrame]): rloopr analyse
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: DataFrame with rloopr results
         """
         if isinstance(analyse, pd.Series):
-            return self.__ports.rloopr.load_result(id=analyse["id"])
+            return self.__ports.rloopr.load_result(
+                id=analyse["id"], use_cache=use_cache
+            )
         elif isinstance(analyse, pd.DataFrame):
-            return self.__ports.rloopr.load_result(id=analyse.iloc[0]["id"])
+            return self.__ports.rloopr.load_result(
+                id=analyse.iloc[0]["id"], use_cache=use_cache
+            )
         else:
             Logger.error("You have to insert pd.Series or pd.DataFrame!")
+
@@ -1,25 +1,64 @@
 # sequence_interface.py
 
+import os
 import time
-from typing import List, Optional, Union
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
+from DNA_analyser_IBP.adapters.json_body import SequenceData
+from DNA_analyser_IBP.batch_monitor import BatchMonitor
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.fasta_index import FastaIndex
+from DNA_analyser_IBP.manifest import (
+    ManifestRecord,
+    UploadManifest,
+    hash_data,
+    hash_file,
+)
 from DNA_analyser_IBP.models import Sequence as Data
 from DNA_analyser_IBP.ports import Ports
-from DNA_analyser_IBP.statusbar import status_bar
-from DNA_analyser_IBP.type import Types
+from DNA_analyser_IBP.sequence_index import (
+    SequenceDigest,
+    SequenceIndex,
+    SequenceIndexRecord,
+)
+from DNA_analyser_IBP.statusbar import (
+    multiple_status_bar,
+    run_concurrently,
+    status_bar,
+)
+from DNA_analyser_IBP.type import DataOutput, Types
 from DNA_analyser_IBP.utils import (
     Logger,
     _multifasta_parser,
+    convert_data,
     exception_handler,
+    is_compressed,
     normalize_name,
 )
 
 
 class Sequence:
-    def __init__(self, ports: Ports):
+    def __init__(self, ports: Ports, index: Optional[SequenceIndex] = None):
         self.__ports = ports
+        # local index of uploaded sequences, None = duplicates are not checked
+        self.__index: Optional[SequenceIndex] = index
+        # sequence id -> opened local FASTA file and record name
+        self.__local: Dict[str, Tuple[FastaIndex, Optional[str]]] = dict()
+        # sequence id -> local FASTA path and record name, stored in sequence index if set
+        self.__links: Dict[str, Tuple[str, Optional[str]]] = dict()
 
     @exception_handler
     def load_all(self, tags: Optional[List[str]] = None) -> pd.DataFrame:
@@ -67,27 +106,67 @@ class Sequence:
         self,
         length: Optional[int] = 100,
         position: Optional[int] = 0,
+        output: str = DataOutput.STRING,
+        stream: bool = False,
+        max_workers: Optional[int] = None,
         *,
         sequence: Union[pd.Series, pd.DataFrame],
-    ) -> str:
+    ) -> Union[str, bytes, np.ndarray, Generator]:
         """
-        Return slice of sequence data in string
+        Return slice of sequence data, intervals longer than 1000 bp are fetched from server
+        in concurrent windows, sequences linked with local FASTA file are read from it
 
         Args:
-            length (Optional[int]): sequence data length in interval <0;1000> [default=100]
+            length (Optional[int]): sequence data length up to sequence length [default=100]
             position (Optional[int]): data start position [default=0]
+            output (str): str|bytes|numpy, bytes and numpy uint8 skip building python string [default=str]
+            stream (bool): True = return generator of data windows in sequence order [default=False]
+            max_workers (Optional[int]): number of concurrent requests [default=connection pool size]
             sequence (Union[pd.Series, pd.DataFrame]): sequence in pd.Series
 
         Returns:
-            str: sequence data
+            Union[str, bytes, np.ndarray, Generator]: sequence data or generator of its windows
         """
 
         def _load_data(*, id: str, sequence_length: int):
+            local: Optional[Tuple[FastaIndex, Optional[str]]] = self._get_local(
+                id=id, length=sequence_length
+            )
+            if local is not None:
+                fasta_index, record = local
+                if stream:
+                    return (
+                        convert_data(data=block, output=output)
+                        for block in fasta_index.iter_bytes(
+                            length=length, position=position, name=record
+                        )
+                    )
+                return convert_data(
+                    data=fasta_index.fetch_bytes(
+                        length=length, position=position, name=record
+                    ),
+                    output=output,
+                )
+
+            if stream:
+                windows: Optional[Generator] = self.__ports.sequence.iter_data(
+                    id=id,
+                    length=length,
+                    position=position,
+                    sequence_length=sequence_length,
+                    max_workers=max_workers,
+                )
+                if windows is not None:
+                    return (convert_data(data=window, output=output) for window in windows)
+                return None
+
             return self.__ports.sequence.load_data(
                 id=id,
                 length=length,
                 position=position,
                 sequence_length=sequence_length,
+                output=output,
+                max_workers=max_workers,
             )
 
         if isinstance(sequence, pd.DataFrame):
@@ -99,6 +178,198 @@ class Sequence:
         else:
             Logger.error("Parameter sequence have to be pd.DataFrame or pd.Series!")
 
+    @exception_handler
+    def add_local_fasta(
+        self,
+        record: Optional[str] = None,
+        *,
+        sequence: Union[pd.Series, pd.DataFrame],
+        path: str,
+    ) -> None:
+        """
+        Link uploaded sequence with local FASTA file, load_data then reads its slices
+        from memory mapped file, .fai index is created next to FASTA file if missing,
+        link is stored in sequence index if set
+
+        Args:
+            record (Optional[str]): record name in multifasta file [default=None]
+            sequence (Union[pd.Series, pd.DataFrame]): sequence in pd.Series
+            path (str): absolute path to uncompressed FASTA file
+        """
+        if isinstance(sequence, pd.DataFrame):
+            sequence: pd.Series = sequence.iloc[0]
+        elif not isinstance(sequence, pd.Series):
+            Logger.error("Parameter sequence have to be pd.DataFrame or pd.Series!")
+            return
+
+        path: str = os.path.abspath(path)
+        try:
+            self._open_local(
+                id=sequence["id"], path=path, record=record, length=sequence["length"]
+            )
+        except ValueError as e:
+            Logger.error(str(e))
+            return
+
+        self._link_local(id=sequence["id"], path=path, record=record)
+        Logger.info(f"Sequence {sequence['id']} is linked with local file {path} ...")
+
+    @exception_handler
+    def remove_local_fasta(self, *, sequence: Union[pd.Series, pd.DataFrame]) -> None:
+        """
+        Unlink sequence from local FASTA file, load_data then reads it from server
+
+        Args:
+            sequence (Union[pd.Series, pd.DataFrame]): sequence in pd.Series
+        """
+        if isinstance(sequence, pd.DataFrame):
+            sequence: pd.Series = sequence.iloc[0]
+
+        self._unlink_local(id=sequence["id"])
+
+    def _get_local(
+        self, *, id: str, length: int
+    ) -> Optional[Tuple[FastaIndex, Optional[str]]]:
+        """
+        Return opened local FASTA file of linked sequence, links are opened on first use
+        and unreadable files are unlinked
+
+        Args:
+            id (str): sequence id
+            length (int): sequence length on server
+
+        Returns:
+            Optional[Tuple[FastaIndex, Optional[str]]]: FASTA file and record name, None if sequence is not linked
+        """
+        if id in self.__local:
+            return self.__local[id]
+
+        link: Optional[Tuple[str, Optional[str]]] = (
+            self.__index.find_local(id=id)
+            if self.__index is not None
+            else self.__links.get(id)
+        )
+        if link is None:
+            return None
+
+        try:
+            return self._open_local(id=id, path=link[0], record=link[1], length=length)
+        except (OSError, KeyError, ValueError) as e:
+            Logger.info(f"Local file of sequence {id} is unlinked, {e} ...")
+            self._unlink_local(id=id)
+            return None
+
+    def _open_local(
+        self, *, id: str, path: str, record: Optional[str], length: int
+    ) -> Tuple[FastaIndex, Optional[str]]:
+        """
+        Open local FASTA file record of sequence, one index and memory map is shared
+        by all records of the same file
+
+        Args:
+            id (str): sequence id
+            path (str): absolute path to uncompressed FASTA file
+            record (Optional[str]): record name, None for single record file
+            length (int): sequence length on server
+
+        Returns:
+            Tuple[FastaIndex, Optional[str]]: FASTA file and record name
+        """
+        fasta_index: FastaIndex = next(
+            (
+                fasta_index
+                for fasta_index, _ in self.__local.values()
+                if fasta_index.path == path
+            ),
+            None,
+        ) or FastaIndex(path=path)
+
+        try:
+            fasta_record = fasta_index.get_record(record)
+        except (KeyError, ValueError):
+            self._close_unused(fasta_index)
+            raise
+
+        if fasta_record.length != length:
+            self._close_unused(fasta_index)
+            raise ValueError(
+                f"Sequence {id} length {length} does not match local record {fasta_record.name} length {fasta_record.length}!"
+            )
+
+        previous: Optional[Tuple[FastaIndex, Optional[str]]] = self.__local.get(id)
+        self.__local[id] = (fasta_index, fasta_record.name)
+        if previous is not None:
+            self._close_unused(previous[0])
+        return self.__local[id]
+
+    def _link_local(self, *, id: str, path: str, record: Optional[str] = None) -> None:
+        """
+        Store link of sequence with local FASTA file, file is opened on first load_data
+
+        Args:
+            id (str): sequence id
+            path (str): absolute path to uncompressed FASTA file
+            record (Optional[str]): record name, None for single record file
+        """
+        if self.__index is not None:
+            self.__index.add_local(id=id, path=path, record=record)
+        else:
+            self.__links[id] = (path, record)
+
+    def _unlink_local(self, *, id: str) -> None:
+        """
+        Remove link of sequence with local FASTA file and close file if it is unused
+
+        Args:
+            id (str): sequence id
+        """
+        self.__links.pop(id, None)
+        if self.__index is not None:
+            self.__index.remove_local(id=id)
+
+        local: Optional[Tuple[FastaIndex, Optional[str]]] = self.__local.pop(id, None)
+        if local is not None:
+            self._close_unused(local[0])
+
+    def _link_uploaded(
+        self,
+        *,
+        result: pd.DataFrame,
+        path: Union[str, BinaryIO],
+        records: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        """
+        Link finished uploads with their uncompressed local FASTA file
+
+        Args:
+            result (pd.DataFrame): sequence id and final status of every uploaded record
+            path (Union[str, BinaryIO]): uploaded FASTA file
+            records (Optional[List[Optional[str]]]): record names of result rows [default=all records in file order]
+        """
+        if not isinstance(path, str) or is_compressed(path):
+            return
+
+        path: str = os.path.abspath(path)
+        if records is None:
+            # .fai index written here is reused when file is opened by load_data
+            try:
+                with FastaIndex(path=path) as fasta_index:
+                    records = list(fasta_index.records)
+            except ValueError as e:
+                Logger.info(f"File {path} cannot be linked with sequences, {e} ...")
+                return
+
+        if len(records) != len(result):
+            return
+
+        for record, (_, row) in zip(records, result.iterrows()):
+            if row["status"] == BatchStatus.FINISH:
+                self._link_local(id=row["id"], path=path, record=record)
+
+    def _close_unused(self, fasta_index: FastaIndex) -> None:
+        if not any(linked is fasta_index for linked, _ in self.__local.values()):
+            fasta_index.close()
+
     @exception_handler
     def text_creator(
         self,
@@ -106,22 +377,40 @@ class Sequence:
         tags: Optional[List[str]] = None,
         nucleic_type: str = "DNA",
         *,
-        string: str,
+        string: SequenceData,
         name: str,
-    ) -> None:
+    ) -> Optional[str]:
         """
-        Create sequence from string
+        Create sequence from string, sequence with the same content found in sequence index
+        is returned instead of new upload
 
         Args:
             circular (bool): True if sequence is circular False if not [default=True]
             tags (Optional[List[str]]): tags for sequence filtering [default=None]
             nucleic_type (str): string DNA|RNA [default=DNA]
-            string (str): sequence string
+            string (SequenceData): sequence string, ASCII bytes or iterable of chunks e.g. open file
             name (str): sequence name
+
+        Returns:
+            Optional[str]: id of created or already uploaded sequence
         """
         name: str = normalize_name(name=name)
+        digest: Optional[SequenceDigest] = None
+
+        # iterators can be read only once, so they are uploaded without check
+        if self.__index is not None and isinstance(
+            string, (str, bytes, bytearray, memoryview)
+        ):
+            digest = SequenceDigest.from_chunks([string])
+            existing: Optional[str] = self._find_uploaded(
+                records=self.__index.find(
+                    digest=digest, type=nucleic_type, circular=circular
+                )
+            )
+            if existing is not None:
+                return existing
 
-        status_bar(
+        result: pd.DataFrame = status_bar(
             ports=self.__ports,
             func=lambda: self.__ports.sequence.create_text_sequence(
                 circular=circular,
@@ -133,38 +422,216 @@ class Sequence:
             name=name,
             type=Types.SEQUENCE,
         )
+        return self._index_upload(
+            name=name,
+            result=result,
+            type=nucleic_type,
+            circular=circular,
+            digest=digest,
+        )
 
     @exception_handler
     def ncbi_creator(
         self,
         tags: Optional[List[str]] = None,
         circular: bool = True,
+        batch_size: int = Config.NCBI_CONFIG.BATCH_SIZE,
+        name: Optional[Union[str, List[str]]] = None,
+        max_workers: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
         *,
-        name: str,
-        ncbi_id: str,
-    ) -> None:
+        ncbi_id: Union[str, List[str], pd.DataFrame],
+    ) -> Union[Optional[str], pd.DataFrame]:
         """
-        Create sequence from NCBI
+        Create sequences from NCBI, many NCBI ids are imported in concurrent batched requests
+        and all batches are tracked at once, sequences imported from the same NCBI record found
+        in sequence index are returned instead of new import
 
         Args:
             tags (Optional[List[str]]): tags for sequence filtering [default=None]
             circular (bool): True if sequence is circular False if not [default=True]
+            batch_size (int): max number of NCBI ids in one import request [default=10]
+            name (Optional[Union[str, List[str]]]): sequence name or names of listed NCBI ids [default=NCBI id]
+            max_workers (int): max number of concurrent import requests [default=10]
+            ncbi_id (Union[str, List[str], pd.DataFrame]): sequence id from https://www.ncbi.nlm.nih.gov/, list of ids or DataFrame with NAME, TAG and NCBI_ID columns
+
+        Returns:
+            Union[Optional[str], pd.DataFrame]: id of created or already uploaded sequence,
+            for many NCBI ids name, sequence id, final status and elapsed seconds for every id
+        """
+        tags: List[str] = tags if tags is not None else list()
+
+        if isinstance(ncbi_id, str):
+            return self._ncbi_single_creator(
+                tags=tags,
+                circular=circular,
+                name=normalize_name(name=name if name is not None else ncbi_id),
+                ncbi_id=ncbi_id,
+            )
+
+        records: List[Tuple[str, str, List[str]]] = self._get_ncbi_records(
+            tags=tags, name=name, ncbi_id=ncbi_id
+        )
+        # NCBI id of submitted records in job order
+        submitted: List[str] = list()
+        # name and id of records imported before
+        skipped: List[Tuple[str, str]] = list()
+        pending: List[Tuple[str, str, List[str]]] = list()
+
+        for record in records:
+            existing: Optional[str] = (
+                self._find_uploaded(
+                    records=self.__index.find_ncbi(
+                        ncbi_id=record[1], circular=circular
+                    )
+                )
+                if self.__index is not None
+                else None
+            )
+            if existing is not None:
+                skipped.append((record[0], existing))
+            else:
+                pending.append(record)
+
+        def _import(start: int) -> List[Optional["Data"]]:
+            batch: List[Tuple[str, str, List[str]]] = pending[start : start + batch_size]
+            try:
+                return self.__ports.sequence.create_ncbi_sequences(
+                    circular=circular, tags=tags, records=batch
+                )
+            except Exception as e:
+                Logger.error(
+                    f"NCBI records {start + 1}-{start + len(batch)} cannot be imported: {e}"
+                )
+                return list()
+
+        starts: List[int] = list(range(0, len(pending), batch_size))
+        imported: List[List[Optional["Data"]]] = run_concurrently(
+            (lambda start=start: _import(start) for start in starts), max_workers
+        )
+
+        monitor: BatchMonitor = BatchMonitor(
+            ports=self.__ports, description="Importing sequences"
+        )
+        for start, sequences in zip(starts, imported):
+            batch: List[Tuple[str, str, List[str]]] = pending[start : start + batch_size]
+            if len(sequences) != len(batch):
+                Logger.error(
+                    f"Server returned {len(sequences)} sequences for {len(batch)} NCBI records!"
+                )
+            # records without returned sequence are reported as failed
+            for index, (record_name, record_ncbi_id, _) in enumerate(batch):
+                sequence: Optional["Data"] = (
+                    sequences[index] if index < len(sequences) else None
+                )
+                monitor.add(
+                    id=sequence.id if sequence is not None else None,
+                    type=Types.SEQUENCE,
+                    name=record_name,
+                )
+                submitted.append(record_ncbi_id)
+
+        result: pd.DataFrame = monitor.wait().drop(columns="sequence_id")
+
+        if self.__index is not None:
+            for ncbi, (_, row) in zip(submitted, result.iterrows()):
+                if row["status"] == BatchStatus.FINISH:
+                    self.__index.add(
+                        id=row["id"], name=row["name"], circular=circular, ncbi=ncbi
+                    )
+
+        if skipped:
+            Logger.info(f"{len(skipped)} already imported sequences were skipped ...")
+        return self._prepend_skipped(result=result, skipped=skipped)
+
+    def _ncbi_single_creator(
+        self, *, tags: List[str], circular: bool, name: str, ncbi_id: str
+    ) -> Optional[str]:
+        """
+        Create one sequence from NCBI and wait for its batch
+
+        Args:
+            tags (List[str]): tags for sequence filtering
+            circular (bool): True if sequence is circular False if not
             name (str): sequence name
             ncbi_id (str): sequence id from https://www.ncbi.nlm.nih.gov/
+
+        Returns:
+            Optional[str]: id of created or already uploaded sequence
         """
-        name: str = normalize_name(name=name)
+        if self.__index is not None:
+            existing: Optional[str] = self._find_uploaded(
+                records=self.__index.find_ncbi(ncbi_id=ncbi_id, circular=circular)
+            )
+            if existing is not None:
+                return existing
 
-        status_bar(
+        result: pd.DataFrame = status_bar(
             ports=self.__ports,
             func=lambda: self.__ports.sequence.create_ncbi_sequence(
                 circular=circular,
                 name=name,
-                tags=tags if tags is not None else list(),
+                tags=tags,
                 ncbi_id=ncbi_id,
             ),
             name=name,
             type=Types.SEQUENCE,
         )
+        return self._index_upload(
+            name=name, result=result, circular=circular, ncbi=ncbi_id
+        )
+
+    @staticmethod
+    def _get_ncbi_records(
+        *,
+        tags: List[str],
+        name: Optional[Union[str, List[str]]],
+        ncbi_id: Union[List[str], pd.DataFrame],
+    ) -> List[Tuple[str, str, List[str]]]:
+        """
+        Return name, NCBI id and tags of every record from list or DataFrame
+
+        Args:
+            tags (List[str]): tags shared by all records
+            name (Optional[Union[str, List[str]]]): names of listed NCBI ids
+            ncbi_id (Union[List[str], pd.DataFrame]): list of NCBI ids or DataFrame with NAME, TAG and NCBI_ID columns
+
+        Returns:
+            List[Tuple[str, str, List[str]]]: name, NCBI id and tags of every record
+        """
+        if isinstance(ncbi_id, pd.DataFrame):
+            # columns are matched case-insensitive e.g. NAME,TAG,NCBI_ID csv header
+            frame: pd.DataFrame = ncbi_id.rename(
+                columns=lambda column: str(column).upper()
+            )
+            if "NCBI_ID" not in frame.columns:
+                raise ValueError("DataFrame has to contain NCBI_ID column!")
+
+            return [
+                (
+                    normalize_name(
+                        name=row["NAME"]
+                        if "NAME" in frame.columns and pd.notna(row["NAME"])
+                        else row["NCBI_ID"]
+                    ),
+                    row["NCBI_ID"],
+                    tags + [row["TAG"]]
+                    if "TAG" in frame.columns and pd.notna(row["TAG"])
+                    else list(tags),
+                )
+                for _, row in frame.iterrows()
+            ]
+
+        ncbi_ids: List[str] = list(ncbi_id)
+        names: List[str] = list(name) if name is not None else ncbi_ids
+        if isinstance(name, str) or len(names) != len(ncbi_ids):
+            raise ValueError(
+                "Parameter name has to be list of the same length as ncbi_id!"
+            )
+
+        return [
+            (normalize_name(name=record_name), record_ncbi_id, list(tags))
+            for record_name, record_ncbi_id in zip(names, ncbi_ids)
+        ]
 
     @exception_handler
     def file_creator(
@@ -172,13 +639,18 @@ class Sequence:
         tags: Optional[List[str]] = None,
         circular: bool = True,
         nucleic_type: str = "DNA",
+        compress: bool = False,
+        manifest: Optional[str] = None,
         *,
-        path: str,
+        path: Union[str, BinaryIO],
         name: str,
         format: str,
-    ) -> None:
+    ) -> Optional[str]:
         """
-        Create sequence from [TEXT|FASTA] file
+        Create sequence from [TEXT|FASTA] file, gzip|bgzip compressed files are streamed
+        and decompressed on the fly, sequence with the same content found in sequence index
+        is returned instead of new upload, uploaded uncompressed FASTA file is linked with
+        sequence for local load_data
 
         Args:
             tags (Optional[List[str]]): tags for sequence filtering [default=None]
@@ -186,57 +658,379 @@ class Sequence:
             name (str): sequence name
             nucleic_type (str): string DNA|RNA [default=DNA]
             format (str): string FASTA|PLAIN
-            path (str): absolute path to [TEXT|FASTA] file
+            compress (bool): True = send gzip compressed body, server has to accept Content-Encoding gzip [default=False]
+            manifest (Optional[str]): path to upload manifest, uploaded file is skipped and pending batch resumed [default=None]
+            path (Union[str, BinaryIO]): absolute path to [TEXT|FASTA] file or binary file-like object
+
+        Returns:
+            Optional[str]: id of created or already uploaded sequence
         """
         name: str = normalize_name(name=name)
+        digest: Optional[SequenceDigest] = None
 
-        status_bar(
-            ports=self.__ports,
-            func=lambda: self.__ports.sequence.create_file_sequence(
+        if manifest is not None and not isinstance(path, str):
+            raise ValueError("Upload manifest can be used only with file path!")
+
+        # file-like objects can be read only once, so they are uploaded without check
+        if self.__index is not None and isinstance(path, str):
+            digest = SequenceDigest.from_file(path=path, format=format)
+            existing: Optional[str] = self._find_uploaded(
+                records=self.__index.find(
+                    digest=digest, type=nucleic_type, circular=circular
+                )
+            )
+            if existing is not None:
+                return existing
+
+        def _create() -> "Data":
+            return self.__ports.sequence.create_file_sequence(
                 circular=circular,
                 path=path,
                 name=name,
                 tags=tags if tags is not None else list(),
                 nucleic_type=nucleic_type,
                 format=format,
-            ),
+                compress=compress,
+            )
+
+        if manifest is None:
+            result: pd.DataFrame = status_bar(
+                ports=self.__ports, func=_create, name=name, type=Types.SEQUENCE
+            )
+        else:
+            with UploadManifest(path=manifest) as upload_manifest:
+                content_hash: str = hash_file(path)
+                func: Optional[Callable] = self._get_upload_job(
+                    manifest=upload_manifest,
+                    name=name,
+                    content_hash=content_hash,
+                    create=_create,
+                )
+                if func is None:
+                    Logger.info(f"Sequence {name} is already uploaded ...")
+                    return upload_manifest.get(name=name, hash=content_hash).id
+
+                result = status_bar(
+                    ports=self.__ports, func=func, name=name, type=Types.SEQUENCE
+                )
+                upload_manifest.set(
+                    name=name,
+                    hash=content_hash,
+                    id=result.iloc[0]["id"],
+                    status=result.iloc[0]["status"],
+                )
+
+        if format.upper() == "FASTA":
+            self._link_uploaded(result=result, path=path, records=[None])
+        return self._index_upload(
             name=name,
-            type=Types.SEQUENCE,
+            result=result,
+            type=nucleic_type,
+            circular=circular,
+            digest=digest,
+        )
+
+    def _find_uploaded(self, *, records: List[SequenceIndexRecord]) -> Optional[str]:
+        """
+        Return id of first indexed sequence still stored on server, missing sequences are
+        removed from sequence index
+
+        Args:
+            records (List[SequenceIndexRecord]): indexed sequences with the same content
+
+        Returns:
+            Optional[str]: sequence id or None if no sequence is found
+        """
+        for record in records:
+            try:
+                sequence: Optional["Data"] = self.__ports.sequence.load_by_id(
+                    id=record.id
+                )
+            except Exception:
+                sequence = None
+
+            if sequence is not None and record.length in [None, sequence.length]:
+                Logger.info(
+                    f"Sequence {record.name} with the same content is already uploaded as {record.id} ..."
+                )
+                return record.id
+
+            self.__index.remove(id=record.id)
+
+        return None
+
+    def _index_upload(
+        self,
+        *,
+        name: str,
+        result: pd.DataFrame,
+        circular: bool,
+        type: Optional[str] = None,
+        digest: Optional[SequenceDigest] = None,
+        ncbi: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Store finished upload in sequence index
+
+        Args:
+            name (str): sequence name
+            result (pd.DataFrame): status bar result with id and final status
+            circular (bool): True if sequence is circular False if not
+            type (Optional[str]): string DNA|RNA, None for NCBI imports
+            digest (Optional[SequenceDigest]): digest of sequence data
+            ncbi (Optional[str]): NCBI sequence id
+
+        Returns:
+            Optional[str]: sequence id
+        """
+        id: Optional[str] = result.iloc[0]["id"]
+        finished: bool = result.iloc[0]["status"] == BatchStatus.FINISH
+
+        if self.__index is not None and finished and (digest is not None or ncbi):
+            self.__index.add(
+                id=id,
+                name=name,
+                type=type,
+                circular=circular,
+                digest=digest,
+                ncbi=ncbi,
+            )
+
+        return id
+
+    @staticmethod
+    def _prepend_skipped(
+        *, result: pd.DataFrame, skipped: List[Tuple[str, str]]
+    ) -> pd.DataFrame:
+        """
+        Prepend records found in sequence index or manifest as finished rows
+
+        Args:
+            result (pd.DataFrame): name, sequence id, final status and elapsed seconds of submitted records
+            skipped (List[Tuple[str, str]]): name and sequence id of skipped records
+
+        Returns:
+            pd.DataFrame: skipped and submitted records
+        """
+        if not skipped:
+            return result
+
+        skipped_result: pd.DataFrame = pd.DataFrame(
+            data=[[name, id, BatchStatus.FINISH, 0.0] for name, id in skipped],
+            columns=result.columns,
+        )
+        return (
+            pd.concat([skipped_result, result], ignore_index=True)
+            if len(result)
+            else skipped_result
         )
 
+    @staticmethod
+    def _get_upload_job(
+        *,
+        manifest: UploadManifest,
+        name: str,
+        content_hash: str,
+        create: Callable[[], "Data"],
+    ) -> Optional[Callable[[], "Data"]]:
+        """
+        Return function submitting record according to upload manifest
+
+        Args:
+            manifest (UploadManifest): upload manifest
+            name (str): sequence name
+            content_hash (str): content hash of record
+            create (Callable[[], Data]): function uploading record
+
+        Returns:
+            Optional[Callable[[], Data]]: upload or batch resume, None if record is already uploaded
+        """
+        record: Optional[ManifestRecord] = manifest.get(name=name, hash=content_hash)
+
+        if record is not None and record.is_uploaded:
+            return None
+        if record is not None and record.is_pending:
+            Logger.info(f"Batch of sequence {name} is resumed ...")
+            return lambda: Data(id=record.id, name=name, tags=list())
+
+        def _create() -> "Data":
+            sequence: "Data" = create()
+            # submitted batch is stored at once so it can be resumed after crash
+            manifest.set(
+                name=name,
+                hash=content_hash,
+                id=sequence.id if sequence is not None else None,
+                status=BatchStatus.WAITING if sequence is not None else BatchStatus.FAILED,
+            )
+            return sequence
+
+        return _create
+
     @exception_handler
     def multifasta_creator(
         self,
         tags: Optional[List[str]] = None,
         circular: bool = False,
+        bulk: bool = True,
+        max_workers: int = Config.TRANSPORT_CONFIG.POOL_SIZE,
+        compress: bool = False,
+        manifest: Optional[str] = None,
         *,
         path: str,
         nucleic_type: str,
-    ) -> None:
+    ) -> pd.DataFrame:
         """
-        Create sequence from [MultiFASTA] file
+        Create sequences from [MultiFASTA] file, whole file is sent in one upload if server
+        supports it, otherwise records are uploaded concurrently with bounded number in flight,
+        records with the same content as sequences in sequence index are not uploaded again,
+        uploaded records of uncompressed file are linked with sequences for local load_data
 
         Args:
             tags (Optional[List[str]]): tags for sequence filtering [default=None]
             circular (bool): True if sequence is circular False if not [default=True]
+            bulk (bool): True = try one multipart upload of whole file, not used with manifest or sequence index [default=True]
+            max_workers (int): max number of concurrent record uploads [default=10]
+            compress (bool): True = send bulk upload gzip compressed [default=False]
+            manifest (Optional[str]): path to upload manifest, uploaded records are skipped and pending batches resumed [default=None]
             nucleic_type (str): string DNA|RNA [default=DNA]
             path (str): absolute path to [TEXT|FASTA] file
+
+        Returns:
+            pd.DataFrame: name, sequence id, final status and elapsed seconds for every record
         """
-        for sequence_name, sequence_nucleic in _multifasta_parser(path=path):
-            sequence_name: str = normalize_name(name=sequence_name)
+        tags: List[str] = tags if tags is not None else list()
 
-            status_bar(
-                ports=self.__ports,
-                func=lambda: self.__ports.sequence.create_text_sequence(
+        if bulk and manifest is None and self.__index is None:
+            sequences: Optional[List["Data"]] = (
+                self.__ports.sequence.create_multifasta_sequence(
                     circular=circular,
-                    data=sequence_nucleic,
-                    name=sequence_name,
-                    tags=tags if tags is not None else list(),
+                    path=path,
+                    tags=tags,
                     nucleic_type=nucleic_type,
-                ),
-                name=sequence_name,
+                    compress=compress,
+                )
+            )
+            if sequences is not None:
+                monitor: BatchMonitor = BatchMonitor(
+                    ports=self.__ports, description="Uploading sequences"
+                )
+                for sequence in sequences:
+                    monitor.add(id=sequence.id, type=Types.SEQUENCE, name=sequence.name)
+                result: pd.DataFrame = monitor.wait().drop(columns="sequence_id")
+                self._link_uploaded(result=result, path=path)
+                return result
+
+            Logger.info(
+                "Server does not support bulk import, records are uploaded one by one ..."
+            )
+
+        upload_manifest: Optional[UploadManifest] = (
+            UploadManifest(path=manifest) if manifest is not None else None
+        )
+        # manifest hash, digest and FASTA record name of submitted jobs in job order
+        submitted: List[
+            Tuple[Optional[str], Optional[SequenceDigest], Optional[str]]
+        ] = list()
+        # name and id of records uploaded before
+        skipped: List[Tuple[str, str]] = list()
+
+        def _jobs() -> Generator[Tuple[None, str, Callable], None, None]:
+            # records stay in parser bytearrays, they are never decoded into strings
+            for sequence_name, sequence_nucleic in _multifasta_parser(
+                path=path, as_memoryview=True
+            ):
+                # faidx record name is the first word of header
+                record: Optional[str] = (
+                    sequence_name.split()[0] if sequence_name.split() else str()
+                )
+                sequence_name: str = normalize_name(name=sequence_name)
+                content_hash: Optional[str] = None
+                digest: Optional[SequenceDigest] = None
+
+                if self.__index is not None:
+                    digest = SequenceDigest.from_chunks([sequence_nucleic])
+                    existing: Optional[str] = self._find_uploaded(
+                        records=self.__index.find(
+                            digest=digest, type=nucleic_type, circular=circular
+                        )
+                    )
+                    if existing is not None:
+                        skipped.append((sequence_name, existing))
+                        continue
+
+                # record data is bound to its job and released after upload
+                create: Callable[[], "Data"] = (
+                    lambda name=sequence_name, data=sequence_nucleic: self.__ports.sequence.create_text_sequence(
+                        circular=circular,
+                        data=data,
+                        name=name,
+                        tags=tags,
+                        nucleic_type=nucleic_type,
+                    )
+                )
+
+                if upload_manifest is not None:
+                    content_hash = hash_data(sequence_nucleic)
+                    create = self._get_upload_job(
+                        manifest=upload_manifest,
+                        name=sequence_name,
+                        content_hash=content_hash,
+                        create=create,
+                    )
+                    if create is None:
+                        skipped.append(
+                            (
+                                sequence_name,
+                                upload_manifest.get(
+                                    name=sequence_name, hash=content_hash
+                                ).id,
+                            )
+                        )
+                        continue
+
+                submitted.append((content_hash, digest, record))
+                yield None, sequence_name, create
+
+        try:
+            result: pd.DataFrame = multiple_status_bar(
+                ports=self.__ports,
+                jobs=_jobs(),
                 type=Types.SEQUENCE,
+                max_workers=max_workers,
+                description="Uploading sequences",
+            ).drop(columns="sequence_id")
+
+            for (content_hash, digest, _), (_, row) in zip(
+                submitted, result.iterrows()
+            ):
+                if upload_manifest is not None:
+                    upload_manifest.set(
+                        name=row["name"],
+                        hash=content_hash,
+                        id=row["id"],
+                        status=row["status"],
+                    )
+                if digest is not None and row["status"] == BatchStatus.FINISH:
+                    self.__index.add(
+                        id=row["id"],
+                        name=row["name"],
+                        type=nucleic_type,
+                        circular=circular,
+                        digest=digest,
+                    )
+
+            self._link_uploaded(
+                result=result,
+                path=path,
+                records=[record for _, _, record in submitted],
             )
+        finally:
+            if upload_manifest is not None:
+                upload_manifest.close()
+
+        if skipped:
+            Logger.info(f"{len(skipped)} already uploaded sequences were skipped ...")
+        return self._prepend_skipped(result=result, skipped=skipped)
 
     @exception_handler
     def delete(self, *, sequence: Union[pd.DataFrame, pd.Series]) -> None:
@@ -249,6 +1043,9 @@ class Sequence:
 
         def _delete(id: str) -> None:
             if self.__ports.sequence.delete(id=id):
+                self._unlink_local(id=id)
+                if self.__index is not None:
+                    self.__index.remove(id=id)
                 Logger.info(f"Sequence {id} was deleted!")
                 time.sleep(1)
             else:
@@ -2,79 +2,144 @@
 
 import os
 import time
-from typing import List, Optional, Union, Dict
+from typing import Callable, List, Optional, Union, Dict
 
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from DNA_analyser_IBP.interfaces.analyse_interface import AnalyseInterface
+from DNA_analyser_IBP.engines import find_zdna, zdna_parameters
+from DNA_analyser_IBP.interfaces.analyse_interface import (
+    AnalyseInterface,
+    LocalAnalyseMixin,
+)
 from DNA_analyser_IBP.models import ZDna as Analyse
 from DNA_analyser_IBP.ports import Ports
-from DNA_analyser_IBP.statusbar import status_bar
+from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.statusbar import multiple_status_bar, status_bar
 from DNA_analyser_IBP.type import Types
-from DNA_analyser_IBP.utils import Logger, exception_handler, normalize_name
+from DNA_analyser_IBP.utils import (
+    Logger,
+    exception_handler,
+    normalize_name,
+)
 
-class ZDna(AnalyseInterface):
+class ZDna(LocalAnalyseMixin, AnalyseInterface):
 
     def __init__(self, ports: Ports):
+        super().__init__(ports)
         self.__ports = ports
 
+    @property
+    def _port(self) -> Port:
+        return self.__ports.zdna
+
     
     @exception_handler
     def analyse_creator(
         self,
         tags: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        local: bool = False,
         *,
         min_sequence_size: int = 10,
         model: Optional[List[str]] = "model1",
-        GC_score: float = 25,
-        GTAC_score: float = 3,
-        AT_score: float = 0,
-        oth_score: float = 0,
-        min_score_percentage: float = 12,
-        sequence: Union[pd.DataFrame, pd.Series],
-    ) -> None:
+        GC_score: Optional[float] = None,
+        GTAC_score: Optional[float] = None,
+        AT_score: Optional[float] = None,
+        oth_score: Optional[float] = None,
+        min_score_percentage: Optional[float] = None,
+        sequence: Union[pd.DataFrame, pd.Series, str, Dict[str, str]],
+    ) -> Optional[pd.DataFrame]:
         """
-        Create z-dna analyse
+        Create z-dna analyse, with local=True sequences are scored by local engine
+        without server batch and results are kept in memory
 
         Args:
             tags (Optional[List[str]]): tags for analyse filtering [default=None]
-            sequence (Union[pd.DataFrame, pd.Series]): one or many sequences to analyse
-        
-        
-        _model_defaults: Dict = {
-            "model1": {"GC_score": 25, "GTAC_score": 3, "AT_score": 0, "min_score_percentage": 12},
-            "model2": {"GC_score": 2, "GTAC_score": 1, "AT_score": 0.5, "min_score_percentage": 50},
-        }
-
-        # setting default argument values based on model settings
-        selected_model = model[0] if isinstance(model, list) and model else "model1"
-        defaults = _model_defaults.get(selected_model, _model_defaults["model1"])
-        
-        for arg in [GC_score, GTAC_score, AT_score, min_score_percentage]:
-            arg = arg if arg is not None else defaults["{arg}"]
+            max_workers (Optional[int]): analyse sequences concurrently with given number of workers, single sequence is tracked the same way [default=None]
+            local (bool): True = score sequences locally, always used for raw sequence strings [default=False]
+            min_sequence_size (int): minimal length of sequences searched, minimum 6 [default=10]
+            model (Optional[List[str]]): model1|model2 providing default scores [default=model1]
+            GC_score (Optional[float]): score for the GC pair, minimum 0.1 [default=25 (model1), 2 (model2)]
+            GTAC_score (Optional[float]): score for the GT or AC pair, minimum 0 [default=3 (model1), 1 (model2)]
+            AT_score (Optional[float]): score for the AT pair, minimum 0 [default=0 (model1), 0.5 (model2)]
+            oth_score (Optional[float]): score for the other pairs [default=0]
+            min_score_percentage (Optional[float]): minimum window score in %, minimum 12 [default=12 (model1), 50 (model2)]
+            sequence (Union[pd.DataFrame, pd.Series, str, Dict[str, str]]): one or many sequences to analyse, raw sequence or name -> sequence dict
+
+        Returns:
+            Optional[pd.DataFrame]: analyse id, final batch status and elapsed time for each sequence if max_workers is set,
+            local analyses in DataFrame if local is set
         """
+        # scores not given explicitly are taken from selected model
+        scores: Dict[str, float] = zdna_parameters(
+            model=model,
+            GC_score=GC_score,
+            GTAC_score=GTAC_score,
+            AT_score=AT_score,
+            oth_score=oth_score,
+            min_score_percentage=min_score_percentage,
+        )
+
+        if local or isinstance(sequence, (str, dict)):
+            return self._local_analyse_creator(
+                tags=tags,
+                sequence=sequence,
+                engine=lambda data: find_zdna(
+                    sequence=data, min_sequence_size=min_sequence_size, **scores
+                ),
+                create=lambda data, results, **fields: Analyse(
+                    **fields,
+                    selectedModel=model,
+                    minSequenceSize=min_sequence_size,
+                    score_gc=scores["GC_score"],
+                    score_gtac=scores["GTAC_score"],
+                    score_at=scores["AT_score"],
+                    score_oth=scores["oth_score"],
+                    threshold=scores["min_score_percentage"],
+                ),
+            )
+
+        def _create_analyse(id: str, tags: List[Optional[str]]) -> Callable:
+            return lambda: self.__ports.zdna.create_analyse(
+                id=id,
+                tags=tags,
+                min_sequence_size=min_sequence_size,
+                model=self._process_prediction_models(model=model) if model not in ["model1", "model2"] else model,
+                **scores,
+            )
 
         def _analyse_creator(id: str, name: str, tags: List[Optional[str]]) -> None:
             name: str = normalize_name(name)
             status_bar(
                 ports=self.__ports,
-                func=lambda: self.__ports.zdna.create_analyse(
-                    id=id,
-                    tags=tags,
-                    min_sequence_size=min_sequence_size,
-                    model=self._process_prediction_models(model=model) if model not in ["model1", "model2"] else model,
-                    GC_score=GC_score,
-                    GTAC_score=GTAC_score,
-                    AT_score=AT_score,
-                    oth_score=oth_score,
-                    min_score_percentage=min_score_percentage,
-                ),
+                func=_create_analyse(id=id, tags=tags),
                 name=name,
                 type=Types.ZDNA,
             )
 
+        # single sequence is tracked as one row table when max_workers is set
+        if isinstance(sequence, pd.Series) and max_workers is not None:
+            sequence = sequence.to_frame().T
+
         if isinstance(sequence, pd.DataFrame):
+            if max_workers is not None:
+                jobs: list = [
+                    (
+                        row["id"],
+                        normalize_name(row["name"]),
+                        _create_analyse(
+                            id=row["id"], tags=self._process_tags(tags, row["tags"])
+                        ),
+                    )
+                    for _, row in sequence.iterrows()
+                ]
+                return multiple_status_bar(
+                    ports=self.__ports,
+                    jobs=jobs,
+                    type=Types.ZDNA,
+                    max_workers=max_workers,
+                )
             for _, row in sequence.iterrows():
                 _tags = self._process_tags(tags, row["tags"])
                 _analyse_creator(id=row["id"], name=row["name"], tags=_tags)
@@ -143,22 +208,31 @@ class ZDna(AnalyseInterface):
         return zdna.get_data_frame()
     
     @exception_handler
-    def load_results(self, *, analyse: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    def load_results(
+        self, *, analyse: Union[pd.Series, pd.DataFrame], use_cache: bool = True
+    ) -> pd.DataFrame:
         """
         Return z-dna analyses results in DataFrame
 
         Args:
             analyse (Union[pd.Series, pd.DataFrame]): z-dna analyse
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: DataFrame with z-dna results
         """
         if isinstance(analyse, pd.Series):
-            return self.__ports.zdna.load_result(id=analyse["id"])
+            id: str = analyse["id"]
         elif isinstance(analyse, pd.DataFrame):
-            return self.__ports.zdna.load_result(id=analyse.iloc[0]["id"])
+            id: str = analyse.iloc[0]["id"]
         else:
             Logger.error("You have to insert pd.Series or pd.DataFrame!")
+            return
+
+        local: Optional[pd.DataFrame] = self._load_local_result(id=id)
+        if local is not None:
+            return local
+        return self.__ports.zdna.load_result(id=id, use_cache=use_cache)
 
     @exception_handler
     def get_heatmap_data(
@@ -166,6 +240,7 @@ class ZDna(AnalyseInterface):
         segments: Optional[int] = 31,
         *,
         analyse: Union[pd.Series, pd.DataFrame],
+        use_cache: bool = True,
     ) -> pd.DataFrame:
         """
         Return DataFrame with heatmap data
@@ -173,13 +248,14 @@ class ZDna(AnalyseInterface):
         Args:
             segments (Optional[int]): z-dna analyse series [Default=31]
             analyse (Union[pd.Series, pd.DataFrame]): analyse series data to get heatmap
+            use_cache (bool): False = bypass local result cache [Default=True]
 
         Returns:
             pd.DataFrame: raw data used to create heatmap
         """
         if isinstance(analyse, pd.Series):
             return self.__ports.zdna.load_heatmap(
-                id=analyse["id"], segments=segments
+                id=analyse["id"], segments=segments, use_cache=use_cache
             )
         else:
             Logger.error("You have to insert pd.Series!")
@@ -298,6 +374,7 @@ class ZDna(AnalyseInterface):
         *,
         analyse: Union[pd.DataFrame, pd.Series],
         path: str,
+        use_cache: bool = True,
     ) -> None:
         """
         Export z-dna analyses result into csv files
@@ -305,6 +382,7 @@ class ZDna(AnalyseInterface):
         Args:
             analyse (Union[pd.DataFrame, pd.Series]): z-dna analyse DataFrame|Series
             path (str): absolute system path to output folder
+            use_cache (bool): False = bypass local result cache [Default=True]
         """
 
         def _export_csv(id: str, name: str) -> None:
@@ -312,7 +390,7 @@ class ZDna(AnalyseInterface):
             file_path: str = os.path.join(path, f"{name}_{id}_result.csv")
 
             with open(file_path, "w") as new_file:
-                data: str = self.__ports.zdna.export_csv(id=id)
+                data: str = self.__ports.zdna.export_csv(id=id, use_cache=use_cache)
                 new_file.write(data)
             Logger.info(f"file created -> {file_path}")
 
@@ -332,6 +410,8 @@ class ZDna(AnalyseInterface):
         """
 
         def _delete(id: str) -> None:
+            if self._delete_local(id=id):
+                return
             if self.__ports.zdna.delete(id=id):
                 Logger.info(f"z-dna analyse {id} was deleted!")
                 time.sleep(1)
@@ -1,14 +1,34 @@
 from DNA_analyser_IBP.intersection.annotation import (
     Annotation,
+    AnnotationCollection,
     create_annotation_list,
     get_annotation_labels,
 )
-from DNA_analyser_IBP.intersection.g4_result import G4Result, create_g4hunter_list
+from DNA_analyser_IBP.intersection.g4_result import (
+    G4Result,
+    G4ResultCollection,
+    create_g4hunter_list,
+    get_group_indexes,
+)
+from DNA_analyser_IBP.intersection.pairing import FilePairing, pair_files
+from DNA_analyser_IBP.intersection.overlay import (
+    count_overlay,
+    count_overlay_arrays,
+    overlay_files,
+)
 
 __all__ = [
     "G4Result",
+    "G4ResultCollection",
     "create_g4hunter_list",
+    "get_group_indexes",
     "Annotation",
+    "AnnotationCollection",
     "create_annotation_list",
     "get_annotation_labels",
+    "count_overlay",
+    "count_overlay_arrays",
+    "overlay_files",
+    "FilePairing",
+    "pair_files",
 ]
@@ -1,7 +1,9 @@
 # annotation.py
 
-import csv
-from typing import List
+from typing import Iterator, List, Union
+
+import numpy as np
+import pandas as pd
 
 from DNA_analyser_IBP.intersection.g4_result import G4Result
 from DNA_analyser_IBP.utils import exception_handler
@@ -10,6 +12,8 @@ from DNA_analyser_IBP.utils import exception_handler
 class Annotation:
     """Annotations object used for intersections"""
 
+    __slots__ = ("start", "end", "after", "before", "feature")
+
     def __init__(self, start: int, end: int, feature: str, area: int):
         self.start = start
         self.end = end
@@ -54,46 +58,107 @@ class Annotation:
         return self.end < analyse.middle <= self.after
 
 
+class AnnotationCollection:
+    """Annotations stored in arrays sorted by start, iterating yields Annotation objects"""
+
+    __slots__ = ("start", "end", "before", "after", "feature_code", "labels", "area")
+
+    def __init__(
+        self, *, start: np.ndarray, end: np.ndarray, feature: List[str], area: int
+    ):
+        start: np.ndarray = np.asarray(start, dtype=np.int64)
+        order: np.ndarray = np.argsort(start, kind="stable")
+        feature_code, labels = pd.factorize(np.asarray(feature, dtype=object)[order])
+
+        self.area: int = area
+        self.start: np.ndarray = start[order]
+        self.end: np.ndarray = np.asarray(end, dtype=np.int64)[order]
+        self.after: np.ndarray = self.end + area
+        self.before: np.ndarray = np.where(self.start > area, self.start - area, 0)
+        self.feature_code: np.ndarray = feature_code.astype(np.int32)
+        self.labels: List[str] = list(labels)
+
+    @classmethod
+    def from_annotations(cls, annotations: List[Annotation]) -> "AnnotationCollection":
+        """
+        Create collection from Annotation objects sharing one area size
+
+        Args:
+            annotations (List[Annotation]): annotations
+
+        Returns:
+            (AnnotationCollection): annotations in arrays
+        """
+        return cls(
+            start=[annotation.start for annotation in annotations],
+            end=[annotation.end for annotation in annotations],
+            feature=[annotation.feature for annotation in annotations],
+            # all annotations are created with the same area size
+            area=annotations[0].after - annotations[0].end if annotations else 0,
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, index: int) -> Annotation:
+        return Annotation(
+            start=int(self.start[index]),
+            end=int(self.end[index]),
+            feature=self.labels[self.feature_code[index]],
+            area=self.area,
+        )
+
+    def __iter__(self) -> Iterator[Annotation]:
+        for start, end, feature_code in zip(
+            self.start.tolist(), self.end.tolist(), self.feature_code.tolist()
+        ):
+            yield Annotation(
+                start=start, end=end, feature=self.labels[feature_code], area=self.area
+            )
+
+    def __repr__(self):
+        return f"<AnnotationCollection annotations: {len(self)}>"
+
+
 @exception_handler
-def create_annotation_list(annotation: str, area_size: int) -> List[Annotation]:
+def create_annotation_list(annotation: str, area_size: int) -> AnnotationCollection:
     """
-    Return list of Annotation objects
+    Return annotations parsed from annotation csv file sorted by start
 
     Args:
         annotation (str): path to parsed annotation file
         area_size (int): size of overlay region outside annotation [Default=100]
 
     Returns:
-        (List[annotation]): annotations
+        (AnnotationCollection): annotations
     """
-    annotation_list: list = list()
-
-    with open(annotation, "r") as file:
-        reader = csv.reader(file, delimiter=",")
-        next(reader)
-        for row in reader:
-            annotation_list.append(
-                Annotation(
-                    start=int(row[1]),
-                    end=int(row[2]),
-                    feature=row[4],
-                    area=area_size,
-                )
-            )
-    annotation_list = sorted(annotation_list, key=lambda a: a.start)
-    return annotation_list
+    data: pd.DataFrame = pd.read_csv(
+        annotation, usecols=[1, 2, 4], keep_default_na=False
+    )
+
+    return AnnotationCollection(
+        start=data.iloc[:, 0].to_numpy(),
+        end=data.iloc[:, 1].to_numpy(),
+        feature=data.iloc[:, 2].astype(str).to_numpy(),
+        area=area_size,
+    )
 
 
 @exception_handler
-def get_annotation_labels(*, annotation_list: List[Annotation]) -> List[str]:
+def get_annotation_labels(
+    *, annotation_list: Union[AnnotationCollection, List[Annotation]]
+) -> List[str]:
     """Return list with all annotation labels
 
     Args:
-        annotation_list (List[Annotation]): parsed files of annotations
+        annotation_list (Union[AnnotationCollection, List[Annotation]]): parsed files of annotations
 
     Returns:
         List[str]: list of all annotation labels e.g. ['CDS', 'rRNA', ...]
     """
+    if isinstance(annotation_list, AnnotationCollection):
+        return list(annotation_list.labels)
+
     label_list: list = list()
     for annotation in annotation_list:
         if annotation.feature not in label_list:
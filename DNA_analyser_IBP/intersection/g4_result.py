@@ -1,14 +1,21 @@
 # g4hunter.py
 
-import csv
-from typing import List
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
 
 from DNA_analyser_IBP.utils import exception_handler
 
+# upper score bounds of first five groups used in annotation intersection
+GROUP_THRESHOLDS: List[float] = [1.2, 1.4, 1.6, 1.8, 2.0]
+
 
 class G4Result:
     """G4Hunter result object"""
 
+    __slots__ = ("score", "length", "position", "middle")
+
     def __init__(self, position: int, length: int, score: float):
         self.score = score
         self.length = length
@@ -36,20 +43,91 @@ class G4Result:
             return 16
 
 
+class G4ResultCollection:
+    """G4Hunter results stored in arrays, iterating yields G4Result objects"""
+
+    __slots__ = ("position", "length", "score", "middle")
+
+    def __init__(self, *, position: np.ndarray, length: np.ndarray, score: np.ndarray):
+        self.position: np.ndarray = np.asarray(position, dtype=np.int64)
+        self.length: np.ndarray = np.asarray(length, dtype=np.int64)
+        self.score: np.ndarray = np.asarray(score, dtype=np.float64)
+        self.middle: np.ndarray = self.position + (self.length // 2)
+
+    @classmethod
+    def from_results(cls, results: List[G4Result]) -> "G4ResultCollection":
+        """
+        Create collection from G4Result objects
+
+        Args:
+            results (List[G4Result]): G4Hunter results
+
+        Returns:
+            (G4ResultCollection): G4Hunter results in arrays
+        """
+        return cls(
+            position=[result.position for result in results],
+            length=[result.length for result in results],
+            score=[result.score for result in results],
+        )
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def __getitem__(self, index: int) -> G4Result:
+        return G4Result(
+            position=int(self.position[index]),
+            length=int(self.length[index]),
+            score=float(self.score[index]),
+        )
+
+    def __iter__(self) -> Iterator[G4Result]:
+        for position, length, score in zip(
+            self.position.tolist(), self.length.tolist(), self.score.tolist()
+        ):
+            yield G4Result(position=position, length=length, score=score)
+
+    def __repr__(self):
+        return f"<G4ResultCollection results: {len(self)}>"
+
+    def get_group_indexes(self) -> np.ndarray:
+        """
+        Get group indexes of all results used in annotation intersection
+
+        Returns:
+            (np.ndarray): group indexes 0-5
+        """
+        return get_group_indexes(self.score)
+
+
+def get_group_indexes(scores: np.ndarray) -> np.ndarray:
+    """
+    Get group indexes of all scores at once, group id is 3 * index + 1
+
+    Args:
+        scores (np.ndarray): absolute G4Hunter scores
+
+    Returns:
+        (np.ndarray): group indexes 0-5
+    """
+    return np.searchsorted(GROUP_THRESHOLDS, scores, side="left")
+
+
 @exception_handler
-def create_g4hunter_list(analyse: str) -> List[G4Result]:
+def create_g4hunter_list(analyse: str) -> G4ResultCollection:
     """
-    Return list of G4Result objects
+    Return G4Hunter results parsed from result csv file
+
+    Args:
+        analyse (str): path to g4hunter analyse result file
 
     Returns:
-        (List[G4Result]): G4Hunter results
+        (G4ResultCollection): G4Hunter results
     """
-    analyse_list: list = list()
-    with open(analyse, "r") as file:
-        reader = csv.reader(file, delimiter="\t")
-        next(reader)
-        for row in reader:
-            analyse_list.append(
-                G4Result(position=int(row[1]), length=int(row[2]), score=float(row[4]))
-            )
-        return analyse_list
+    data: pd.DataFrame = pd.read_csv(analyse, sep="\t", usecols=[1, 2, 4])
+
+    return G4ResultCollection(
+        position=data.iloc[:, 0].to_numpy(),
+        length=data.iloc[:, 1].to_numpy(),
+        score=data.iloc[:, 2].to_numpy(),
+    )
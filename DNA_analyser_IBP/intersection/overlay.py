@@ -0,0 +1,140 @@
+# overlay.py
+
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from DNA_analyser_IBP.intersection.annotation import (
+    Annotation,
+    AnnotationCollection,
+    create_annotation_list,
+)
+from DNA_analyser_IBP.intersection.g4_result import (
+    GROUP_THRESHOLDS,
+    G4Result,
+    G4ResultCollection,
+    create_g4hunter_list,
+    get_group_indexes,
+)
+
+GROUPS_COUNT: int = len(GROUP_THRESHOLDS) + 1
+
+
+def count_overlay_arrays(
+    *,
+    middles: np.ndarray,
+    scores: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    befores: np.ndarray,
+    afters: np.ndarray,
+    feature_codes: np.ndarray,
+    features_count: int,
+) -> np.ndarray:
+    """
+    Count PQS middles before <before, start), in <start, end> and after (end, after>
+    every annotation, PQS are sorted once per score group and windows are searched
+
+    Args:
+        middles (np.ndarray): PQS middle positions
+        scores (np.ndarray): PQS absolute scores
+        starts (np.ndarray): annotation starts
+        ends (np.ndarray): annotation ends
+        befores (np.ndarray): annotation before area starts
+        afters (np.ndarray): annotation after area ends
+        feature_codes (np.ndarray): annotation feature indexes into labels
+        features_count (int): number of feature labels
+
+    Returns:
+        (np.ndarray): counts [features_count x 18] ordered by group and BEFORE/IN/AFTER
+    """
+    result: np.ndarray = np.zeros((features_count, GROUPS_COUNT * 3), dtype=np.int64)
+    group_indexes: np.ndarray = get_group_indexes(scores)
+
+    for group_index in range(GROUPS_COUNT):
+        group_middles: np.ndarray = np.sort(middles[group_indexes == group_index])
+
+        start_left: np.ndarray = np.searchsorted(group_middles, starts, side="left")
+        end_right: np.ndarray = np.searchsorted(group_middles, ends, side="right")
+        counts: List[np.ndarray] = [
+            start_left - np.searchsorted(group_middles, befores, side="left"),
+            end_right - start_left,
+            np.searchsorted(group_middles, afters, side="right") - end_right,
+        ]
+
+        for offset, count in enumerate(counts):
+            result[:, group_index * 3 + offset] = np.bincount(
+                feature_codes, weights=count, minlength=features_count
+            )
+
+    return result
+
+
+def count_overlay(
+    *,
+    analyse_list: Union[G4ResultCollection, List[G4Result]],
+    annotation_list: Union[AnnotationCollection, List[Annotation]],
+    labels: List[str],
+) -> np.ndarray:
+    """
+    Count PQS before, in and after annotations for each feature label and score group
+
+    Args:
+        analyse_list (Union[G4ResultCollection, List[G4Result]]): G4Hunter results
+        annotation_list (Union[AnnotationCollection, List[Annotation]]): annotations
+        labels (List[str]): annotation labels e.g. ['CDS', 'rRNA', ...]
+
+    Returns:
+        (np.ndarray): counts [len(labels) x 18] ordered by group and BEFORE/IN/AFTER
+    """
+    if not isinstance(analyse_list, G4ResultCollection):
+        analyse_list = G4ResultCollection.from_results(analyse_list)
+    if not isinstance(annotation_list, AnnotationCollection):
+        annotation_list = AnnotationCollection.from_annotations(annotation_list)
+
+    # map collection feature codes to positions in given labels
+    label_indexes: dict = {label: index for index, label in enumerate(labels)}
+    label_codes: np.ndarray = np.array(
+        [label_indexes[label] for label in annotation_list.labels], dtype=np.int64
+    )
+
+    return count_overlay_arrays(
+        middles=analyse_list.middle,
+        scores=analyse_list.score,
+        starts=annotation_list.start,
+        ends=annotation_list.end,
+        befores=annotation_list.before,
+        afters=annotation_list.after,
+        feature_codes=label_codes[annotation_list.feature_code],
+        features_count=len(labels),
+    )
+
+
+def overlay_files(
+    *, analyse_file: str, annotation_file: str, area_size: int
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Parse G4Hunter result and annotation files and count their overlay,
+    module level function so it can run in worker processes
+
+    Args:
+        analyse_file (str): path to g4hunter analyse result file
+        annotation_file (str): path to parsed annotation file
+        area_size (int): size of overlay region outside annotation
+
+    Returns:
+        (Tuple[List[str], np.ndarray]): feature labels and their overlay counts
+    """
+    annotation_list: AnnotationCollection = create_annotation_list(
+        annotation=annotation_file, area_size=area_size
+    )
+    analyse_list: G4ResultCollection = create_g4hunter_list(analyse=analyse_file)
+
+    if annotation_list is None or analyse_list is None:
+        raise ValueError(f"Files {analyse_file}, {annotation_file} cannot be parsed!")
+
+    labels: List[str] = list(annotation_list.labels)
+    counts: np.ndarray = count_overlay(
+        analyse_list=analyse_list, annotation_list=annotation_list, labels=labels
+    )
+    return labels, counts
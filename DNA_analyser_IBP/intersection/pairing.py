@@ -0,0 +1,125 @@
+# pairing.py
+
+import os
+import re
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set
+
+# characters separating name tokens e.g. melanogaster_2_result.csv
+TOKEN_SEPARATOR = re.compile(r"[._\-\s]+")
+
+
+class FilePairing:
+    """Annotation and analyse file pairs with unmatched and ambiguous files"""
+
+    __slots__ = ("pairs", "unmatched_annotations", "unmatched_analyses", "ambiguous")
+
+    def __init__(
+        self,
+        *,
+        pairs: List[List[str]],
+        unmatched_annotations: List[str],
+        unmatched_analyses: List[str],
+        ambiguous: Dict[str, List[str]],
+    ):
+        self.pairs: List[List[str]] = pairs
+        self.unmatched_annotations: List[str] = unmatched_annotations
+        self.unmatched_analyses: List[str] = unmatched_analyses
+        self.ambiguous: Dict[str, List[str]] = ambiguous
+
+    def __repr__(self):
+        return (
+            f"<FilePairing pairs: {len(self.pairs)} "
+            f"unmatched: {len(self.unmatched_annotations)}/{len(self.unmatched_analyses)} "
+            f"ambiguous: {len(self.ambiguous)}>"
+        )
+
+
+def get_name_keys(name: str) -> Set[str]:
+    """
+    Return all token aligned substrings of file name
+
+    Args:
+        name (str): file basename e.g. melanogaster_2_result.csv
+
+    Returns:
+        Set[str]: e.g. {melanogaster, melanogaster_2, 2_result, ...}
+    """
+    separators: list = list(TOKEN_SEPARATOR.finditer(name))
+    starts: List[int] = [0] + [separator.end() for separator in separators]
+    ends: List[int] = [separator.start() for separator in separators] + [len(name)]
+
+    return {name[start:end] for start in starts for end in ends if end > start}
+
+
+def get_annotation_key(path: str) -> str:
+    """
+    Return annotation file name without extensions
+
+    Args:
+        path (str): annotation file path
+
+    Returns:
+        str: e.g. melanogaster_2 for /annotations/melanogaster_2.csv
+    """
+    return os.path.basename(path).split(".")[0]
+
+
+def pair_files(
+    *,
+    annotation_list: List[str],
+    analyse_list: List[str],
+    key: Optional[Callable[[str], str]] = None,
+) -> FilePairing:
+    """
+    Pair annotation and analyse files through index of analyse names built once
+
+    Without key annotation name has to be token aligned part of analyse name
+    e.g. melanogaster_2.csv -> melanogaster_2_result.csv but not melanogaster_20_result.csv,
+    with key both files have to have the same key.
+
+    Args:
+        annotation_list (List[str]): annotation files
+        analyse_list (List[str]): analyse files
+        key (Optional[Callable[[str], str]]): key extractor applied on both file paths
+
+    Returns:
+        FilePairing: pairs, unmatched and ambiguous files
+    """
+    index: Dict[str, List[str]] = defaultdict(list)
+
+    for analyse in analyse_list:
+        if key is not None:
+            index[key(analyse)].append(analyse)
+        else:
+            for name_key in get_name_keys(os.path.basename(analyse)):
+                index[name_key].append(analyse)
+
+    pairs: List[List[str]] = list()
+    unmatched_annotations: List[str] = list()
+    ambiguous: Dict[str, List[str]] = dict()
+    matched_analyses: Set[str] = set()
+
+    for annotation in annotation_list:
+        annotation_key: str = (
+            key(annotation) if key is not None else get_annotation_key(annotation)
+        )
+        matches: List[str] = index.get(annotation_key, list())
+
+        if not matches:
+            unmatched_annotations.append(annotation)
+        elif len(matches) > 1:
+            ambiguous[annotation] = matches
+
+        for analyse in matches:
+            pairs.append([annotation, analyse])
+            matched_analyses.add(analyse)
+
+    return FilePairing(
+        pairs=pairs,
+        unmatched_annotations=unmatched_annotations,
+        unmatched_analyses=[
+            analyse for analyse in analyse_list if analyse not in matched_analyses
+        ],
+        ambiguous=ambiguous,
+    )
@@ -0,0 +1,148 @@
+# manifest.py
+
+import hashlib
+import time
+from typing import List, Optional, Union
+
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.sqlite_store import SQLiteStore
+from DNA_analyser_IBP.utils import _open_fasta
+
+
+class ManifestRecord:
+    """Uploaded record, its content hash, sequence id and last known batch status"""
+
+    __slots__ = ("name", "hash", "id", "status", "updated")
+
+    def __init__(
+        self, *, name: str, hash: str, id: Optional[str], status: str, updated: float
+    ):
+        self.name: str = name
+        self.hash: str = hash
+        self.id: Optional[str] = id
+        self.status: str = status
+        self.updated: float = updated
+
+    def __repr__(self):
+        return f"<ManifestRecord {self.name} id: {self.id} status: {self.status}>"
+
+    @property
+    def is_uploaded(self) -> bool:
+        return self.status == BatchStatus.FINISH
+
+    @property
+    def is_pending(self) -> bool:
+        """
+        Record was submitted and its batch can be resumed without upload
+        """
+        return self.id is not None and self.status not in [
+            BatchStatus.FINISH,
+            BatchStatus.FAILED,
+        ]
+
+
+def hash_data(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Return content hash of sequence data
+
+    Args:
+        data (Union[bytes, bytearray, memoryview]): ASCII sequence data
+
+    Returns:
+        str: sha256 hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """
+    Return content hash of file read in blocks, gzip files are hashed decompressed
+
+    Args:
+        path (str): system path to file
+
+    Returns:
+        str: sha256 hex digest
+    """
+    content_hash = hashlib.sha256()
+
+    with _open_fasta(path) as file:
+        while True:
+            block: bytes = file.read(Config.UPLOAD_CONFIG.BLOCK_SIZE)
+            if not block:
+                break
+            content_hash.update(block)
+
+    return content_hash.hexdigest()
+
+
+class UploadManifest(SQLiteStore):
+    """
+    Local SQLite manifest of uploaded records, reruns skip uploaded records and resume pending batches
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS uploads (
+            name TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            id TEXT,
+            status TEXT NOT NULL,
+            updated REAL NOT NULL,
+            PRIMARY KEY (name, hash)
+        );
+    """
+
+    def get(self, *, name: str, hash: str) -> Optional[ManifestRecord]:
+        """
+        Return record with given name and content hash
+
+        Args:
+            name (str): sequence name
+            hash (str): content hash
+
+        Returns:
+            Optional[ManifestRecord]: record or None if it was never submitted
+        """
+        rows: List[tuple] = self._fetch(
+            "SELECT name, hash, id, status, updated FROM uploads WHERE name = ? AND hash = ?",
+            (name, hash),
+        )
+
+        if not rows:
+            return None
+        name, hash, id, status, updated = rows[0]
+        return ManifestRecord(
+            name=name, hash=hash, id=id, status=status, updated=updated
+        )
+
+    def set(self, *, name: str, hash: str, id: Optional[str], status: str) -> None:
+        """
+        Store record, every change is committed at once so it survives crash
+
+        Args:
+            name (str): sequence name
+            hash (str): content hash
+            id (Optional[str]): sequence id, None if submission failed
+            status (str): batch status
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO uploads (name, hash, id, status, updated) VALUES (?, ?, ?, ?, ?)",
+            (name, hash, id, status, time.time()),
+        )
+
+    def all(self) -> List[ManifestRecord]:
+        """
+        Return all records
+
+        Returns:
+            List[ManifestRecord]: records ordered by update time
+        """
+        rows: List[tuple] = self._fetch(
+            "SELECT name, hash, id, status, updated FROM uploads ORDER BY updated, rowid"
+        )
+
+        return [
+            ManifestRecord(name=name, hash=hash, id=id, status=status, updated=updated)
+            for name, hash, id, status, updated in rows
+        ]
@@ -1,7 +1,9 @@
 # __init__.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from DNA_analyser_IBP.adapters import Transport
+from DNA_analyser_IBP.cache import ResultCache
 from DNA_analyser_IBP.ports.batch_port import BatchPort
 from DNA_analyser_IBP.ports.g4hunter_port import G4HunterPort
 from DNA_analyser_IBP.ports.g4killer_port import G4KillerPort
@@ -22,12 +24,25 @@ class Ports:
     Ports class
     """
 
-    def __init__(self, user: "User"):
-        self.p53: P53Port = P53Port(user=user)
-        self.batch: BatchPort = BatchPort(user=user)
-        self.g4killer: G4KillerPort = G4KillerPort(user=user)
-        self.g4hunter: G4HunterPort = G4HunterPort(user=user)
-        self.sequence: SequencePort = SequencePort(user=user)
-        self.rloopr: RlooprPort = RlooprPort(user=user)
-        self.zdna: ZDnaPort = ZDnaPort(user=user)
-        self.cpg: CpGPort = CpGPort(user=user)
+    def __init__(
+        self,
+        user: "User",
+        transport: Optional[Transport] = None,
+        cache: Optional[ResultCache] = None,
+    ):
+        if transport is None:
+            transport = Transport(jwt=user.jwt)
+        self.transport: Transport = transport
+        self.cache: ResultCache = cache if cache is not None else ResultCache()
+        self.p53: P53Port = P53Port(user=user, transport=transport, cache=self.cache)
+        self.batch: BatchPort = BatchPort(user=user, transport=transport)
+        self.g4killer: G4KillerPort = G4KillerPort(user=user, transport=transport)
+        self.g4hunter: G4HunterPort = G4HunterPort(
+            user=user, transport=transport, cache=self.cache
+        )
+        self.sequence: SequencePort = SequencePort(user=user, transport=transport)
+        self.rloopr: RlooprPort = RlooprPort(
+            user=user, transport=transport, cache=self.cache
+        )
+        self.zdna: ZDnaPort = ZDnaPort(user=user, transport=transport, cache=self.cache)
+        self.cpg: CpGPort = CpGPort(user=user, transport=transport, cache=self.cache)
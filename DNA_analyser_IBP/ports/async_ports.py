@@ -0,0 +1,41 @@
+# async_ports.py
+
+from typing import TYPE_CHECKING
+
+from DNA_analyser_IBP.adapters.async_adapters import (
+    AsyncBatchAdapter,
+    AsyncCpGAdapter,
+    AsyncG4HunterAdapter,
+    AsyncRLooprAdapter,
+    AsyncSequenceAdapter,
+    AsyncZDnaAdapter,
+)
+
+if TYPE_CHECKING:
+    from DNA_analyser_IBP.adapters.async_transport import AsyncTransport
+    from DNA_analyser_IBP.models import User
+
+__all__ = ["AsyncPorts"]
+
+
+class AsyncPorts:
+    """
+    Async ports class, awaitable counterpart of Ports
+    """
+
+    def __init__(self, user: "User", transport: "AsyncTransport"):
+        self.transport: "AsyncTransport" = transport
+        self.batch: AsyncBatchAdapter = AsyncBatchAdapter(
+            user=user, transport=transport
+        )
+        self.sequence: AsyncSequenceAdapter = AsyncSequenceAdapter(
+            user=user, transport=transport
+        )
+        self.g4hunter: AsyncG4HunterAdapter = AsyncG4HunterAdapter(
+            user=user, transport=transport
+        )
+        self.rloopr: AsyncRLooprAdapter = AsyncRLooprAdapter(
+            user=user, transport=transport
+        )
+        self.zdna: AsyncZDnaAdapter = AsyncZDnaAdapter(user=user, transport=transport)
+        self.cpg: AsyncCpGAdapter = AsyncCpGAdapter(user=user, transport=transport)
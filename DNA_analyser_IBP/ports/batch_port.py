@@ -1,10 +1,11 @@
 # batch_port.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from DNA_analyser_IBP.ports.port import Port
 
 if TYPE_CHECKING:
+    from DNA_analyser_IBP.adapters import Transport
     from DNA_analyser_IBP.models import Batch, User
 
 
@@ -13,8 +14,8 @@ class BatchPort(Port):
     Batch port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    def __init__(self, user: "User", transport: Optional["Transport"] = None):
+        super().__init__(user=user, transport=transport)
 
     def get_batch_status(self, *, id: str, type: str) -> "Batch":
         return self.adapter.batch.get_batch_status(id=id, type=type)
@@ -7,6 +7,8 @@ from DNA_analyser_IBP.ports.port import Port
 if TYPE_CHECKING:
     from pandas import DataFrame
 
+    from DNA_analyser_IBP.adapters import Transport
+    from DNA_analyser_IBP.cache import ResultCache
     from DNA_analyser_IBP.models import CpG, User
 
 class CpGPort(Port):
@@ -14,8 +16,16 @@ class CpGPort(Port):
     CpG Hunter Port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    def __init__(
+        self,
+        user: "User",
+        transport: Optional["Transport"] = None,
+        cache: Optional["ResultCache"] = None,
+    ):
+        super().__init__(user=user, transport=transport, cache=cache)
+
+    def _is_finished(self, *, id: str) -> bool:
+        return bool(self.adapter.cpg.load_by_id(id=id).finished)
 
     def create_analyse(
         self,
@@ -47,8 +57,25 @@ class CpGPort(Port):
     def delete(self, *, id: str) -> bool:
         return self.adapter.cpg.delete(id=id)
     
-    def export_csv(self, *, id: str) -> str:
-        return self.adapter.cpg.export_csv(id=id)
+    def export_csv(self, *, id: str, use_cache: bool = True) -> str:
+        return self.cache.load(
+            id=id,
+            endpoint="cpg/csv",
+            loader=lambda: self.adapter.cpg.export_csv(id=id),
+            is_finished=lambda: self._is_finished(id=id),
+            use_cache=use_cache,
+        )
     
-    def load_result(self, *, id: str) -> "DataFrame":
-        return self.adapter.cpg.load_result(id=id)
\ No newline at end of file
+    def load_result(self, *, id: str, use_cache: bool = True) -> "DataFrame":
+        return self.cache.load(
+            id=id,
+            endpoint="cpg/result",
+            loader=lambda: self.adapter.cpg.load_result(id=id),
+            is_finished=lambda: self._is_finished(id=id),
+            use_cache=use_cache,
+        )
+
+    def load_result_chunks(
+        self, *, id: str, chunk_size: int
+    ) -> Generator["DataFrame", None, None]:
+        return self.adapter.cpg.load_result_chunks(id=id, chunk_size=chunk_size)
@@ -7,6 +7,8 @@ from DNA_analyser_IBP.ports.port import Port
 if TYPE_CHECKING:
     from pandas import DataFrame
 
+    from DNA_analyser_IBP.adapters import Transport
+    from DNA_analyser_IBP.cache import ResultCache
     from DNA_analyser_IBP.models import G4Hunter, User
 
 
@@ -15,8 +17,16 @@ class G4HunterPort(Port):
     G4Hunter port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    def __init__(
+        self,
+        user: "User",
+        transport: Optional["Transport"] = None,
+        cache: Optional["ResultCache"] = None,
+    ):
+        super().__init__(user=user, transport=transport, cache=cache)
+
+    def _is_finished(self, *, id: str) -> bool:
+        return bool(self.adapter.g4hunter.load_by_id(id=id).finished)
 
     def create_analyse(
         self,
@@ -41,11 +51,40 @@ class G4HunterPort(Port):
     ) -> "Generator[G4Hunter, None, None]":
         return self.adapter.g4hunter.load_all(tags=tags)
 
-    def load_result(self, *, id: str) -> "DataFrame":
-        return self.adapter.g4hunter.load_result(id=id)
+    def load_result(self, *, id: str, use_cache: bool = True) -> "DataFrame":
+        return self.cache.load(
+            id=id,
+            endpoint="g4hunter/result",
+            loader=lambda: self.adapter.g4hunter.load_result(id=id),
+            is_finished=lambda: self._is_finished(id=id),
+            use_cache=use_cache,
+        )
+
+    def load_result_chunks(
+        self, *, id: str, chunk_size: int
+    ) -> Generator["DataFrame", None, None]:
+        return self.adapter.g4hunter.load_result_chunks(id=id, chunk_size=chunk_size)
 
-    def export_csv(self, *, id: str, aggregate: bool = True) -> str:
-        return self.adapter.g4hunter.export_csv(id=id, aggregate=aggregate)
+    def export_csv(
+        self, *, id: str, aggregate: bool = True, use_cache: bool = True
+    ) -> str:
+        return self.cache.load(
+            id=id,
+            endpoint="g4hunter/csv",
+            loader=lambda: self.adapter.g4hunter.export_csv(id=id, aggregate=aggregate),
+            is_finished=lambda: self._is_finished(id=id),
+            use_cache=use_cache,
+            aggregate=aggregate,
+        )
 
-    def load_heatmap(self, *, id: str, segments: int) -> "DataFrame":
-        return self.adapter.g4hunter.load_heatmap(id=id, segments=segments)
+    def load_heatmap(
+        self, *, id: str, segments: int, use_cache: bool = True
+    ) -> "DataFrame":
+        return self.cache.load(
+            id=id,
+            endpoint="g4hunter/heatmap",
+            loader=lambda: self.adapter.g4hunter.load_heatmap(id=id, segments=segments),
+            is_finished=lambda: self._is_finished(id=id),
+            use_cache=use_cache,
+            segments=segments,
+        )
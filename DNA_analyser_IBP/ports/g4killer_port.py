@@ -1,10 +1,11 @@
 # g4killer_port.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from DNA_analyser_IBP.ports.port import Port
 
 if TYPE_CHECKING:
+    from DNA_analyser_IBP.adapters import Transport
     from DNA_analyser_IBP.models import G4Killer, User
 
 
@@ -13,8 +14,8 @@ class G4KillerPort(Port):
     G4Killer port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    def __init__(self, user: "User", transport: Optional["Transport"] = None):
+        super().__init__(user=user, transport=transport)
 
     def create_analyse(
         self, *, sequence: str, threshold: float, complementary: bool
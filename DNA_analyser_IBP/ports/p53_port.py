@@ -1,11 +1,15 @@
 # p53_port.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import P53
 from DNA_analyser_IBP.ports.port import Port
 
 if TYPE_CHECKING:
-    from DNA_analyser_IBP.models import P53, User
+    from DNA_analyser_IBP.adapters import Transport
+    from DNA_analyser_IBP.cache import ResultCache
+    from DNA_analyser_IBP.models import User
 
 
 class P53Port(Port):
@@ -13,8 +17,64 @@ class P53Port(Port):
     P53 port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    TOOL: str = "p53"
+
+    def __init__(
+        self,
+        user: "User",
+        transport: Optional["Transport"] = None,
+        cache: Optional["ResultCache"] = None,
+    ):
+        super().__init__(user=user, transport=transport, cache=cache)
 
     def create_analyse(self, *, sequence: str) -> "P53":
         return self.adapter.p53.create_analyse(sequence=sequence)
+
+    def create_analyses(
+        self,
+        *,
+        sequences: List[str],
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Optional["P53"]]:
+        """
+        Return predictions of unique sequences, memoized predictions are not sent again
+
+        Args:
+            sequences (List[str]): sequence strings of length 20
+            max_workers (Optional[int]): number of concurrent requests [default=transport pool size]
+            use_cache (bool): False = bypass memoized predictions [Default=True]
+
+        Returns:
+            Dict[str, Optional[P53]]: prediction by sequence, None for failed sequence
+        """
+        unique: List[str] = list(dict.fromkeys(sequences))
+        results: Dict[str, Optional["P53"]] = (
+            {
+                sequence: P53(**data)
+                for sequence, data in self.cache.get_tool_results(
+                    tool=self.TOOL, keys=unique
+                ).items()
+            }
+            if use_cache
+            else dict()
+        )
+        missing: List[str] = [sequence for sequence in unique if sequence not in results]
+
+        created: Dict[str, Optional["P53"]] = dict()
+        stored: Dict[str, dict] = dict()
+
+        for sequence, p53 in zip(
+            missing,
+            self.adapter.p53.create_analyses(sequences=missing, max_workers=max_workers),
+        ):
+            created[sequence] = p53
+            if p53 is not None:
+                stored[sequence] = vars(p53)
+            if len(stored) >= Config.CACHE_CONFIG.TOOL_COMMIT_SIZE:
+                self.cache.set_tool_results(tool=self.TOOL, results=stored)
+                stored = dict()
+        self.cache.set_tool_results(tool=self.TOOL, results=stored)
+
+        results.update(created)
+        return results
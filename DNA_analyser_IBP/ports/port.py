@@ -1,8 +1,9 @@
 # port.py
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from DNA_analyser_IBP.adapters import Adapters
+from DNA_analyser_IBP.adapters import Adapters, Transport
+from DNA_analyser_IBP.cache import ResultCache
 from DNA_analyser_IBP.models import User
 
 if TYPE_CHECKING:
@@ -14,6 +15,12 @@ class Port:
     Base port class
     """
 
-    def __init__(self, user: "User"):
+    def __init__(
+        self,
+        user: "User",
+        transport: Optional["Transport"] = None,
+        cache: Optional[ResultCache] = None,
+    ):
         self.user: "User" = user
-        self.adapter: "Adapters" = Adapters(user=user)
+        self.adapter: "Adapters" = Adapters(user=user, transport=transport)
+        self.cache: ResultCache = cache if cache is not None else ResultCache()
@@ -1,10 +1,15 @@
 # sequence_port.py
 
-from typing import TYPE_CHECKING, Generator, List, Optional
+from typing import TYPE_CHECKING, BinaryIO, Generator, List, Optional, Tuple, Union
 
 from DNA_analyser_IBP.ports.port import Port
+from DNA_analyser_IBP.type import DataOutput
 
 if TYPE_CHECKING:
+    import numpy as np
+
+    from DNA_analyser_IBP.adapters import Transport
+    from DNA_analyser_IBP.adapters.json_body import SequenceData
     from DNA_analyser_IBP.models import Sequence, User
 
 
@@ -13,14 +18,14 @@ class SequencePort(Port):
     Sequence port
     """
 
-    def __init__(self, user: "User"):
-        super().__init__(user=user)
+    def __init__(self, user: "User", transport: Optional["Transport"] = None):
+        super().__init__(user=user, transport=transport)
 
     def create_text_sequence(
         self,
         *,
         circular: bool,
-        data: str,
+        data: "SequenceData",
         name: str,
         tags: List[Optional[str]],
         nucleic_type: str,
@@ -37,11 +42,12 @@ class SequencePort(Port):
         self,
         *,
         circular: bool,
-        path: str,
+        path: Union[str, BinaryIO],
         name: str,
         tags: List[Optional[str]],
         nucleic_type: str,
         format: str,
+        compress: bool = False,
     ) -> "Sequence":
         return self.adapter.sequence.create_file_sequence(
             circular=circular,
@@ -50,6 +56,7 @@ class SequencePort(Port):
             tags=tags,
             nucleic_type=nucleic_type,
             format=format,
+            compress=compress,
         )
 
     def create_ncbi_sequence(
@@ -64,11 +71,68 @@ class SequencePort(Port):
             circular=circular, name=name, tags=tags, ncbi_id=ncbi_id
         )
 
+    def create_ncbi_sequences(
+        self,
+        *,
+        circular: bool,
+        tags: List[Optional[str]],
+        records: List[Tuple[str, str, List[Optional[str]]]],
+    ) -> List["Sequence"]:
+        return self.adapter.sequence.create_ncbi_sequences(
+            circular=circular, tags=tags, records=records
+        )
+
+    def create_multifasta_sequence(
+        self,
+        *,
+        circular: bool,
+        path: Union[str, BinaryIO],
+        tags: List[Optional[str]],
+        nucleic_type: str,
+        compress: bool = False,
+    ) -> Optional[List["Sequence"]]:
+        return self.adapter.sequence.create_multifasta_sequence(
+            circular=circular,
+            path=path,
+            tags=tags,
+            nucleic_type=nucleic_type,
+            compress=compress,
+        )
+
     def load_data(
-        self, *, id: str, length: int, position: int, sequence_length: int
-    ) -> str:
+        self,
+        *,
+        id: str,
+        length: int,
+        position: int,
+        sequence_length: int,
+        output: str = DataOutput.STRING,
+        max_workers: Optional[int] = None,
+    ) -> Union[str, bytes, "np.ndarray"]:
         return self.adapter.sequence.load_data(
-            id=id, length=length, position=position, sequence_length=sequence_length
+            id=id,
+            length=length,
+            position=position,
+            sequence_length=sequence_length,
+            output=output,
+            max_workers=max_workers,
+        )
+
+    def iter_data(
+        self,
+        *,
+        id: str,
+        length: int,
+        position: int,
+        sequence_length: int,
+        max_workers: Optional[int] = None,
+    ) -> Generator[bytes, None, None]:
+        return self.adapter.sequence.iter_data(
+            id=id,
+            length=length,
+            position=position,
+            sequence_length=sequence_length,
+            max_workers=max_workers,
         )
 
     def load_all(
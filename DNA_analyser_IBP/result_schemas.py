@@ -0,0 +1,125 @@
+# result_schemas.py
+
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+INT: str = "int32"
+FLOAT: str = "float32"
+CATEGORY: str = "category"
+SEQUENCE: str = "sequence"
+
+
+class ResultSchema:
+    """
+    Column types of analyse results, fields missing in schema keep inferred type
+    """
+
+    G4HUNTER: Dict[str, str] = {
+        "position": INT,
+        "length": INT,
+        "score": FLOAT,
+        "absScore": FLOAT,
+        "sequence": SEQUENCE,
+    }
+    ZDNA: Dict[str, str] = {
+        "position": INT,
+        "length": INT,
+        "score": FLOAT,
+        "sequence": SEQUENCE,
+    }
+    CPG: Dict[str, str] = {
+        "position": INT,
+        "length": INT,
+        "gcPercentage": FLOAT,
+        "observedToExpectedCpG": FLOAT,
+        "gcSkew": FLOAT,
+        "sequence": SEQUENCE,
+    }
+    RLOOPR: Dict[str, str] = {
+        "position": INT,
+        "length": INT,
+        "rizGRichness": FLOAT,
+        "rloopGRichness": FLOAT,
+        "g3cnt": INT,
+        "g4cnt": INT,
+        "gncnt": INT,
+        "model": CATEGORY,
+        "strand": CATEGORY,
+    }
+
+
+def _decode_column(values: list, dtype: Optional[str]) -> pd.Series:
+    """
+    Build one result column straight into typed array
+
+    Args:
+        values (list): column values
+        dtype (Optional[str]): schema type, None for inferred type
+
+    Returns:
+        pd.Series: typed column
+    """
+    if dtype in [INT, FLOAT]:
+        try:
+            return pd.Series(np.array(values, dtype=dtype), copy=False)
+        except (TypeError, ValueError, OverflowError):
+            # missing or out of range values, keep inferred type
+            return pd.Series(values)
+    elif dtype == CATEGORY:
+        return pd.Series(pd.Categorical(values))
+    elif dtype == SEQUENCE:
+        # categorical pays off only when sequences repeat
+        column: pd.Series = pd.Series(values, dtype=object)
+        if len(column) and column.nunique() <= len(column) // 2:
+            return column.astype(CATEGORY)
+        return column
+    return pd.Series(values)
+
+
+def decode_result(
+    *, response: List[dict], schema: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Generate typed result DataFrame column by column
+
+    Args:
+        response (List[dict]): result records
+        schema (Optional[Dict[str, str]]): column types of result
+
+    Returns:
+        pd.DataFrame: dataframe with typed result columns
+    """
+    schema: Dict[str, str] = schema or dict()
+    columns: Dict[str, pd.Series] = {
+        key: _decode_column([record.get(key) for record in response], schema.get(key))
+        for key in response[0].keys()
+    }
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def empty_result(
+    *, columns: List[str], schema: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Generate result DataFrame without records, columns have the same types as decoded results
+
+    Args:
+        columns (List[str]): result columns
+        schema (Optional[Dict[str, str]]): column types of result
+
+    Returns:
+        pd.DataFrame: empty dataframe with typed result columns
+    """
+    schema: Dict[str, str] = schema or dict()
+    columns: Dict[str, pd.Series] = {
+        column: _decode_column(list(), schema[column])
+        if column in schema
+        else pd.Series(dtype=object)
+        for column in columns
+    }
+
+    return pd.DataFrame(columns, copy=False)
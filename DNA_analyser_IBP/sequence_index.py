@@ -0,0 +1,324 @@
+# sequence_index.py
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.sqlite_store import SQLiteStore
+from DNA_analyser_IBP.utils import _open_fasta
+
+# whitespace is not part of nucleotide data
+WHITESPACE: bytes = b" \t\r\n"
+
+
+class SequenceDigest:
+    """
+    Streaming content hash, length and nucleotide counts of sequence data,
+    data are upper cased and whitespace is removed before hashing
+    """
+
+    __slots__ = ("_hash", "_counts", "length")
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._counts: np.ndarray = np.zeros(256, dtype=np.int64)
+        self.length: int = 0
+
+    def __repr__(self):
+        return f"<SequenceDigest {self.hash[:12]} length: {self.length}>"
+
+    def update(self, data: Union[str, bytes, bytearray, memoryview]) -> None:
+        """
+        Add block of sequence data
+
+        Args:
+            data (Union[str, bytes, bytearray, memoryview]): ASCII sequence data
+        """
+        block_size: int = Config.UPLOAD_CONFIG.BLOCK_SIZE
+
+        # long records are normalized in blocks to keep copies small
+        for start in range(0, len(data), block_size):
+            chunk = data[start : start + block_size]
+            block: bytes = (
+                chunk.encode("ascii") if isinstance(chunk, str) else bytes(chunk)
+            ).translate(None, WHITESPACE).upper()
+
+            self._hash.update(block)
+            self._counts += np.bincount(
+                np.frombuffer(block, dtype=np.uint8), minlength=256
+            )
+            self.length += len(block)
+
+    @property
+    def hash(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def nucleic_counts(self) -> Dict[str, int]:
+        return {
+            chr(code): int(self._counts[code]) for code in np.flatnonzero(self._counts)
+        }
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[Union[str, bytes, bytearray, memoryview]]
+    ) -> "SequenceDigest":
+        """
+        Create digest of sequence data blocks
+
+        Args:
+            chunks (Iterable[Union[str, bytes, bytearray, memoryview]]): sequence data blocks
+
+        Returns:
+            SequenceDigest: digest of all blocks
+        """
+        digest: SequenceDigest = cls()
+        for chunk in chunks:
+            digest.update(chunk)
+        return digest
+
+    @classmethod
+    def from_file(cls, *, path: str, format: str) -> "SequenceDigest":
+        """
+        Create digest of [TEXT|FASTA] file read line by line, FASTA headers are skipped
+
+        Args:
+            path (str): system path to plain or gzip compressed file
+            format (str): string FASTA|PLAIN
+
+        Returns:
+            SequenceDigest: digest of sequence data
+        """
+        with _open_fasta(path) as file:
+            if format.upper() == "FASTA":
+                return cls.from_chunks(
+                    line for line in file if not line.startswith(b">")
+                )
+            return cls.from_chunks(
+                iter(lambda: file.read(Config.UPLOAD_CONFIG.BLOCK_SIZE), b"")
+            )
+
+
+class SequenceIndexRecord:
+    """Uploaded sequence with its type, content hash, length and nucleotide counts"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "circular",
+        "hash",
+        "length",
+        "nucleic_counts",
+        "ncbi",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        type: Optional[str],
+        circular: Optional[bool],
+        hash: Optional[str],
+        length: Optional[int],
+        nucleic_counts: Optional[Dict[str, int]],
+        ncbi: Optional[str],
+    ):
+        self.id: str = id
+        self.name: str = name
+        self.type: Optional[str] = type
+        self.circular: Optional[bool] = circular
+        self.hash: Optional[str] = hash
+        self.length: Optional[int] = length
+        self.nucleic_counts: Optional[Dict[str, int]] = nucleic_counts
+        self.ncbi: Optional[str] = ncbi
+
+    def __repr__(self):
+        return f"<SequenceIndexRecord {self.id} {self.name}>"
+
+
+class SequenceIndex(SQLiteStore):
+    """
+    Local SQLite index of uploaded sequences used to find duplicates before upload
+    """
+
+    COLUMNS: str = "id, name, type, circular, hash, length, nucleic_counts, ncbi"
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS sequences (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            type TEXT,
+            circular INTEGER,
+            hash TEXT,
+            length INTEGER,
+            nucleic_counts TEXT,
+            ncbi TEXT
+        );
+        CREATE INDEX IF NOT EXISTS sequences_hash ON sequences (hash, length);
+        CREATE INDEX IF NOT EXISTS sequences_ncbi ON sequences (ncbi);
+        CREATE TABLE IF NOT EXISTS local_files (
+            id TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            record TEXT
+        );
+    """
+
+    def __init__(self, *, path: str) -> None:
+        """
+        Open or create sequence index
+
+        Args:
+            path (str): system path to SQLite index file
+        """
+        super().__init__(path=path)
+        # index files created before type and circular were stored never match them
+        columns: List[str] = [
+            row[1] for row in self._fetch("PRAGMA table_info(sequences)")
+        ]
+        for column, definition in [("type", "TEXT"), ("circular", "INTEGER")]:
+            if column not in columns:
+                self._execute(f"ALTER TABLE sequences ADD COLUMN {column} {definition}")
+
+    def _select(self, where: str, params: tuple) -> List[SequenceIndexRecord]:
+        rows: List[tuple] = self._fetch(
+            f"SELECT {self.COLUMNS} FROM sequences WHERE {where}", params
+        )
+
+        return [
+            SequenceIndexRecord(
+                id=id,
+                name=name,
+                type=type,
+                circular=bool(circular) if circular is not None else None,
+                hash=hash,
+                length=length,
+                nucleic_counts=json.loads(nucleic_counts) if nucleic_counts else None,
+                ncbi=ncbi,
+            )
+            for id, name, type, circular, hash, length, nucleic_counts, ncbi in rows
+        ]
+
+    def find(
+        self, *, digest: SequenceDigest, type: str, circular: bool
+    ) -> List[SequenceIndexRecord]:
+        """
+        Return uploaded sequences with the same content, type and topology
+
+        Args:
+            digest (SequenceDigest): digest of sequence data
+            type (str): string DNA|RNA
+            circular (bool): True if sequence is circular False if not
+
+        Returns:
+            List[SequenceIndexRecord]: uploaded sequences with the same hash, length and counts
+        """
+        nucleic_counts: Dict[str, int] = digest.nucleic_counts
+
+        return [
+            record
+            for record in self._select(
+                "hash = ? AND length = ? AND type = ? AND circular = ?",
+                (digest.hash, digest.length, type.upper(), circular),
+            )
+            if record.nucleic_counts in [None, nucleic_counts]
+        ]
+
+    def find_ncbi(self, *, ncbi_id: str, circular: bool) -> List[SequenceIndexRecord]:
+        """
+        Return uploaded sequences imported from NCBI record with the same topology
+
+        Args:
+            ncbi_id (str): sequence id from https://www.ncbi.nlm.nih.gov/
+            circular (bool): True if sequence is circular False if not
+
+        Returns:
+            List[SequenceIndexRecord]: uploaded sequences
+        """
+        return self._select("ncbi = ? AND circular = ?", (ncbi_id, circular))
+
+    def add(
+        self,
+        *,
+        id: str,
+        name: str,
+        circular: bool,
+        type: Optional[str] = None,
+        digest: Optional[SequenceDigest] = None,
+        ncbi: Optional[str] = None,
+    ) -> None:
+        """
+        Store uploaded sequence
+
+        Args:
+            id (str): sequence id
+            name (str): sequence name
+            circular (bool): True if sequence is circular False if not
+            type (Optional[str]): string DNA|RNA, None for NCBI imports
+            digest (Optional[SequenceDigest]): digest of sequence data, None for NCBI imports
+            ncbi (Optional[str]): NCBI sequence id
+        """
+        self._execute(
+            f"INSERT OR REPLACE INTO sequences ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                id,
+                name,
+                type.upper() if type is not None else None,
+                circular,
+                digest.hash if digest is not None else None,
+                digest.length if digest is not None else None,
+                json.dumps(digest.nucleic_counts) if digest is not None else None,
+                ncbi,
+            ),
+        )
+
+    def remove(self, *, id: str) -> None:
+        """
+        Remove sequence and its local file link e.g. deleted or missing on server
+
+        Args:
+            id (str): sequence id
+        """
+        self._execute("DELETE FROM sequences WHERE id = ?", (id,))
+        self.remove_local(id=id)
+
+    def find_local(self, *, id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Return local FASTA file linked with sequence
+
+        Args:
+            id (str): sequence id
+
+        Returns:
+            Optional[Tuple[str, Optional[str]]]: FASTA path and record name, None if sequence is not linked
+        """
+        rows: List[tuple] = self._fetch(
+            "SELECT path, record FROM local_files WHERE id = ?", (id,)
+        )
+        return rows[0] if rows else None
+
+    def add_local(self, *, id: str, path: str, record: Optional[str] = None) -> None:
+        """
+        Store link of sequence with local FASTA file
+
+        Args:
+            id (str): sequence id
+            path (str): absolute path to uncompressed FASTA file
+            record (Optional[str]): record name, None for single record file
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO local_files (id, path, record) VALUES (?, ?, ?)",
+            (id, path, record),
+        )
+
+    def remove_local(self, *, id: str) -> None:
+        """
+        Remove link of sequence with local FASTA file
+
+        Args:
+            id (str): sequence id
+        """
+        self._execute("DELETE FROM local_files WHERE id = ?", (id,))
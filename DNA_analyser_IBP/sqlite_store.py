@@ -0,0 +1,77 @@
+# sqlite_store.py
+
+import sqlite3
+import threading
+from typing import Iterable, List
+
+
+class SQLiteStore:
+    """
+    Local SQLite file shared by worker threads, every access is serialized by lock
+    """
+
+    # tables created on open
+    SCHEMA: str = ""
+
+    def __init__(self, *, path: str) -> None:
+        """
+        Open or create SQLite file with SCHEMA tables
+
+        Args:
+            path (str): system path to SQLite file or :memory:
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self.SCHEMA)
+        self._connection.commit()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.path}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _fetch(self, query: str, params: Iterable = ()) -> List[tuple]:
+        """
+        Return all rows of query
+
+        Args:
+            query (str): SQL query
+            params (Iterable): query parameters [Default=()]
+
+        Returns:
+            List[tuple]: selected rows
+        """
+        with self._lock:
+            return self._connection.execute(query, tuple(params)).fetchall()
+
+    def _execute(self, query: str, params: Iterable = ()) -> None:
+        """
+        Execute and commit query at once so change survives crash
+
+        Args:
+            query (str): SQL query
+            params (Iterable): query parameters [Default=()]
+        """
+        with self._lock:
+            self._connection.execute(query, tuple(params))
+            self._connection.commit()
+
+    def _execute_many(self, query: str, rows: Iterable[Iterable]) -> None:
+        """
+        Execute query for every row and commit them together
+
+        Args:
+            query (str): SQL query
+            rows (Iterable[Iterable]): parameters of every row
+        """
+        with self._lock:
+            self._connection.executemany(query, [tuple(row) for row in rows])
+            self._connection.commit()
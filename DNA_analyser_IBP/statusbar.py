@@ -1,17 +1,46 @@
 # statusbar.py
 
 import time
-from typing import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from tqdm import tqdm
+import pandas as pd
 
-from DNA_analyser_IBP.models import Batch
+from DNA_analyser_IBP.batch_monitor import BatchMonitor
 from DNA_analyser_IBP.ports import Ports
 from DNA_analyser_IBP.type import Types
 from DNA_analyser_IBP.utils import Logger
 
 
-def status_bar(ports: Ports, func: Callable, name: str, type: str) -> None:
+def _get_description(name: str, type: str) -> str:
+    """
+    Return status bar description for given batch type
+
+    Args:
+        name (str): name field
+        type (str): batch type
+
+    Returns:
+        str: status bar description
+    """
+    if type in [Types.G4HUNTER, Types.RLOOPR, Types.PALINDROME, Types.ZDNA, Types.CPG]:
+        return f"Analysing sequence -> {name}"
+    elif type == Types.SEQUENCE:
+        return f"Uploading sequence -> {name}"
+    return str()
+
+
+def status_bar(ports: Ports, func: Callable, name: str, type: str) -> pd.DataFrame:
     """
     TQDM status bar
 
@@ -20,45 +49,102 @@ def status_bar(ports: Ports, func: Callable, name: str, type: str) -> None:
         func (Callable): function decorated by statusbar
         name (str): name field
         type (bool): True = SequenceModel, False = AnalyseModel
+
+    Returns:
+        pd.DataFrame: sequence id, name, id, final status and elapsed seconds of batch
     """
+    function_result = func()  # exec given function
 
-    description_text = str()
-    if type in [Types.G4HUNTER, Types.RLOOPR, Types.PALINDROME, Types.ZDNA, Types.CPG]:
-        description_text = f"Analysing sequence -> {name}"
-    elif type == Types.SEQUENCE:
-        description_text = f"Uploading sequence -> {name}"
-
-    with tqdm(
-        desc=description_text,
-        unit=" %",
-        ascii=True,
-    ) as statusbar:
-        statusbar.update(50)  # update to 50 %
-
-        function_result = func()  # exec given function
-
-        while True:
-            statusbar.update(50 - statusbar.n)  # without it doesn't work don't know why
-
-            if type == Types.SEQUENCE:
-                batch: Batch = ports.batch.get_batch_status(
-                    id=function_result.id, type=type
-                )
-                if batch.is_finished():  # that means if finished
-                    statusbar.update(50)  # complete to to 100 %
-                    return None
-                elif batch.is_failed():
-                    Logger.error(f"Uploading sequence {function_result.name} failed!")
-                    return None
-
-            elif type in [Types.G4HUNTER, Types.RLOOPR, Types.PALINDROME, Types.ZDNA, Types.CPG]:
-                batch: Batch = ports.batch.get_batch_status(
-                    id=function_result.id, type=type
-                )
-                if batch.is_finished():  # that means analyse finished
-                    statusbar.update(50)  # complete to to 100 %
-                    return None
-                elif batch.is_failed():
-                    Logger.error(f"Analyse {function_result.name} failed!")
-                    return None
-            time.sleep(0.5)
+    monitor: BatchMonitor = BatchMonitor(
+        ports=ports, description=_get_description(name=name, type=type)
+    )
+    monitor.add(
+        id=function_result.id if function_result is not None else None,
+        type=type,
+        name=name,
+    )
+    return monitor.wait()
+
+
+def run_concurrently(funcs: Iterable[Callable[[], Any]], max_workers: int) -> List[Any]:
+    """
+    Run functions in thread pool, functions are taken lazily so only max_workers
+    of them are in flight at once
+
+    Args:
+        funcs (Iterable[Callable[[], Any]]): functions without arguments
+        max_workers (int): max number of concurrent functions
+
+    Returns:
+        List[Any]: function results in the same order as functions
+    """
+    results: Dict[int, Any] = dict()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict[Future, int] = dict()
+
+        def _collect(done: Set[Future]) -> None:
+            for future in done:
+                results[pending.pop(future)] = future.result()
+
+        for index, func in enumerate(funcs):
+            if len(pending) >= max_workers:
+                _collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            pending[executor.submit(func)] = index
+
+        _collect(wait(pending).done)
+
+    return [results[index] for index in range(len(results))]
+
+
+def multiple_status_bar(
+    ports: Ports,
+    jobs: Iterable[Tuple[Optional[str], str, Callable]],
+    type: str,
+    max_workers: int,
+    description: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    TQDM status bar for many jobs submitted up front and tracked at the same time,
+    jobs are taken lazily so only max_workers submissions are in flight at once
+
+    Args:
+        ports (Ports): ports
+        jobs (Iterable[Tuple[Optional[str], str, Callable]]): (sequence id, name, function creating batch)
+        type (str): batch type e.g. Types.G4HUNTER
+        max_workers (int): max number of concurrent submissions
+        description (Optional[str]): status bar description
+
+    Returns:
+        pd.DataFrame: sequence id, name, id, final status and elapsed seconds for every job
+    """
+
+    def _submit(name: str, func: Callable) -> Tuple[float, Optional[str]]:
+        submitted: float = time.monotonic()
+        try:
+            function_result = func()  # exec given function
+        except Exception as e:
+            Logger.error(f"{name}: {e}")
+            function_result = None
+        return submitted, function_result.id if function_result is not None else None
+
+    names: List[Tuple[Optional[str], str]] = list()
+
+    def _submissions() -> Generator[Callable, None, None]:
+        for sequence_id, name, func in jobs:
+            names.append((sequence_id, name))
+            yield lambda name=name, func=func: _submit(name, func)
+
+    submitted: List[Tuple[float, Optional[str]]] = run_concurrently(
+        _submissions(), max_workers
+    )
+
+    monitor: BatchMonitor = BatchMonitor(
+        ports=ports, description=description or f"Processing {type.lower()} batches"
+    )
+    for (sequence_id, name), (submitted_at, id) in zip(names, submitted):
+        monitor.add(
+            id=id, type=type, name=name, sequence_id=sequence_id, submitted=submitted_at
+        )
+
+    return monitor.wait()
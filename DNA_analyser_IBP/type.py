@@ -22,3 +22,13 @@ class Types:
         Return all types
         """
         return [cls.G4HUNTER, cls.PALINDROME, cls.RLOOPR, cls.SEQUENCE, cls.ZDNA, cls.CPG]
+
+
+class DataOutput:
+    """
+    Sequence data output formats
+    """
+
+    STRING: str = "str"
+    BYTES: str = "bytes"
+    NUMPY: str = "numpy"
@@ -1,16 +1,21 @@
 # utils.py
 
+import gzip
 import os
 import re
 import string
 from datetime import datetime
 from functools import wraps
-from typing import Union
+from typing import BinaryIO, Generator, Iterable, Optional, Tuple, Union
 from urllib.parse import urljoin
 
+import numpy as np
 import pandas as pd
 from tenacity import RetryError
 
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.type import DataOutput
+
 
 class Logger:
     """Simple unified logger"""
@@ -79,23 +84,47 @@ def login_required(fn):
     return wrapper
 
 
-def generate_dataframe(response: Union[dict, list]) -> pd.DataFrame:
+def save_chunks(*, chunks: Iterable[pd.DataFrame], file_path: str) -> int:
     """
-    Generate dataframe from given dict/list
+    Write DataFrame chunks into one csv file, header is written only once
 
     Args:
-        response (Union[dict,list]): response dict|list
+        chunks (Iterable[pd.DataFrame]): DataFrame chunks
+        file_path (str): output csv file path
 
     Returns:
-        pd.DataFrame: dataframe with response data
+        int: number of written rows
+    """
+    rows: int = 0
+
+    with open(file_path, "w", newline="") as new_file:
+        for chunk in chunks:
+            chunk.to_csv(new_file, header=rows == 0, index=False)
+            rows += len(chunk)
+
+    return rows
+
+
+def convert_data(
+    *, data: Union[bytes, bytearray], output: str = DataOutput.STRING
+) -> Union[str, bytes, np.ndarray]:
     """
-    if isinstance(response, list):
-        data: pd.DataFrame = pd.DataFrame().from_records(
-            response, columns=response[0].keys()
-        )
-        return data
-    data: pd.DataFrame = pd.DataFrame(data=[response], columns=list(response.keys()))
-    return data
+    Convert ASCII sequence data into requested output format
+
+    Args:
+        data (Union[bytes, bytearray]): ASCII sequence data
+        output (str): str|bytes|numpy [default=str]
+
+    Returns:
+        Union[str, bytes, np.ndarray]: string, bytes or uint8 array sharing data buffer
+    """
+    if output == DataOutput.STRING:
+        return data.decode("ascii")
+    elif output == DataOutput.BYTES:
+        return bytes(data)
+    elif output == DataOutput.NUMPY:
+        return np.frombuffer(data, dtype=np.uint8)
+    raise ValueError(f"Output {output} is not supported, use str|bytes|numpy!")
 
 
 def validate_email(email: str) -> bool:
@@ -111,30 +140,96 @@ def validate_email(email: str) -> bool:
     return bool(re.match(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)", email))
 
 
+def is_compressed(path: str) -> bool:
+    """
+    Check gzip magic bytes of file, bgzip files are gzip compatible
+
+    Args:
+        path (str): system path to file
+
+    Returns:
+        bool: True if file is gzip compressed
+    """
+    with open(path, "rb") as file:
+        return file.read(2) == b"\x1f\x8b"
+
+
+def _open_fasta(path: str) -> BinaryIO:
+    """
+    Open plain or gzip compressed FASTA file in binary mode
+
+    Args:
+        path (str): system path to fasta file
+
+    Returns:
+        BinaryIO: binary file object
+    """
+    if is_compressed(path):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
 @exception_handler
-def _multifasta_parser(*, path: str):
+def _multifasta_parser(
+    *, path: str, as_memoryview: bool = False
+) -> Generator[Tuple[str, Union[str, memoryview]], None, None]:
     """
-    Parse Multifasta file and yield Fasta
+    Parse Multifasta file and yield Fasta, file is read in big blocks and
+    sequence lines are joined in bytearray, gzip compressed files are supported
 
     Args:
         path (str): system path to multifasta file
+        as_memoryview (bool): True = yield sequence as memoryview of ASCII bytes, False = str
+
+    Returns:
+        Generator[Tuple[str, Union[str, memoryview]], None, None]: sequence name and sequence
     """
-    with open(path, "r") as multifasta:
-        sequence_name, sequence_nucleic = str(), str()
-        for index, row in enumerate(multifasta):
-            row: str = row.strip()
-            if row[0] == ">":  # pokud radek zacina >
-                if not sequence_name:
-                    sequence_name: str = row[1:]  # set new name
-                elif row == "":
-                    yield sequence_name, sequence_nucleic
+    sequence_name: Optional[str] = None
+    sequence_nucleic: bytearray = bytearray()
+
+    def _record() -> Tuple[str, Union[str, memoryview]]:
+        if as_memoryview:
+            return sequence_name or str(), memoryview(sequence_nucleic)
+        return sequence_name or str(), sequence_nucleic.decode("ascii")
+
+    with _open_fasta(path) as multifasta:
+        rest: bytes = bytes()
+
+        while True:
+            block: bytes = multifasta.read(Config.FASTA_CONFIG.BLOCK_SIZE)
+            if block and b"\n" not in block and not (rest or block).startswith(b">"):
+                # unwrapped sequence line is appended at once instead of carried in rest
+                sequence_nucleic += (rest + block).translate(None, b" \t\r")
+                rest = bytes()
+                continue
+            # block is processed only up to last complete line
+            data: bytes = rest + block
+            last_line_end: int = data.rfind(b"\n") + 1 if block else len(data)
+            data, rest = data[:last_line_end], data[last_line_end:]
+            position: int = 0
+
+            while position < len(data):
+                if data[position] == ord(">"):  # header line
+                    header_end: int = data.find(b"\n", position)
+                    header_end = header_end if header_end != -1 else len(data)
+                    if sequence_name is not None or sequence_nucleic:
+                        yield _record()
+                    sequence_name = data[position + 1 : header_end].strip().decode()
+                    sequence_nucleic = bytearray()
+                    position = header_end + 1
                 else:
-                    yield sequence_name, sequence_nucleic
-                    # set new name
-                    sequence_name, sequence_nucleic = row[1:], str()
-            else:
-                sequence_nucleic += row
-        yield sequence_name, sequence_nucleic
+                    header_start: int = data.find(b"\n>", position)
+                    lines_end: int = header_start + 1 if header_start != -1 else len(data)
+                    # remove line breaks, blank lines and spaces at once
+                    sequence_nucleic += data[position:lines_end].translate(
+                        None, b" \t\r\n"
+                    )
+                    position = lines_end
+
+            if not block:
+                break
+
+    yield _record()
 
 
 @exception_handler
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from DNA_analyser_IBP.adapters.async_transport import AsyncTransport
+from DNA_analyser_IBP.adapters.cpg_adapter import CpGAdapter
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import User
+from DNA_analyser_IBP.ports.async_ports import AsyncPorts
+from DNA_analyser_IBP.type import Types
+
+httpx = pytest.importorskip("httpx")
+
+
+def create_ports(handler) -> AsyncPorts:
+    """Create async ports answered by given request handler"""
+    transport = AsyncTransport(pool_size=4, jwt="token")
+    transport.client = httpx.AsyncClient(
+        headers=transport.client.headers, transport=httpx.MockTransport(handler)
+    )
+    user = User(email="host", password="host", server=Config.SERVER_CONFIG.PRODUCTION)
+    return AsyncPorts(user=user, transport=transport)
+
+
+class TestAsyncAdapters:
+    def test_async_transport_pool_size(self) -> None:
+        """It should keep given pool size and Authorization header"""
+        transport = AsyncTransport(pool_size=32, jwt="token")
+
+        assert transport.pool_size == 32
+        assert transport.client.headers["Authorization"] == "token"
+
+        transport.authorize(jwt=None)
+        assert "Authorization" not in transport.client.headers
+
+    def test_create_analyse_gather(self) -> None:
+        """It should await many g4hunter analyses together"""
+
+        def handler(request):
+            assert request.headers["Authorization"] == "token"
+            return httpx.Response(
+                201, json={"payload": {"id": "analyse", "tags": []}}
+            )
+
+        async def run():
+            ports = create_ports(handler)
+            analyses = await asyncio.gather(
+                *[
+                    ports.g4hunter.create_analyse(
+                        id=str(index), tags=[], threshold=1.2, window_size=25
+                    )
+                    for index in range(10)
+                ]
+            )
+            await ports.transport.close()
+            return analyses
+
+        analyses = asyncio.run(run())
+
+        assert len(analyses) == 10
+        assert all(analyse.id == "analyse" for analyse in analyses)
+
+    def test_load_result(self) -> None:
+        """It should load rloopr results from payload key"""
+
+        def handler(request):
+            assert request.url.path.endswith("/analyse/rloopr/analyse/rloops")
+            return httpx.Response(200, json={"payload": [{"position": 1}]})
+
+        async def run():
+            ports = create_ports(handler)
+            result = await ports.rloopr.load_result(id="analyse")
+            await ports.transport.close()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result["position"].tolist() == [1]
+
+    def test_batch_wait(self) -> None:
+        """It should await batch until it is finished"""
+        statuses = [BatchStatus.WAITING, BatchStatus.RUNNING, BatchStatus.FINISH]
+
+        def handler(request):
+            return httpx.Response(200, json={"status": statuses.pop(0)})
+
+        async def run():
+            ports = create_ports(handler)
+            batch = await ports.batch.wait(
+                id="analyse", type=Types.G4HUNTER, min_interval=0, max_interval=0
+            )
+            await ports.transport.close()
+            return batch
+
+        batch = asyncio.run(run())
+
+        assert batch.is_finished()
+        assert not statuses
+
+    def test_load_data_windows(self) -> None:
+        """It should gather 1000 bp windows of long interval"""
+        data = "ATGC" * 700
+
+        def handler(request):
+            length = int(request.url.params["len"])
+            position = int(request.url.params["pos"])
+            assert length <= Config.DATA_CONFIG.WINDOW_SIZE
+            return httpx.Response(200, text=data[position : position + length])
+
+        async def run():
+            ports = create_ports(handler)
+            loaded = await ports.sequence.load_data(
+                id="sequence", length=2500, position=100, sequence_length=len(data)
+            )
+            await ports.transport.close()
+            return loaded
+
+        assert asyncio.run(run()) == data[100:2600]
+
+    def test_load_heatmap(self) -> None:
+        """It should load heatmap only on g4hunter and zdna adapters"""
+
+        def handler(request):
+            assert request.url.params["segments"] == "31"
+            return httpx.Response(200, json={"data": [{"count": 1, "coverage": 0.5}]})
+
+        async def run():
+            ports = create_ports(handler)
+            heatmap = await ports.zdna.load_heatmap(id="analyse", segments=31)
+            await ports.transport.close()
+            return heatmap, ports
+
+        heatmap, ports = asyncio.run(run())
+
+        assert list(heatmap.columns) == ["Z-DNA_count", "Z-DNA_coverage"]
+        assert hasattr(ports.g4hunter, "load_heatmap")
+        assert not hasattr(ports.cpg, "load_heatmap")
+        assert not hasattr(ports.rloopr, "load_heatmap")
+
+    def test_shared_requests(self) -> None:
+        """It should send the same request as sync adapter"""
+        sent = dict()
+
+        class FakeTransport:
+            def get(self, url, **kwargs):
+                sent["sync"] = (
+                    httpx.URL(url).path,
+                    {key: str(value) for key, value in kwargs["params"].items()},
+                )
+                return httpx.Response(200, json={"items": [{"position": 1}]})
+
+        def handler(request):
+            sent["async"] = (request.url.path, dict(request.url.params))
+            return httpx.Response(200, json={"items": [{"position": 1}]})
+
+        async def run():
+            ports = create_ports(handler)
+            await ports.cpg.load_result(id="analyse")
+            await ports.transport.close()
+
+        asyncio.run(run())
+        user = User(email="host", password="host", server=Config.SERVER_CONFIG.PRODUCTION)
+        user.set_login(jwt="token", id="user")
+        CpGAdapter(user=user, transport=FakeTransport()).load_result(id="analyse")
+
+        assert sent["sync"] == sent["async"]
@@ -0,0 +1,65 @@
+import threading
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import User
+
+# handler of recorded request returning status code and json payload or text
+Handler = Callable[[SimpleNamespace], Tuple[int, object]]
+
+
+class FakeTransport:
+    """Transport answering requests by handlers from memory, requests are recorded"""
+
+    pool_size: int = 4
+
+    def __init__(
+        self, *, get: Optional[Handler] = None, post: Optional[Handler] = None
+    ):
+        self.handlers = {"GET": get, "POST": post}
+        self.requests: List[SimpleNamespace] = list()
+        self.lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> SimpleNamespace:
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> SimpleNamespace:
+        return self._request("POST", url, **kwargs)
+
+    def _request(
+        self, method: str, url: str, *, headers=None, params=None, data=None, **kwargs
+    ) -> SimpleNamespace:
+        # streamed body is read whole as by requests session
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode("utf-8") if isinstance(data, str) else b"".join(data)
+        request = SimpleNamespace(
+            method=method,
+            url=url,
+            headers=headers or dict(),
+            params=params or dict(),
+            data=data,
+        )
+        with self.lock:
+            self.requests.append(request)
+
+        status_code, content = self.handlers[method](request)
+        return SimpleNamespace(
+            status_code=status_code, json=lambda: content, text=content
+        )
+
+
+@pytest.fixture
+def fake_transport():
+    """Factory of transports answering requests by given handlers"""
+    return FakeTransport
+
+
+@pytest.fixture
+def logged_user() -> User:
+    """User logged in with fake token"""
+    user = User(email="host", password="host", server=Config.SERVER_CONFIG.PRODUCTION)
+    user.set_login(jwt="token", id="user")
+    return user
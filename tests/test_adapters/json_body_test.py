@@ -0,0 +1,47 @@
+import io
+import json
+
+from DNA_analyser_IBP.adapters.json_body import iter_json_body
+from DNA_analyser_IBP.adapters.sequence_adapter import SequenceAdapter
+
+FIELDS = {"circular": False, "format": "PLAIN", "name": "name", "tags": ["a"]}
+
+
+def test_iter_json_body() -> None:
+    """It should create the same JSON from string, buffers and chunk iterators"""
+    sequence = "ATGC" * 10 + "N\"\\\n"
+    expected = {**FIELDS, "data": sequence}
+
+    for data in [
+        sequence,
+        sequence.encode("ascii"),
+        memoryview(bytearray(sequence, "ascii")),
+        io.StringIO(sequence),
+        [sequence[:7].encode("ascii"), sequence[7:]],
+    ]:
+        parts = list(iter_json_body(data=FIELDS, key="data", sequence=data, block_size=3))
+
+        assert json.loads(b"".join(parts)) == expected
+
+    # string and buffers are sent in escaped blocks
+    parts = list(iter_json_body(data=FIELDS, key="data", sequence=sequence, block_size=3))
+    assert max(len(part) for part in parts[1:-1]) <= 6
+
+
+def test_create_text_sequence_stream(fake_transport, logged_user) -> None:
+    """It should post sequence from file iterator in streamed body"""
+    created = {"payload": {"id": "id", "name": "name", "tags": []}}
+    adapter = SequenceAdapter(
+        user=logged_user, transport=fake_transport(post=lambda request: (201, created))
+    )
+
+    sequence = adapter.create_text_sequence(
+        circular=True,
+        data=io.BytesIO(b"ATGC\nGGGG\n"),
+        name="name",
+        tags=[],
+        nucleic_type="DNA",
+    )
+
+    assert sequence.id == "id"
+    assert json.loads(adapter.transport.requests[0].data)["data"] == "ATGC\nGGGG\n"
@@ -0,0 +1,128 @@
+import json
+from types import SimpleNamespace
+
+from DNA_analyser_IBP.cache import ResultCache
+from DNA_analyser_IBP.interfaces.p53_interface import P53
+from DNA_analyser_IBP.ports.p53_port import P53Port
+
+FIRST = "GGACATGCCCGGGCATGTCC"
+SECOND = "AGACATGCCCGGGCATGTCT"
+
+
+def answer_predictions(rejected=()):
+    """Answer p53 predictions, rejected sequences fail with 400"""
+
+    def _post(request) -> tuple:
+        sequence = json.loads(request.data)["sequence"]
+        if sequence in rejected:
+            return 400, dict()
+        return 200, {
+            "payload": {
+                "sequence": sequence,
+                "affinity": float(sequence.count("G")),
+                "predictor": "P53",
+                "difference": 0.0,
+                "length": len(sequence),
+                "position": 0,
+            }
+        }
+
+    return _post
+
+
+def posted(transport) -> list:
+    """Return sequences sent by transport"""
+    return [json.loads(request.data)["sequence"] for request in transport.requests]
+
+
+def test_run_multiple_deduplicates_and_memoizes(
+    tmp_path, fake_transport, logged_user
+) -> None:
+    """It should send every unique sequence once and keep input order"""
+    transport = fake_transport(post=answer_predictions())
+    p53 = P53(
+        ports=SimpleNamespace(
+            p53=P53Port(
+                user=logged_user,
+                transport=transport,
+                cache=ResultCache(directory=str(tmp_path)),
+            )
+        )
+    )
+    sequences = [FIRST, SECOND, FIRST.lower(), f" {SECOND} ", FIRST]
+
+    data = p53.run_multiple(max_workers=2, sequences=sequences)
+
+    assert sorted(posted(transport)) == sorted([FIRST, SECOND])
+    assert list(data["sequence"]) == sequences
+    assert list(data["affinity"]) == [7.0, 6.0, 7.0, 6.0, 7.0]
+
+    # new port with the same cache directory reads memoized predictions
+    transport = fake_transport(post=answer_predictions())
+    p53 = P53(
+        ports=SimpleNamespace(
+            p53=P53Port(
+                user=logged_user,
+                transport=transport,
+                cache=ResultCache(directory=str(tmp_path)),
+            )
+        )
+    )
+    data = p53.run_multiple(sequences=[SECOND, FIRST])
+
+    assert posted(transport) == []
+    assert list(data["affinity"]) == [6.0, 7.0]
+
+
+def test_run_multiple_rejected_sequence(fake_transport, logged_user) -> None:
+    """It should not retry sequence rejected by server and keep its row empty"""
+    transport = fake_transport(post=answer_predictions(rejected=[SECOND]))
+    p53 = P53(
+        ports=SimpleNamespace(
+            p53=P53Port(user=logged_user, transport=transport, cache=ResultCache())
+        )
+    )
+
+    data = p53.run_multiple(sequences=[FIRST, SECOND])
+
+    assert sorted(posted(transport)) == sorted([FIRST, SECOND])
+    assert list(data["sequence"]) == [FIRST, SECOND]
+    assert list(data["affinity"].isna()) == [False, True]
+
+
+def test_tool_results_without_directory() -> None:
+    """It should memoize tool results in memory when cache is disabled"""
+    cache = ResultCache()
+
+    cache.set_tool_results(tool="p53", results={FIRST: {"affinity": 1.0}})
+
+    assert cache.get_tool_results(tool="p53", keys=[FIRST, SECOND]) == {
+        FIRST: {"affinity": 1.0}
+    }
+    cache.clear()
+    assert cache.get_tool_results(tool="p53", keys=[FIRST]) == {}
+
+
+def test_scan(tmp_path, fake_transport, logged_user) -> None:
+    """It should predict prefiltered windows of string and local FASTA"""
+    sequence = "TT" + FIRST + "AT" * 20 + "A" * 30
+    path = tmp_path / "scan.fa"
+    lines = [sequence[start : start + 30] for start in range(0, len(sequence), 30)]
+    path.write_text(">first\n" + "\n".join(lines) + "\n")
+
+    transport = fake_transport(post=answer_predictions())
+    p53 = P53(
+        ports=SimpleNamespace(
+            p53=P53Port(user=logged_user, transport=transport, cache=ResultCache())
+        )
+    )
+
+    data = p53.scan(sequence=sequence, cutoff=6.0)
+    local = p53.scan(path=str(path), cutoff=6.0)
+
+    assert (2, FIRST) in zip(data["position"], data["sequence"])
+    assert (data["affinity"] >= 6.0).all()
+    assert local.equals(data)
+    # every window is sent at most once
+    assert len(posted(transport)) == len(set(posted(transport)))
+    assert len(posted(transport)) < len(sequence) - 19
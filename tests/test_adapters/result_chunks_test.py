@@ -0,0 +1,64 @@
+import pandas as pd
+
+from DNA_analyser_IBP.adapters.g4hunter_adapter import G4HunterAdapter
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.utils import save_chunks
+
+
+def answer_pages(records: list):
+    """Answer paged quadruplex requests from records"""
+
+    def _get(request) -> tuple:
+        page, size = request.params["page"], request.params["pageSize"]
+        start = (page - Config.RESULT_CONFIG.FIRST_PAGE) * size
+        return 200, {"items": records[start : start + size]}
+
+    return _get
+
+
+class TestResultChunks:
+    def test_load_result_chunks(self, fake_transport, logged_user) -> None:
+        """It should yield bounded chunks until short page"""
+        records = [{"position": index, "score": 1.5} for index in range(25)]
+        adapter = G4HunterAdapter(
+            user=logged_user, transport=fake_transport(get=answer_pages(records))
+        )
+
+        chunks = list(adapter.load_result_chunks(id="analyse", chunk_size=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert pd.concat(chunks)["position"].tolist() == list(range(25))
+
+    def test_load_result_chunks_empty_last_page(
+        self, fake_transport, logged_user
+    ) -> None:
+        """It should stop on empty page when results fill whole pages"""
+        records = [{"position": index, "score": 1.5} for index in range(20)]
+        adapter = G4HunterAdapter(
+            user=logged_user, transport=fake_transport(get=answer_pages(records))
+        )
+
+        chunks = list(adapter.load_result_chunks(id="analyse", chunk_size=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10]
+        assert len(adapter.transport.requests) == 3
+
+    def test_save_chunks(self, tmp_path, fake_transport, logged_user) -> None:
+        """It should write chunks into one csv with single header"""
+        records = [{"position": index, "score": 1.5} for index in range(25)]
+        adapter = G4HunterAdapter(
+            user=logged_user, transport=fake_transport(get=answer_pages(records))
+        )
+        file_path = str(tmp_path / "results.csv")
+
+        rows = save_chunks(
+            chunks=adapter.load_result_chunks(id="analyse", chunk_size=10),
+            file_path=file_path,
+        )
+
+        with open(file_path) as file:
+            lines = file.read().splitlines()
+        assert rows == 25
+        assert lines[0] == "position,score"
+        assert len(lines) == 26
+
@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+
+from DNA_analyser_IBP.adapters.sequence_adapter import SequenceAdapter
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.type import DataOutput
+
+random.seed(2)
+DATA = "".join(random.choice("ATGC") for _ in range(5321))
+
+
+def answer_windows(request) -> tuple:
+    """Answer sequence data window from DATA"""
+    length, position = request.params["len"], request.params["pos"]
+    assert 0 < length <= Config.DATA_CONFIG.WINDOW_SIZE
+    return 200, DATA[position : position + length]
+
+
+class TestSequenceData:
+    def test_load_data_windows(self, fake_transport, logged_user) -> None:
+        """It should join concurrently fetched 1000 bp windows in order"""
+        adapter = SequenceAdapter(
+            user=logged_user, transport=fake_transport(get=answer_windows)
+        )
+
+        data = adapter.load_data(
+            id="sequence", length=4500, position=321, sequence_length=len(DATA)
+        )
+
+        assert data == DATA[321:4821]
+        assert sorted(
+            request.params["pos"] for request in adapter.transport.requests
+        ) == [321, 1321, 2321, 3321, 4321]
+
+    def test_load_data_outputs(self, fake_transport, logged_user) -> None:
+        """It should return bytes and uint8 array of the same data"""
+        adapter = SequenceAdapter(
+            user=logged_user, transport=fake_transport(get=answer_windows)
+        )
+        params = dict(id="sequence", length=2001, position=0, sequence_length=len(DATA))
+
+        data_bytes = adapter.load_data(output=DataOutput.BYTES, **params)
+        data_array = adapter.load_data(output=DataOutput.NUMPY, max_workers=1, **params)
+
+        assert data_bytes == DATA[:2001].encode("ascii")
+        assert data_array.dtype == np.uint8
+        assert data_array.tobytes() == data_bytes
+
+    def test_iter_data(self, fake_transport, logged_user) -> None:
+        """It should yield windows in sequence order and check interval"""
+        adapter = SequenceAdapter(
+            user=logged_user, transport=fake_transport(get=answer_windows)
+        )
+
+        windows = list(
+            adapter.iter_data(
+                id="sequence", length=len(DATA), position=0, sequence_length=len(DATA)
+            )
+        )
+
+        assert [len(window) for window in windows] == [1000] * 5 + [321]
+        assert b"".join(windows).decode("ascii") == DATA
+        assert (
+            adapter.load_data(
+                id="sequence", length=10, position=len(DATA), sequence_length=len(DATA)
+            )
+            is None
+        )
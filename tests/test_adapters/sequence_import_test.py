@@ -0,0 +1,333 @@
+import gzip
+import io
+import json
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import tenacity
+
+from DNA_analyser_IBP.adapters.sequence_adapter import SequenceAdapter
+from DNA_analyser_IBP.adapters.validations import ApiConnectionError
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.interfaces.sequence_interface import Sequence
+from DNA_analyser_IBP.manifest import UploadManifest, hash_data
+from DNA_analyser_IBP.models import Batch
+from DNA_analyser_IBP.models import Sequence as Data
+from DNA_analyser_IBP.sequence_index import SequenceIndex
+
+MULTIFASTA = ">first record\nATGC\nAT\n>second\nGGGG\n"
+
+
+ITEMS = {
+    "items": [
+        {"id": "first", "name": "first", "tags": []},
+        {"id": "second", "name": "second", "tags": []},
+    ]
+}
+
+
+@pytest.fixture
+def create_adapter(fake_transport, logged_user):
+    """Factory of adapters answering sequence import with given status and payload"""
+
+    def _create_adapter(status_code: int, payload: dict = ITEMS) -> SequenceAdapter:
+        return SequenceAdapter(
+            user=logged_user,
+            transport=fake_transport(post=lambda request: (status_code, payload)),
+        )
+
+    return _create_adapter
+
+
+def body(request) -> bytes:
+    """Return decompressed body of recorded request"""
+    if request.headers.get("Content-Encoding") == "gzip":
+        return gzip.decompress(request.data)
+    return request.data
+
+
+class SequencePort:
+    """Sequence port without bulk import support"""
+
+    def __init__(self):
+        self.created = list()
+        self.sequences = dict()
+        self.lock = threading.Lock()
+
+    def create_multifasta_sequence(self, **kwargs):
+        return None
+
+    def create_text_sequence(self, *, data, name, **kwargs):
+        data = data if isinstance(data, str) else bytes(data).decode("ascii")
+        sequence = Data(id=f"id_{name}", name=name, tags=[], length=len(data))
+        with self.lock:
+            self.created.append((name, data))
+            self.sequences[sequence.id] = sequence
+        return sequence
+
+    def create_ncbi_sequences(self, *, circular, tags, records):
+        with self.lock:
+            self.created.append(list(records))
+        return [
+            Data(id=f"id_{ncbi_id}", name=name, tags=tags)
+            for name, ncbi_id, tags in records
+        ]
+
+    def load_by_id(self, *, id):
+        return self.sequences[id]
+
+
+class BatchPort:
+    def get_batch_status(self, *, id: str, type: str) -> Batch:
+        return Batch(status=BatchStatus.FINISH)
+
+
+class TestSequenceImport:
+    def test_create_file_sequence_gzip(self, tmp_path, create_adapter) -> None:
+        """It should stream decompressed gzip file and close it"""
+        path = tmp_path / "record.fa.gz"
+        path.write_bytes(gzip.compress(MULTIFASTA.encode()))
+        adapter = create_adapter(
+            status_code=201, payload={"payload": {"id": "id", "name": "name", "tags": []}}
+        )
+
+        sequence = adapter.create_file_sequence(
+            circular=False,
+            path=str(path),
+            name="name",
+            tags=[],
+            nucleic_type="DNA",
+            format="FASTA",
+            compress=True,
+        )
+
+        assert sequence.id == "id"
+        assert adapter.transport.requests[0].headers["Content-Encoding"] == "gzip"
+        assert MULTIFASTA.encode() in body(adapter.transport.requests[0])
+        assert body(adapter.transport.requests[0]).endswith(b"--\r\n")
+
+    def test_create_file_sequence_file_object(self, create_adapter) -> None:
+        """It should stream plain and gzip file-like objects without closing them"""
+        for content in [MULTIFASTA.encode(), gzip.compress(MULTIFASTA.encode())]:
+            file = io.BytesIO(content)
+            adapter = create_adapter(status_code=201)
+
+            adapter.create_multifasta_sequence(
+                circular=False, path=file, tags=[], nucleic_type="DNA"
+            )
+
+            assert "Content-Encoding" not in adapter.transport.requests[0].headers
+            assert MULTIFASTA.encode() in body(adapter.transport.requests[0])
+            assert not file.closed
+
+    def test_create_multifasta_sequence(self, tmp_path, create_adapter) -> None:
+        """It should send whole file in one request and return all sequences"""
+        path = tmp_path / "records.fa"
+        path.write_text(MULTIFASTA)
+        adapter = create_adapter(status_code=201)
+
+        sequences = adapter.create_multifasta_sequence(
+            circular=False, path=str(path), tags=["tag"], nucleic_type="DNA"
+        )
+
+        assert [sequence.id for sequence in sequences] == ["first", "second"]
+        assert len(adapter.transport.requests) == 1
+        assert MULTIFASTA.encode() in body(adapter.transport.requests[0])
+        assert b'"format": "MULTIFASTA"' in body(adapter.transport.requests[0])
+
+    def test_create_multifasta_sequence_unsupported(
+        self, tmp_path, create_adapter
+    ) -> None:
+        """It should return None when server rejects bulk import"""
+        path = tmp_path / "records.fa"
+        path.write_text(MULTIFASTA)
+        adapter = create_adapter(status_code=415)
+
+        assert (
+            adapter.create_multifasta_sequence(
+                circular=False, path=str(path), tags=[], nucleic_type="DNA"
+            )
+            is None
+        )
+
+    def test_create_multifasta_sequence_invalid(
+        self, tmp_path, monkeypatch, create_adapter
+    ) -> None:
+        """It should raise validation error of bulk import instead of fallback"""
+        monkeypatch.setattr(Config.TENACITY_CONFIG, "WAIT", tenacity.wait_none())
+        path = tmp_path / "records.fa"
+        path.write_text(MULTIFASTA)
+        adapter = create_adapter(status_code=422)
+
+        with pytest.raises(tenacity.RetryError) as error:
+            adapter.create_multifasta_sequence(
+                circular=False, path=str(path), tags=[], nucleic_type="DNA"
+            )
+        assert isinstance(error.value.last_attempt.exception(), ApiConnectionError)
+
+    def test_multifasta_creator_fallback(self, tmp_path) -> None:
+        """It should upload records one by one and return created sequence ids"""
+        path = tmp_path / "records.fa"
+        path.write_text(MULTIFASTA)
+        ports = SimpleNamespace(sequence=SequencePort(), batch=BatchPort())
+
+        result = Sequence(ports=ports).multifasta_creator(
+            path=str(path), nucleic_type="DNA", max_workers=2
+        )
+
+        assert sorted(ports.sequence.created) == [
+            ("first_record", "ATGCAT"),
+            ("second", "GGGG"),
+        ]
+        assert list(result["name"]) == ["first_record", "second"]
+        assert list(result["id"]) == ["id_first_record", "id_second"]
+        assert list(result["status"]) == [BatchStatus.FINISH] * 2
+
+    def test_multifasta_creator_manifest(self, tmp_path) -> None:
+        """It should skip uploaded records and resume pending batches on rerun"""
+        path = tmp_path / "records.fa"
+        path.write_text(MULTIFASTA)
+        manifest_path = str(tmp_path / "manifest.sqlite")
+        ports = SimpleNamespace(sequence=SequencePort(), batch=BatchPort())
+        sequence = Sequence(ports=ports)
+
+        # first run died after submitting first record
+        with UploadManifest(path=manifest_path) as manifest:
+            manifest.set(
+                name="first_record",
+                hash=hash_data(b"ATGCAT"),
+                id="id_first_record",
+                status=BatchStatus.RUNNING,
+            )
+
+        result = sequence.multifasta_creator(
+            path=str(path), nucleic_type="DNA", manifest=manifest_path
+        )
+
+        assert ports.sequence.created == [("second", "GGGG")]
+        assert list(result["id"]) == ["id_first_record", "id_second"]
+        assert list(result["status"]) == [BatchStatus.FINISH] * 2
+
+        result = sequence.multifasta_creator(
+            path=str(path), nucleic_type="DNA", manifest=manifest_path
+        )
+
+        assert len(ports.sequence.created) == 1
+        assert sorted(result["id"]) == ["id_first_record", "id_second"]
+        with UploadManifest(path=manifest_path) as manifest:
+            assert {record.status for record in manifest.all()} == {BatchStatus.FINISH}
+
+    def test_sequence_index_duplicates(self, tmp_path) -> None:
+        """It should return uploaded sequence with the same content instead of upload"""
+        path = tmp_path / "records.fa"
+        path.write_text(">copy\natgc\nat\n>other\nGGGG\n")
+        ports = SimpleNamespace(sequence=SequencePort(), batch=BatchPort())
+
+        with SequenceIndex(path=str(tmp_path / "index.sqlite")) as index:
+            sequence = Sequence(ports=ports, index=index)
+
+            assert sequence.text_creator(string="ATGCAT", name="plasmid") == "id_plasmid"
+            assert sequence.text_creator(string="ATGCAT", name="again") == "id_plasmid"
+            # the same content with other type or topology is a new sequence
+            assert (
+                sequence.text_creator(string="ATGCAT", name="rna", nucleic_type="RNA")
+                == "id_rna"
+            )
+            assert (
+                sequence.text_creator(string="ATGCAT", name="linear", circular=False)
+                == "id_linear"
+            )
+
+            result = sequence.multifasta_creator(
+                path=str(path), nucleic_type="DNA", circular=True
+            )
+
+            assert ports.sequence.created == [
+                ("plasmid", "ATGCAT"),
+                ("rna", "ATGCAT"),
+                ("linear", "ATGCAT"),
+                ("other", "GGGG"),
+            ]
+            assert list(result["name"]) == ["copy", "other"]
+            assert list(result["id"]) == ["id_plasmid", "id_other"]
+
+            # uploaded record link is stored in index and shared by new interface
+            other = pd.Series({"id": "id_other", "length": 4})
+            assert (
+                Sequence(ports=ports, index=index).load_data(4, 0, sequence=other)
+                == "GGGG"
+            )
+
+            # sequence missing on server is dropped from index and uploaded again
+            del ports.sequence.sequences["id_plasmid"]
+            assert sequence.text_creator(string="ATGCAT", name="new") == "id_new"
+
+    def test_create_ncbi_sequences(self, create_adapter) -> None:
+        """It should send all NCBI records in one ncbis array"""
+        adapter = create_adapter(status_code=201)
+
+        sequences = adapter.create_ncbi_sequences(
+            circular=True,
+            tags=["shared"],
+            records=[("first", "NC_1", ["shared", "a"]), ("second", "NC_2", ["shared"])],
+        )
+
+        data = json.loads(body(adapter.transport.requests[0]))
+        assert [sequence.id for sequence in sequences] == ["first", "second"]
+        assert [(ncbi["name"], ncbi["ncbiId"], ncbi["tags"]) for ncbi in data["ncbis"]] == [
+            ("first", "NC_1", ["shared", "a"]),
+            ("second", "NC_2", ["shared"]),
+        ]
+
+    def test_ncbi_creator_batches(self) -> None:
+        """It should import NCBI ids from DataFrame in batched requests"""
+        ports = SimpleNamespace(sequence=SequencePort(), batch=BatchPort())
+        genomes = pd.DataFrame(
+            data=[
+                ["melanogaster_1", "melanogaster", "NC_004354.4"],
+                ["melanogaster_2", "melanogaster", "NT_033779.5"],
+                ["melanogaster_3", None, "NT_033778.4"],
+            ],
+            columns=["NAME", "TAG", "NCBI_ID"],
+        )
+
+        result = Sequence(ports=ports).ncbi_creator(
+            tags=["fly"], batch_size=2, ncbi_id=genomes
+        )
+
+        # batches are posted concurrently, result keeps record order
+        assert sorted(ports.sequence.created) == [
+            [
+                ("melanogaster_1", "NC_004354.4", ["fly", "melanogaster"]),
+                ("melanogaster_2", "NT_033779.5", ["fly", "melanogaster"]),
+            ],
+            [("melanogaster_3", "NT_033778.4", ["fly"])],
+        ]
+        assert list(result["id"]) == [
+            "id_NC_004354.4",
+            "id_NT_033779.5",
+            "id_NT_033778.4",
+        ]
+        assert set(result["status"]) == {BatchStatus.FINISH}
+
+    def test_ncbi_creator_concurrent(self) -> None:
+        """It should post NCBI batches at the same time"""
+        ports = SimpleNamespace(sequence=SequencePort(), batch=BatchPort())
+        barrier = threading.Barrier(2, timeout=5)
+        create = ports.sequence.create_ncbi_sequences
+
+        def _create_ncbi_sequences(**kwargs):
+            barrier.wait()
+            return create(**kwargs)
+
+        ports.sequence.create_ncbi_sequences = _create_ncbi_sequences
+
+        result = Sequence(ports=ports).ncbi_creator(
+            batch_size=1, max_workers=2, ncbi_id=["NC_1", "NC_2"]
+        )
+
+        assert list(result["id"]) == ["id_NC_1", "id_NC_2"]
+        assert set(result["status"]) == {BatchStatus.FINISH}
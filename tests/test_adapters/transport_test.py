@@ -0,0 +1,59 @@
+from DNA_analyser_IBP.adapters import Adapters, Transport
+from DNA_analyser_IBP.config import Config
+from DNA_analyser_IBP.models import User
+
+
+class TestTransport:
+    def test_transport_pool_size(self) -> None:
+        """It should mount pooled adapters with given size"""
+        transport = Transport(pool_size=32)
+
+        for prefix in ["http://", "https://"]:
+            assert transport.session.get_adapter(prefix)._pool_maxsize == 32
+
+    def test_transport_default_headers(self) -> None:
+        """It should set default Accept and Authorization headers"""
+        transport = Transport(jwt="token")
+
+        assert transport.session.headers["Accept"] == "application/json"
+        assert transport.session.headers["Authorization"] == "token"
+
+        transport.authorize(jwt=None)
+        assert "Authorization" not in transport.session.headers
+
+    def test_transport_timeout(self, monkeypatch) -> None:
+        """It should send requests with default timeout unless it is given"""
+        transport = Transport()
+        timeouts = list()
+        monkeypatch.setattr(
+            transport.session,
+            "request",
+            lambda method, url, **kwargs: timeouts.append(kwargs["timeout"]),
+        )
+
+        transport.get("http://host")
+        transport.post("http://host", timeout=5)
+
+        assert timeouts == [Config.TRANSPORT_CONFIG.TIMEOUT, 5]
+
+    def test_adapters_share_transport(self) -> None:
+        """It should route all adapters through one transport"""
+        user = User(
+            email="host", password="host", server=Config.SERVER_CONFIG.PRODUCTION
+        )
+        adapters = Adapters(user=user)
+
+        transports = {
+            id(adapter.transport)
+            for adapter in [
+                adapters.p53,
+                adapters.batch,
+                adapters.g4killer,
+                adapters.sequence,
+                adapters.g4hunter,
+                adapters.rloopr,
+                adapters.zdna,
+                adapters.cpg,
+            ]
+        }
+        assert len(transports) == 1
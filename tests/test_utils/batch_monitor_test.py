@@ -0,0 +1,46 @@
+import pytest
+
+from DNA_analyser_IBP.batch_monitor import BatchJob
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.models import Batch
+from DNA_analyser_IBP.type import Types
+
+INTERVALS = {"min_interval": 0.5, "max_interval": 30.0, "backoff": 2.0}
+
+
+def test_batch_job_backoff_when_not_started() -> None:
+    """It should poll waiting batches less and less often"""
+    job = BatchJob(id="id", type=Types.G4HUNTER, name="name", submitted=0.0)
+
+    job.update(batch=Batch(status=BatchStatus.WAITING), now=1.0, **INTERVALS)
+    assert job.interval == 1.0
+    job.update(batch=Batch(status=BatchStatus.WAITING), now=2.0, **INTERVALS)
+    assert job.interval == 2.0
+    assert job.next_poll == 4.0
+
+    for now in range(3, 20):
+        job.update(batch=Batch(status=BatchStatus.WAITING), now=now, **INTERVALS)
+    assert job.interval == INTERVALS["max_interval"]
+
+
+def test_batch_job_estimates_from_progress() -> None:
+    """It should poll running batch around half of its remaining time"""
+    job = BatchJob(id="id", type=Types.G4HUNTER, name="name", submitted=0.0)
+    running = dict(status=BatchStatus.RUNNING, started="2020-01-01T00:00:00")
+
+    job.update(batch=Batch(progress=10, **running), now=1.0, **INTERVALS)
+    job.update(batch=Batch(progress=20, **running), now=2.0, **INTERVALS)
+    # 10 % per second -> 8 seconds remaining
+    assert job.interval == pytest.approx(4.0)
+
+    finished = Batch(progress=100, status=BatchStatus.FINISH)
+    job.update(batch=finished, now=3.0, **INTERVALS)
+    assert job.is_done()
+    assert job.elapsed == 3.0
+
+
+def test_batch_job_failed_submission() -> None:
+    """It should treat job without id as failed"""
+    job = BatchJob(id=None, type=Types.SEQUENCE, name="name")
+    assert job.is_done()
+    assert job.status == BatchStatus.FAILED
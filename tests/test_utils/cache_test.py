@@ -0,0 +1,74 @@
+import os
+import time
+
+import pandas as pd
+
+from DNA_analyser_IBP.cache import ResultCache
+
+
+class Loader:
+    """Counting result loader"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_cache_finished_result(tmp_path) -> None:
+    """It should load finished result only once"""
+    cache = ResultCache(directory=str(tmp_path))
+    loader = Loader(pd.DataFrame({"position": [1, 2]}))
+
+    for _ in range(3):
+        data = cache.load(
+            id="id", endpoint="g4hunter/result", loader=loader, is_finished=lambda: True
+        )
+
+    assert loader.calls == 1
+    assert data["position"].tolist() == [1, 2]
+
+
+def test_cache_bypass_and_unfinished(tmp_path) -> None:
+    """It should not cache unfinished results and respect bypass flag"""
+    cache = ResultCache(directory=str(tmp_path))
+    loader = Loader("csv")
+
+    cache.load(id="id", endpoint="csv", loader=loader, is_finished=lambda: False)
+    cache.load(id="id", endpoint="csv", loader=loader, is_finished=lambda: False)
+    cache.load(id="id", endpoint="csv", loader=loader, is_finished=lambda: True)
+    cache.load(
+        id="id", endpoint="csv", loader=loader, is_finished=lambda: True, use_cache=False
+    )
+
+    assert loader.calls == 4
+    assert ResultCache(directory=None).load(
+        id="id", endpoint="csv", loader=loader, is_finished=lambda: True
+    ) == "csv"
+
+
+def test_cache_params_key() -> None:
+    """It should distinguish request parameters"""
+    first = ResultCache.get_key(id="id", endpoint="heatmap", segments=31)
+    second = ResultCache.get_key(id="id", endpoint="heatmap", segments=10)
+
+    assert first != second
+
+
+def test_cache_lru_eviction(tmp_path) -> None:
+    """It should evict least recently used values over max size"""
+    cache = ResultCache(directory=str(tmp_path), max_size=2500)
+
+    cache.set("first", "A" * 1000)
+    cache.set("second", "B" * 1000)
+    os.utime(cache._get_path("first"), (time.time() - 10, time.time() - 10))
+    os.utime(cache._get_path("second"), (time.time() - 5, time.time() - 5))
+    cache.get("first")
+    cache.set("third", "C" * 1000)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == "A" * 1000
+    assert cache.get("third") == "C" * 1000
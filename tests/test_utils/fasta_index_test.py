@@ -0,0 +1,117 @@
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from DNA_analyser_IBP.fasta_index import (
+    FastaIndex,
+    build_fasta_index,
+    read_fasta_index,
+)
+from DNA_analyser_IBP.interfaces.sequence_interface import Sequence
+
+
+def _write_fasta(path, records, line_bases=60) -> None:
+    with open(path, "w") as fasta:
+        for name, sequence in records:
+            fasta.write(f">{name} description\n")
+            for start in range(0, len(sequence), line_bases):
+                fasta.write(sequence[start : start + line_bases] + "\n")
+
+
+@pytest.fixture
+def records():
+    random.seed(1)
+    return [
+        ("chr1", "".join(random.choice("ATGC") for _ in range(1234))),
+        ("chr2", "".join(random.choice("ATGC") for _ in range(120))),
+        ("chr3", "GGGA"),
+    ]
+
+
+def test_build_fasta_index(tmp_path, records) -> None:
+    """It should create samtools faidx compatible records"""
+    path = str(tmp_path / "genome.fa")
+    _write_fasta(path, records)
+
+    index = build_fasta_index(path=path)
+
+    assert [record.to_line() for record in index] == [
+        "chr1\t1234\t18\t60\t61\n",
+        "chr2\t120\t1291\t60\t61\n",
+        "chr3\t4\t1431\t4\t5\n",
+    ]
+
+
+def test_fasta_index_fetch(tmp_path, records) -> None:
+    """It should return any slice of any record and store .fai file"""
+    path = str(tmp_path / "genome.fa")
+    _write_fasta(path, records)
+
+    with FastaIndex(path=path) as fasta_index:
+        sequences = dict(records)
+        for name, position, length in [
+            ("chr1", 0, 1234),
+            ("chr1", 59, 2),
+            ("chr1", 60, 61),
+            ("chr1", 1000, 234),
+            ("chr2", 117, 3),
+            ("chr3", 0, 4),
+            ("chr3", 4, 0),
+        ]:
+            assert (
+                fasta_index.fetch(length=length, position=position, name=name)
+                == sequences[name][position : position + length]
+            )
+
+        with pytest.raises(ValueError):
+            fasta_index.fetch(length=10, position=1230, name="chr1")
+        with pytest.raises(ValueError):
+            fasta_index.get_record()
+
+    assert os.path.exists(f"{path}.fai")
+    assert [record.name for record in read_fasta_index(path=f"{path}.fai")] == [
+        "chr1",
+        "chr2",
+        "chr3",
+    ]
+
+
+def test_fasta_index_different_line_length(tmp_path) -> None:
+    """It should refuse file with different line lengths inside record"""
+    path = str(tmp_path / "broken.fa")
+    with open(path, "w") as fasta:
+        fasta.write(">broken\nATGC\nAT\nATGC\n")
+
+    with pytest.raises(ValueError):
+        build_fasta_index(path=path)
+
+
+class SequencePort:
+    """Sequence port returning remote data"""
+
+    def load_data(self, *, id, length, position, sequence_length, **kwargs):
+        return "remote"
+
+
+class Ports:
+    sequence = SequencePort()
+
+
+def test_sequence_load_data_local(tmp_path, records) -> None:
+    """It should read linked sequence locally and other sequences from server"""
+    path = str(tmp_path / "genome.fa")
+    _write_fasta(path, records)
+    sequence = Sequence(ports=Ports())
+    local = pd.Series({"id": "local", "length": 1234})
+    remote = pd.Series({"id": "remote", "length": 1234})
+
+    sequence.add_local_fasta("chr1", sequence=local, path=path)
+
+    assert sequence.load_data(1250, 0, sequence=local) is None
+    assert sequence.load_data(1200, 10, sequence=local) == records[0][1][10:1210]
+    assert sequence.load_data(100, 10, sequence=remote) == "remote"
+
+    sequence.remove_local_fasta(sequence=local)
+    assert sequence.load_data(100, 10, sequence=local) == "remote"
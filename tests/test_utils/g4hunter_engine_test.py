@@ -0,0 +1,49 @@
+import numpy as np
+
+from DNA_analyser_IBP.engines import (
+    find_quadruplexes,
+    g4hunter_base_scores,
+    g4hunter_window_sums,
+)
+
+TELOMERE: str = "TTAGGG" * 4
+SEQUENCE: str = "AT" * 20 + TELOMERE + "AT" * 20 + "CCCTAA" * 4 + "AT" * 20
+
+
+def test_g4hunter_base_scores() -> None:
+    """It should score G and C runs by their length capped to 4"""
+    scores = g4hunter_base_scores("aGGGtCCCCCGGGGGGa")
+
+    assert scores.tolist() == [0, 3, 3, 3, 0, -4, -4, -4, -4, -4, 4, 4, 4, 4, 4, 4, 0]
+
+
+def test_g4hunter_window_sums() -> None:
+    """It should match naive sliding window sums"""
+    scores = g4hunter_base_scores(SEQUENCE)
+    naive = [scores[i : i + 25].sum() for i in range(len(scores) - 24)]
+
+    assert np.array_equal(g4hunter_window_sums(scores, 25), naive)
+
+
+def test_find_quadruplexes() -> None:
+    """It should merge windows above threshold into G and C quadruplexes"""
+    results = find_quadruplexes(sequence=SEQUENCE, threshold=1.2, window_size=20)
+
+    assert list(results.columns) == [
+        "id",
+        "position",
+        "length",
+        "score",
+        "absScore",
+        "sequence",
+        "subScoreList",
+    ]
+    assert len(results) == 2
+    assert TELOMERE[2:-1] in results["sequence"].iloc[0]
+    assert results["score"].iloc[0] > 0 and results["score"].iloc[1] < 0
+    assert min(results["subScoreList"].iloc[0]) >= 1.2
+    assert (results["length"] == [len(s) for s in results["sequence"]]).all()
+    empty = find_quadruplexes(sequence="AT" * 50, threshold=1.2, window_size=20)
+    assert empty.empty
+    assert empty["position"].dtype == "int32"
+    assert empty["score"].dtype == "float32"
@@ -0,0 +1,89 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from DNA_analyser_IBP.engines import g4hunter_base_scores, kill_quadruplexes
+from DNA_analyser_IBP.interfaces.g4killer_interface import G4Killer
+from DNA_analyser_IBP.models import G4Killer as AnalyseModel
+
+ORIGIN_SEQUENCE = "AGGAGGGTAAGGGTGAGTTGGGTAATTGGGGGGCATGGTTAGG"
+
+
+def naive_kill(sequence: str, threshold: float) -> tuple:
+    """Greedy search rescoring every single G mutation"""
+    changes = 0
+    score = g4hunter_base_scores(sequence).mean()
+
+    while score > threshold + 1e-9:
+        candidates = [
+            sequence[:index] + base + sequence[index + 1 :]
+            for index, nucleotide in enumerate(sequence)
+            if nucleotide == "G"
+            for base in "ACT"
+        ]
+        sequence = min(candidates, key=lambda c: g4hunter_base_scores(c).sum())
+        score = g4hunter_base_scores(sequence).mean()
+        changes += 1
+
+    return changes, score
+
+
+def test_kill_quadruplexes() -> None:
+    """It should lower score under threshold and list equally scored variants"""
+    result = kill_quadruplexes(sequences=[ORIGIN_SEQUENCE], threshold=1.0)[0]
+
+    assert result["originScore"] == pytest.approx(
+        g4hunter_base_scores(ORIGIN_SEQUENCE).mean()
+    )
+    assert result["mutationScore"] <= 1.0
+    assert result["changeCount"] == 3
+    for variant in result["mutationSequences"]:
+        assert g4hunter_base_scores(variant).mean() == pytest.approx(
+            result["mutationScore"]
+        )
+
+
+def test_kill_quadruplexes_matches_naive_search() -> None:
+    """It should find the same change count and score as rescoring all mutations"""
+    generator = random.Random(42)
+    sequences = [
+        "".join(generator.choice("GGGCAT") for _ in range(generator.randint(10, 60)))
+        for _ in range(50)
+    ]
+
+    results = kill_quadruplexes(sequences=sequences, threshold=0.5, batch_size=7)
+
+    for sequence, result in zip(sequences, results):
+        changes, score = naive_kill(sequence, 0.5)
+        assert result["originSequence"] == sequence
+        assert result["changeCount"] == changes
+        assert result["mutationScore"] == pytest.approx(score)
+
+
+def test_kill_quadruplexes_complementary() -> None:
+    """It should mutate C bases on complementary strand"""
+    result = kill_quadruplexes(
+        sequences=["CCCTAACCCTAACCC"], threshold=1.0, complementary=True
+    )[0]
+
+    assert result["mutationScore"] >= -1.0
+    assert all("G" in variant for variant in result["mutationSequences"])
+
+
+def test_run_multiple_cross_check() -> None:
+    """It should compare sampled local results with server results"""
+    server = kill_quadruplexes(sequences=[ORIGIN_SEQUENCE], threshold=1.0)[0]
+    ports = SimpleNamespace(
+        g4killer=SimpleNamespace(create_analyse=lambda **kwargs: AnalyseModel(**server))
+    )
+
+    data = G4Killer(ports=ports).run_multiple(
+        local=True,
+        cross_check=5,
+        sequences=[ORIGIN_SEQUENCE, ORIGIN_SEQUENCE, "GGGGATGGGG" * 30],
+        threshold=1.0,
+    )
+
+    assert list(data["change_count"])[:2] == [3, 3]
+    assert list(data["server_match"]) == [True, True, None]
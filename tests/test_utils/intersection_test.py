@@ -0,0 +1,59 @@
+from DNA_analyser_IBP.intersection import (
+    Annotation,
+    AnnotationCollection,
+    G4Result,
+    create_annotation_list,
+    create_g4hunter_list,
+    get_annotation_labels,
+)
+
+
+def test_create_g4hunter_list(tmp_path) -> None:
+    """It should parse G4Hunter csv into arrays with compatible iterator"""
+    path = tmp_path / "result.csv"
+    path.write_text(
+        '"ID"\t"POSITION"\t"LENGTH"\t"SCORE"\t"ABS_SCORE"\t"SEQUENCE"\t"SUB_SCORE"\n'
+        '"1"\t"7758"\t"36"\t"-1.0"\t"1.0"\t"GCAATG"\t"-1.2,-1.32"\n'
+        '"2"\t"8210"\t"26"\t"1.5"\t"1.5"\t"AACCCC"\t"-1.2"\n'
+    )
+
+    results = create_g4hunter_list(analyse=str(path))
+
+    assert len(results) == 2
+    assert results.middle.tolist() == [7776, 8223]
+    assert [result.get_group_id() for result in results] == [1, 7]
+    assert isinstance(results[1], G4Result)
+    assert results[1].score == 1.5
+
+
+def test_create_annotation_list(tmp_path) -> None:
+    """It should parse annotations sorted by start with labels in order"""
+    path = tmp_path / "annotation.csv"
+    path.write_text(
+        ",start,end,lenght,feature\n"
+        "0,500,900,401,gene\n"
+        "1,50,80,31,CDS\n"
+        "2,300,400,101,gene\n"
+    )
+
+    annotations = create_annotation_list(annotation=str(path), area_size=100)
+
+    assert annotations.start.tolist() == [50, 300, 500]
+    assert annotations.before.tolist() == [0, 200, 400]
+    assert annotations.after.tolist() == [180, 500, 1000]
+    assert get_annotation_labels(annotation_list=annotations) == ["CDS", "gene"]
+    assert [annotation.feature for annotation in annotations] == ["CDS", "gene", "gene"]
+
+
+def test_annotation_collection_from_annotations() -> None:
+    """It should keep area size of given annotations"""
+    annotations = [
+        Annotation(start=300, end=400, feature="gene", area=50),
+        Annotation(start=10, end=20, feature="CDS", area=50),
+    ]
+
+    collection = AnnotationCollection.from_annotations(annotations)
+
+    assert collection.start.tolist() == [10, 300]
+    assert collection.before.tolist() == [0, 250]
+    assert collection.after.tolist() == [70, 450]
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from DNA_analyser_IBP.interfaces.g4hunter_interface import G4Hunter
+from DNA_analyser_IBP.interfaces.zdna_interface import ZDna
+
+G4HUNTER: str = "AT" * 20 + "TTAGGG" * 4 + "AT" * 20 + "CCCTAA" * 4 + "AT" * 20
+ZDNA: str = "A" * 10 + "CG" * 8 + "A" * 10 + "CA" * 6 + "A" * 10
+
+
+class SequencePort:
+    """Sequence port returning uploaded sequence data"""
+
+    def __init__(self, data: str):
+        self.data = data
+
+    def load_data(self, *, id, length, position, sequence_length, output):
+        return self.data[position : position + length].encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "interface, sequence, parameters, fields",
+    [
+        (
+            G4Hunter,
+            G4HUNTER,
+            {"threshold": 1.2, "window_size": 20},
+            {"window_size": 20},
+        ),
+        (ZDna, ZDNA, {"model": "model1"}, {"GC_score": 25}),
+    ],
+)
+def test_local_analyse_creator(interface, sequence, parameters, fields) -> None:
+    """It should score raw and uploaded sequences locally and serve their results"""
+    uploaded = pd.Series(
+        {"id": "uploaded", "name": "uploaded", "tags": "", "length": len(sequence)}
+    )
+    analyse = interface(ports=SimpleNamespace(sequence=SequencePort(sequence)))
+
+    analyses = pd.concat(
+        [
+            analyse.analyse_creator(
+                sequence={"construct": sequence, "empty": "A" * 50}, **parameters
+            ),
+            analyse.analyse_creator(local=True, sequence=uploaded, **parameters),
+        ],
+        ignore_index=True,
+    )
+
+    assert list(analyses["title"]) == ["construct", "empty", "uploaded"]
+    assert list(analyses["result_count"]) == [2, 0, 2]
+    assert list(analyses["sequence_id"].fillna("")) == ["", "", "uploaded"]
+    for field, value in fields.items():
+        assert list(analyses[field]) == [value] * 3
+    assert len(analyse.load_results(analyse=analyses.iloc[0])) == 2
+    assert [
+        len(chunk)
+        for chunk in analyse.iter_results(chunk_size=1, analyse=analyses.iloc[2])
+    ] == [1, 1]
+
+    analyse.delete(analyse=analyses.iloc[0])
+    assert analyse._load_local_result(id=analyses.iloc[0]["id"]) is None
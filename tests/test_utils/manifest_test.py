@@ -0,0 +1,33 @@
+import gzip
+
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.manifest import UploadManifest, hash_data, hash_file
+
+
+def test_upload_manifest(tmp_path) -> None:
+    """It should keep records between runs and tell uploaded from pending"""
+    path = str(tmp_path / "manifest.sqlite")
+
+    with UploadManifest(path=path) as manifest:
+        manifest.set(name="a", hash="1", id="id_a", status=BatchStatus.FINISH)
+        manifest.set(name="b", hash="2", id="id_b", status=BatchStatus.WAITING)
+        manifest.set(name="c", hash="3", id=None, status=BatchStatus.FAILED)
+
+    with UploadManifest(path=path) as manifest:
+        assert manifest.get(name="a", hash="1").is_uploaded
+        assert manifest.get(name="b", hash="2").is_pending
+        assert not manifest.get(name="c", hash="3").is_pending
+        # changed content is new record
+        assert manifest.get(name="a", hash="2") is None
+        assert [record.name for record in manifest.all()] == ["a", "b", "c"]
+
+
+def test_hash_file(tmp_path) -> None:
+    """It should hash plain and gzip compressed file content the same"""
+    plain = tmp_path / "record.fa"
+    compressed = tmp_path / "record.fa.gz"
+    plain.write_bytes(b">record\nATGC\n")
+    compressed.write_bytes(gzip.compress(b">record\nATGC\n"))
+
+    assert hash_file(str(plain)) == hash_file(str(compressed))
+    assert hash_file(str(plain)) == hash_data(b">record\nATGC\n")
@@ -0,0 +1,113 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from DNA_analyser_IBP.intersection import (
+    Annotation,
+    G4Result,
+    count_overlay,
+    get_group_indexes,
+)
+
+
+def brute_force_overlay(analyse_list, annotation_list, labels) -> list:
+    """Count overlay with per object comparisons"""
+    result = [[0, 0, 0] * 6 for _ in labels]
+
+    for annotation in annotation_list:
+        row = result[labels.index(annotation.feature)]
+        for analyse in analyse_list:
+            group_id = analyse.get_group_id()
+            row[group_id - 1] += annotation.is_before(analyse)
+            row[group_id] += annotation.is_in(analyse)
+            row[group_id + 1] += annotation.is_after(analyse)
+    return result
+
+
+@pytest.mark.parametrize(
+    "score", [0.5, 1.2, 1.3, 1.4, 1.41, 1.6, 1.8, 1.9, 2.0, 2.01, 3.5]
+)
+def test_group_indexes(score: float) -> None:
+    """It should bin scores into the same groups as G4Result"""
+    group_id = G4Result(position=0, length=20, score=score).get_group_id()
+
+    assert get_group_indexes(np.array([score]))[0] * 3 + 1 == group_id
+
+
+def test_count_overlay() -> None:
+    """It should count the same overlay as per object comparisons"""
+    generator = random.Random(42)
+    analyse_list = [
+        G4Result(
+            position=generator.randint(0, 5000),
+            length=generator.randint(20, 60),
+            score=generator.choice([1.2, 1.4, 1.6, 1.8, 2.0, 2.4])
+            - generator.random() * 0.3,
+        )
+        for _ in range(400)
+    ]
+    annotation_list = sorted(
+        [
+            Annotation(
+                start=start,
+                end=start + generator.randint(0, 400),
+                feature=generator.choice(["gene", "CDS", "mRNA"]),
+                area=100,
+            )
+            for start in [generator.randint(0, 5000) for _ in range(150)]
+        ],
+        key=lambda annotation: annotation.start,
+    )
+    labels = ["gene", "CDS", "mRNA"]
+
+    counts = count_overlay(
+        analyse_list=analyse_list, annotation_list=annotation_list, labels=labels
+    )
+
+    assert counts.tolist() == brute_force_overlay(analyse_list, annotation_list, labels)
+
+
+def test_annotation_overlay_batch(tmp_path) -> None:
+    """It should overlay all file pairs in worker processes and save each of them"""
+    from DNA_analyser_IBP.interfaces.extras_interface import Extras
+
+    file_pairs = list()
+    for name in ["first", "second"]:
+        analyse = tmp_path / f"{name}_result.csv"
+        analyse.write_text(
+            '"ID"\t"POSITION"\t"LENGTH"\t"SCORE"\t"ABS_SCORE"\t"SEQUENCE"\t"SUB_SCORE"\n'
+            '"1"\t"90"\t"20"\t"1.3"\t"1.3"\t"GGG"\t"1.3"\n'
+            '"2"\t"490"\t"20"\t"2.5"\t"2.5"\t"GGG"\t"2.5"\n'
+        )
+        annotation = tmp_path / f"{name}.csv"
+        annotation.write_text(",start,end,lenght,feature\n0,100,400,301,gene\n")
+        file_pairs.append([str(annotation), str(analyse)])
+    # pairs sharing annotation are saved into separate files
+    file_pairs.append([file_pairs[0][0], file_pairs[1][1]])
+    overlay_path = tmp_path / "overlay"
+    overlay_path.mkdir()
+
+    data = Extras().annotation_overlay_batch(
+        file_pairs=file_pairs, overlay_path=str(overlay_path), max_workers=2
+    )
+
+    assert data["ANNOTATION"].tolist() == [pair[0] for pair in file_pairs]
+    assert data["1.2-1.4 IN"].tolist() == [1, 1, 1]
+    assert data["2.0-inf AFTER"].tolist() == [1, 1, 1]
+    assert sorted(os.listdir(overlay_path)) == [
+        "first_first_result.csv",
+        "first_second_result.csv",
+        "second_second_result.csv",
+    ]
+
+    # single pair keeps name of annotation file
+    single_path = tmp_path / "single"
+    single_path.mkdir()
+    Extras().annotation_overlay(
+        analyse_file=file_pairs[0][1],
+        annotation_file=file_pairs[0][0],
+        overlay_path=str(single_path),
+    )
+    assert os.listdir(single_path) == ["first.csv"]
@@ -0,0 +1,40 @@
+import numpy as np
+
+from DNA_analyser_IBP.engines import half_site_mismatches, iter_p53_windows
+
+RESPONSE_ELEMENT: str = "GGACATGCCCGGGCATGTCC"
+SEQUENCE: str = "TT" + RESPONSE_ELEMENT + "AT" * 20 + "AGACATGTCT" + "A" * 30
+
+
+def test_half_site_mismatches() -> None:
+    """It should count mismatches against IUPAC half-site"""
+    codes = np.frombuffer(b"GGACATGCCCA", dtype=np.uint8)
+
+    assert half_site_mismatches(codes).tolist() == [0, 5]
+
+
+def test_iter_p53_windows() -> None:
+    """It should yield windows with half-site once regardless of chunking"""
+    windows = list(iter_p53_windows(chunks=[SEQUENCE.lower()]))
+    chunked = list(
+        iter_p53_windows(chunks=[SEQUENCE[i : i + 7] for i in range(0, len(SEQUENCE), 7)])
+    )
+
+    assert windows == chunked
+    assert (2, RESPONSE_ELEMENT) in windows
+    assert all(
+        any(half_site_mismatches(np.frombuffer(w.encode(), np.uint8)) == 0)
+        for _, w in windows
+    )
+    # windows without half-site are skipped
+    assert len(windows) < len(SEQUENCE) - 19
+
+
+def test_iter_p53_windows_step_and_mismatches() -> None:
+    """It should keep step grid and allow half-site mismatches"""
+    stepped = list(iter_p53_windows(chunks=[SEQUENCE], step=5))
+    strict = list(iter_p53_windows(chunks=[SEQUENCE]))
+    relaxed = list(iter_p53_windows(chunks=[SEQUENCE], mismatches=4))
+
+    assert stepped and all(position % 5 == 0 for position, _ in stepped)
+    assert set(strict) < set(relaxed)
@@ -0,0 +1,44 @@
+import os
+
+from DNA_analyser_IBP.intersection import pair_files
+
+
+def test_pair_files() -> None:
+    """It should pair annotations with token aligned analyse names"""
+    pairing = pair_files(
+        annotation_list=[
+            "/annotations/melanogaster_2.csv",
+            "/annotations/melanogaster_20.csv",
+            "/annotations/sapiens.csv",
+        ],
+        analyse_list=[
+            "/results/melanogaster_20_result.csv",
+            "/results/melanogaster_2_result.csv",
+            "/results/coli_result.csv",
+        ],
+    )
+
+    assert pairing.pairs == [
+        ["/annotations/melanogaster_2.csv", "/results/melanogaster_2_result.csv"],
+        ["/annotations/melanogaster_20.csv", "/results/melanogaster_20_result.csv"],
+    ]
+    assert pairing.unmatched_annotations == ["/annotations/sapiens.csv"]
+    assert pairing.unmatched_analyses == ["/results/coli_result.csv"]
+    assert pairing.ambiguous == {}
+
+
+def test_pair_files_ambiguous_with_key() -> None:
+    """It should pair files by key extractor and report ambiguous annotations"""
+    pairing = pair_files(
+        annotation_list=["/annotations/NC_000001.txt"],
+        analyse_list=["/results/a/NC_000001.csv", "/results/b/NC_000001.csv"],
+        key=lambda path: os.path.splitext(os.path.basename(path))[0],
+    )
+
+    assert len(pairing.pairs) == 2
+    assert pairing.ambiguous == {
+        "/annotations/NC_000001.txt": [
+            "/results/a/NC_000001.csv",
+            "/results/b/NC_000001.csv",
+        ]
+    }
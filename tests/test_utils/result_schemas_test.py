@@ -0,0 +1,53 @@
+from DNA_analyser_IBP.result_schemas import ResultSchema, decode_result, empty_result
+
+
+def test_decode_g4hunter_result() -> None:
+    """It should build typed columns and pass unknown fields through"""
+    response = [
+        {
+            "id": index,
+            "position": index * 100,
+            "length": 25,
+            "score": 1.25,
+            "absScore": 1.25,
+            "sequence": "GGGAGGGAGGGAGGG",
+            "subScoreList": [1.0, 1.5],
+        }
+        for index in range(10)
+    ]
+
+    data = decode_result(response=response, schema=ResultSchema.G4HUNTER)
+
+    assert list(data.columns) == list(response[0].keys())
+    assert data["position"].dtype == "int32"
+    assert data["score"].dtype == "float32"
+    assert data["sequence"].dtype == "category"
+    assert data["subScoreList"].iloc[0] == [1.0, 1.5]
+
+
+def test_decode_rloopr_result_with_missing_values() -> None:
+    """It should keep inferred type when typed column has missing values"""
+    response = [
+        {"position": 1, "g3cnt": None, "strand": "+", "linker": ""},
+        {"position": 2, "g3cnt": 3, "strand": "-", "linker": "A"},
+    ]
+
+    data = decode_result(response=response, schema=ResultSchema.RLOOPR)
+
+    assert data["position"].dtype == "int32"
+    assert data["g3cnt"].tolist()[1] == 3
+    assert data["strand"].dtype == "category"
+    assert data["linker"].tolist() == ["", "A"]
+
+
+def test_empty_result() -> None:
+    """It should build empty columns with schema types"""
+    data = empty_result(
+        columns=["id", "position", "score", "sequence"], schema=ResultSchema.G4HUNTER
+    )
+
+    assert data.empty
+    assert list(data.columns) == ["id", "position", "score", "sequence"]
+    assert data["position"].dtype == "int32"
+    assert data["score"].dtype == "float32"
+    assert data["sequence"].dtype == object
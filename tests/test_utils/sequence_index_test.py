@@ -0,0 +1,51 @@
+import gzip
+
+from DNA_analyser_IBP.sequence_index import SequenceDigest, SequenceIndex
+
+
+def test_sequence_digest() -> None:
+    """It should hash nucleotides regardless of case, line breaks and chunking"""
+    digest = SequenceDigest.from_chunks(["ATGC\n", b"at gc", memoryview(b"NN")])
+    same = SequenceDigest.from_chunks(["atgcATGCnn"])
+
+    assert digest.hash == same.hash
+    assert digest.length == 10
+    assert digest.nucleic_counts == {"A": 2, "C": 2, "G": 2, "N": 2, "T": 2}
+
+
+def test_sequence_digest_file(tmp_path) -> None:
+    """It should skip FASTA headers and read gzip files"""
+    path = tmp_path / "record.fa.gz"
+    path.write_bytes(gzip.compress(b">record description\nATGC\nGG\n"))
+
+    digest = SequenceDigest.from_file(path=str(path), format="FASTA")
+
+    assert digest.hash == SequenceDigest.from_chunks(["ATGCGG"]).hash
+
+
+def test_sequence_index(tmp_path) -> None:
+    """It should find sequences by content, type, topology and NCBI id"""
+    digest = SequenceDigest.from_chunks(["ATGCGG"])
+
+    with SequenceIndex(path=str(tmp_path / "index.sqlite")) as index:
+        index.add(id="a", name="first", type="dna", circular=True, digest=digest)
+        index.add(id="b", name="plasmid", circular=False, ncbi="NC_000001")
+
+        assert [
+            record.id for record in index.find(digest=digest, type="DNA", circular=True)
+        ] == ["a"]
+        assert index.find(digest=digest, type="RNA", circular=True) == []
+        assert index.find(digest=digest, type="DNA", circular=False) == []
+        assert (
+            index.find(
+                digest=SequenceDigest.from_chunks(["ATGCGC"]), type="DNA", circular=True
+            )
+            == []
+        )
+        assert [
+            record.id for record in index.find_ncbi(ncbi_id="NC_000001", circular=False)
+        ] == ["b"]
+        assert index.find_ncbi(ncbi_id="NC_000001", circular=True) == []
+
+        index.remove(id="a")
+        assert index.find(digest=digest, type="DNA", circular=True) == []
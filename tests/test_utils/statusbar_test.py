@@ -0,0 +1,103 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from pandas import DataFrame, Series
+
+from DNA_analyser_IBP.batch_statuses import BatchStatus
+from DNA_analyser_IBP.interfaces.rloopr_interface import Rloopr
+from DNA_analyser_IBP.models import Batch
+from DNA_analyser_IBP.statusbar import multiple_status_bar
+from DNA_analyser_IBP.type import Types
+
+
+class FakeBatchPort:
+    """Batch port finishing every batch on second poll, failing 'bad' ids"""
+
+    def __init__(self):
+        self.polls: dict = dict()
+
+    def get_batch_status(self, *, id: str, type: str) -> Batch:
+        self.polls[id] = self.polls.get(id, 0) + 1
+        if id.startswith("bad"):
+            return Batch(status=BatchStatus.FAILED)
+        if self.polls[id] < 2:
+            return Batch(status=BatchStatus.RUNNING)
+        return Batch(status=BatchStatus.FINISH)
+
+
+def test_multiple_status_bar() -> None:
+    """It should submit all jobs and return their final statuses in input order"""
+    ports = SimpleNamespace(batch=FakeBatchPort())
+    jobs = [
+        (
+            f"sequence_{index}",
+            f"name_{index}",
+            lambda id=f"{prefix}{index}": SimpleNamespace(id=id),
+        )
+        for index, prefix in enumerate(["ok", "bad", "ok"])
+    ]
+    jobs.append(("sequence_3", "name_3", lambda: None))
+
+    result: DataFrame = multiple_status_bar(
+        ports=ports, jobs=jobs, type=Types.G4HUNTER, max_workers=4
+    )
+
+    assert list(result["sequence_id"]) == [f"sequence_{index}" for index in range(4)]
+    assert list(result["id"]) == ["ok0", "bad1", "ok2", None]
+    assert list(result["status"]) == [
+        BatchStatus.FINISH,
+        BatchStatus.FAILED,
+        BatchStatus.FINISH,
+        BatchStatus.FAILED,
+    ]
+    assert (result["elapsed"] >= 0).all()
+
+
+def test_multiple_status_bar_bounded() -> None:
+    """It should take jobs lazily with bounded number of submissions in flight"""
+    ports = SimpleNamespace(batch=FakeBatchPort())
+    state = {"taken": 0, "done": 0, "running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _create(id: str) -> SimpleNamespace:
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+            state["done"] += 1
+        return SimpleNamespace(id=id)
+
+    def _jobs():
+        for index in range(12):
+            # never more than max_workers taken jobs are unfinished
+            assert state["taken"] - state["done"] <= 3
+            state["taken"] += 1
+            yield None, f"name_{index}", lambda id=f"ok{index}": _create(id)
+
+    result: DataFrame = multiple_status_bar(
+        ports=ports, jobs=_jobs(), type=Types.SEQUENCE, max_workers=3
+    )
+
+    assert list(result["id"]) == [f"ok{index}" for index in range(12)]
+    assert state["peak"] <= 3
+
+
+def test_analyse_creator_series_max_workers() -> None:
+    """It should track single sequence Series concurrently when max_workers is set"""
+    ports = SimpleNamespace(
+        batch=FakeBatchPort(),
+        rloopr=SimpleNamespace(
+            create_analyse=lambda **kwargs: SimpleNamespace(id=f"ok_{kwargs['id']}")
+        ),
+    )
+    sequence = Series({"id": "sequence_0", "name": "name_0", "tags": "a, b"})
+
+    result: DataFrame = Rloopr(ports=ports).analyse_creator(
+        sequence=sequence, max_workers=2
+    )
+
+    assert list(result["sequence_id"]) == ["sequence_0"]
+    assert list(result["status"]) == [BatchStatus.FINISH]
@@ -1,6 +1,10 @@
+import gzip
+
 import pytest
 
+from DNA_analyser_IBP.config import Config
 from DNA_analyser_IBP.utils import (
+    _multifasta_parser,
     get_file_name,
     join_url,
     validate_email,
@@ -43,3 +47,37 @@ def test_join_url() -> None:
 
     url: str = join_url("test", "test", "test.csv")
     assert url == "api/test/test.csv"
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_multifasta_parser(tmp_path, monkeypatch, compressed: bool) -> None:
+    """It should parse records and long lines across blocks and read gzip"""
+    monkeypatch.setattr(Config.FASTA_CONFIG, "BLOCK_SIZE", 7)
+    content = (
+        b">first sequence\nATGC\nGG\n\n>second\r\nTTTT\r\nAAA\n>empty\n"
+        b">unwrapped\n" + b"ACGT" * 10 + b"\n>last\nCCC"
+    )
+    path = tmp_path / "multifasta.fa"
+    path.write_bytes(gzip.compress(content) if compressed else content)
+
+    records = list(_multifasta_parser(path=str(path)))
+
+    assert records == [
+        ("first sequence", "ATGCGG"),
+        ("second", "TTTTAAA"),
+        ("empty", ""),
+        ("unwrapped", "ACGT" * 10),
+        ("last", "CCC"),
+    ]
+
+
+def test_multifasta_parser_memoryview(tmp_path) -> None:
+    """It should yield sequences as memoryview"""
+    path = tmp_path / "multifasta.fa"
+    path.write_bytes(b">first\nATGC\nGG\n")
+
+    name, sequence = next(_multifasta_parser(path=str(path), as_memoryview=True))
+
+    assert name == "first"
+    assert isinstance(sequence, memoryview)
+    assert sequence.tobytes() == b"ATGCGG"
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from DNA_analyser_IBP.engines import (
+    encode_dinucleotides,
+    find_zdna,
+    sweep_zdna,
+    zdna_parameters,
+)
+
+ZDNA: str = "CGCGCGCGCGCGCGCG"
+SEQUENCE: str = "AAAAAAAAAA" + ZDNA + "AAAAAAAAAA" + "CACACACACACA" + "AAAAAAAAAA"
+SCORES: dict = {"GC": 25, "CG": 25, "GT": 3, "TG": 3, "AC": 3, "CA": 3}
+
+
+def _naive_zdna(sequence: str, window: int, percentage: float) -> list:
+    """Window starts with dinucleotide score above percentage of max score"""
+    steps = [SCORES.get(sequence[i : i + 2], 0) for i in range(len(sequence) - 1)]
+    return [
+        start
+        for start in range(len(sequence) - window + 1)
+        if sum(steps[start : start + window - 1]) >= percentage / 100 * 25 * (window - 1)
+    ]
+
+
+def test_zdna_parameters() -> None:
+    """It should take model defaults and keep explicit scores"""
+    assert zdna_parameters(model="2")["GC_score"] == 2
+    assert zdna_parameters(model=["model2"], GC_score=10) == {
+        "GC_score": 10,
+        "GTAC_score": 1,
+        "AT_score": 0.5,
+        "oth_score": 0,
+        "min_score_percentage": 50,
+    }
+    with pytest.raises(ValueError):
+        zdna_parameters(model="model3")
+
+
+def test_encode_dinucleotides() -> None:
+    """It should classify alternating purine pyrimidine steps"""
+    assert encode_dinucleotides("gCgTaAN").tolist() == [0, 0, 1, 2, 3, 3]
+
+
+def test_find_zdna() -> None:
+    """It should merge overlapping windows matching naive search"""
+    results = find_zdna(sequence=SEQUENCE, model="model1", min_score_percentage=50)
+    hits = _naive_zdna(SEQUENCE, 10, 50)
+
+    assert list(results.columns) == ["position", "length", "score", "sequence"]
+    assert len(results) == 1
+    assert results["position"].iloc[0] == min(hits)
+    assert results["position"].iloc[0] + results["length"].iloc[0] == max(hits) + 10
+    assert ZDNA in results["sequence"].iloc[0]
+    region = results["sequence"].iloc[0]
+    assert results["score"].iloc[0] == sum(
+        SCORES.get(region[i : i + 2], 0) for i in range(len(region) - 1)
+    )
+    # low default model1 threshold finds CA repeat too
+    assert len(find_zdna(sequence=SEQUENCE)) == 2
+    empty = find_zdna(sequence="A" * 50)
+    assert empty.empty
+    assert empty.dtypes.equals(results.dtypes)
+    with pytest.raises(ValueError):
+        find_zdna(sequence=SEQUENCE, min_sequence_size=4)
+
+
+def test_sweep_zdna() -> None:
+    """It should score every parameter set of grid like find_zdna"""
+    grid = [
+        {"model": "model1", "min_score_percentage": percentage}
+        for percentage in np.arange(12, 100, 20)
+    ]
+    results = sweep_zdna(sequence=SEQUENCE, grid=grid)
+
+    for parameters in grid:
+        expected = find_zdna(sequence=SEQUENCE, **parameters)
+        found = results[
+            results["min_score_percentage"] == parameters["min_score_percentage"]
+        ]
+        assert found["position"].tolist() == expected["position"].tolist()
+        assert found["score"].tolist() == expected["score"].tolist()